@@ -5,11 +5,19 @@ Automated buy-low/sell-high within a price range
 
 import sys
 import time
+import asyncio
+import logging
+import functools
+from array import array
+from operator import itemgetter
 from typing import Optional, List, Dict, Tuple
 from datetime import datetime
+import numpy as np
+from tabulate import tabulate
 
-from src.utils.client import get_client
+from src.utils.client import get_client, run_async, BinanceFuturesAsyncClient, BATCH_ORDER_LIMIT
 from src.utils.logger import setup_logger, log_trade, log_error
+from src.utils.streams import UserDataStream
 from src.utils.validators import (
     validate_symbol, validate_quantity, validate_price_range,
     validate_positive_integer
@@ -17,6 +25,64 @@ from src.utils.validators import (
 
 logger = setup_logger("GridTrading")
 
+# Binance Futures allows 10 orders per second per account
+MAX_ORDERS_PER_SECOND = 10
+
+DIVIDER = "=" * 60
+
+_get_order_id = itemgetter('orderId')
+
+
+@functools.lru_cache(maxsize=64)
+def _grid_levels(lower_price: float, upper_price: float, num_grids: int) -> np.ndarray:
+    """Evenly spaced grid levels, memoized and read-only so they can be shared"""
+    levels = np.linspace(lower_price, upper_price, num_grids)
+    levels.flags.writeable = False
+    return levels
+
+
+class GridBook:
+    """
+    Open orders for one grid side stored as parallel scalar arrays
+    
+    Only the order ID and limit price are kept, instead of the full Binance
+    order payload, so long-running grids do not accumulate response dicts.
+    """
+    
+    __slots__ = ('ids', 'prices', '_index')
+    
+    def __init__(self):
+        self.ids = array('q')
+        self.prices = array('d')
+        self._index: Dict[int, int] = {}  # order ID -> array position
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def keys(self):
+        """Set-like view of the tracked order IDs"""
+        return self._index.keys()
+    
+    def add(self, order_id: int, price: float):
+        """Track a new open order"""
+        self._index[order_id] = len(self.ids)
+        self.ids.append(order_id)
+        self.prices.append(price)
+    
+    def pop(self, order_id: int) -> float:
+        """Stop tracking an order and return its price (swap-and-pop, O(1))"""
+        pos = self._index.pop(order_id)
+        price = self.prices[pos]
+        last_id = self.ids.pop()
+        last_price = self.prices.pop()
+        
+        if pos < len(self.ids):
+            self.ids[pos] = last_id
+            self.prices[pos] = last_price
+            self._index[last_id] = pos
+        
+        return price
+
 
 class GridTradingBot:
     """Automated grid trading bot"""
@@ -29,8 +95,7 @@ class GridTradingBot:
             testnet: Use testnet if True
         """
         self.client = get_client(testnet)
-        self.active_grids = []
-        self.grid_orders = []
+        self.active_grids: Dict[str, Dict] = {}  # symbol -> grid config
         logger.info("Grid Trading Bot initialized")
     
     def create_grid(
@@ -42,6 +107,32 @@ class GridTradingBot:
         quantity_per_grid: float,
         initial_investment: float = None,
         auto_rebalance: bool = True
+    ) -> Optional[Dict]:
+        """
+        Create a grid trading setup (blocking wrapper around acreate_grid)
+        
+        Returns:
+            Grid configuration dictionary or None
+        """
+        return run_async(self.acreate_grid(
+            symbol=symbol,
+            lower_price=lower_price,
+            upper_price=upper_price,
+            num_grids=num_grids,
+            quantity_per_grid=quantity_per_grid,
+            initial_investment=initial_investment,
+            auto_rebalance=auto_rebalance
+        ))
+    
+    async def acreate_grid(
+        self,
+        symbol: str,
+        lower_price: float,
+        upper_price: float,
+        num_grids: int,
+        quantity_per_grid: float,
+        initial_investment: float = None,
+        auto_rebalance: bool = True
     ) -> Optional[Dict]:
         """
         Create a grid trading setup
@@ -79,34 +170,39 @@ class GridTradingBot:
             if num_grids > 50:
                 raise ValueError("Number of grids limited to 50")
             
-            logger.info("="*60)
-            logger.info("📊 GRID TRADING SETUP")
-            logger.info("="*60)
-            logger.info(f"Symbol: {symbol}")
-            logger.info(f"Current Price: {current_price}")
-            logger.info(f"Price Range: {lower_price} - {upper_price}")
-            logger.info(f"Number of Grids: {num_grids}")
-            logger.info(f"Quantity per Grid: {quantity_per_grid}")
-            logger.info("="*60 + "\n")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(DIVIDER)
+                logger.info("📊 GRID TRADING SETUP")
+                logger.info(DIVIDER)
+                logger.info("Symbol: %s", symbol)
+                logger.info("Current Price: %s", current_price)
+                logger.info("Price Range: %s - %s", lower_price, upper_price)
+                logger.info("Number of Grids: %s", num_grids)
+                logger.info("Quantity per Grid: %s", quantity_per_grid)
+                logger.info(DIVIDER + "\n")
             
             # Calculate grid levels
             grid_levels = self._calculate_grid_levels(
                 lower_price, upper_price, num_grids
             )
             
-            logger.info(f"Grid levels: {[f'{p:.2f}' for p in grid_levels]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Grid levels: %s", [f'{p:.2f}' for p in grid_levels])
+            
+            # Levels below split_idx are BUY levels, the rest are SELL levels
+            split_idx = int(np.searchsorted(grid_levels, current_price, side='left'))
             
             # Calculate required capital
             if initial_investment is None:
                 initial_investment = self._calculate_required_capital(
-                    grid_levels, quantity_per_grid, current_price
+                    grid_levels, split_idx, quantity_per_grid, current_price
                 )
-                logger.info(f"Estimated capital required: {initial_investment:.2f} USDT")
+                logger.info("Estimated capital required: %.2f USDT", initial_investment)
             
             # Place initial grid orders
             logger.info("\nPlacing initial grid orders...")
-            buy_orders, sell_orders = self._place_initial_orders(
-                symbol, grid_levels, quantity_per_grid, current_price
+            buy_orders, sell_orders = await self._place_initial_orders(
+                symbol, grid_levels, split_idx, quantity_per_grid, current_price
             )
             
             # Create grid configuration
@@ -117,6 +213,7 @@ class GridTradingBot:
                 'num_grids': num_grids,
                 'quantity_per_grid': quantity_per_grid,
                 'grid_levels': grid_levels,
+                'split_idx': split_idx,
                 'current_price': current_price,
                 'buy_orders': buy_orders,
                 'sell_orders': sell_orders,
@@ -126,7 +223,7 @@ class GridTradingBot:
                 'trades_executed': 0
             }
             
-            self.active_grids.append(grid_config)
+            self.active_grids[symbol] = grid_config
             
             # Display grid summary
             self._display_grid_summary(grid_config)
@@ -144,249 +241,424 @@ class GridTradingBot:
         lower_price: float, 
         upper_price: float, 
         num_grids: int
-    ) -> List[float]:
-        """Calculate grid price levels"""
-        step = (upper_price - lower_price) / (num_grids - 1)
-        levels = [lower_price + (step * i) for i in range(num_grids)]
-        return levels
+    ) -> np.ndarray:
+        """Calculate evenly spaced, ascending grid price levels"""
+        return _grid_levels(float(lower_price), float(upper_price), int(num_grids))
     
     def _calculate_required_capital(
         self,
-        grid_levels: List[float],
+        grid_levels: np.ndarray,
+        split_idx: int,
         quantity_per_grid: float,
         current_price: float
     ) -> float:
         """Estimate required capital for grid"""
-        # Calculate capital needed for buy orders below current price
-        buy_levels = [p for p in grid_levels if p < current_price]
-        buy_capital = sum(p * quantity_per_grid for p in buy_levels)
+        # Capital for buy orders below current price
+        buy_capital = grid_levels[:split_idx].sum() * quantity_per_grid
         
-        # Calculate capital needed to hold inventory for sell orders
-        sell_levels = [p for p in grid_levels if p >= current_price]
-        sell_capital = len(sell_levels) * quantity_per_grid * current_price
+        # Capital to hold inventory for sell orders
+        sell_capital = (len(grid_levels) - split_idx) * quantity_per_grid * current_price
         
-        total_capital = buy_capital + sell_capital
+        total_capital = float(buy_capital + sell_capital)
         
         # Add 20% buffer
         return total_capital * 1.2
     
-    def _place_initial_orders(
+    async def _place_initial_orders(
         self,
         symbol: str,
-        grid_levels: List[float],
+        grid_levels: np.ndarray,
+        split_idx: int,
         quantity: float,
         current_price: float
-    ) -> Tuple[List[Dict], List[Dict]]:
-        """Place initial buy and sell orders"""
-        from src.core.limit_orders import LimitOrderExecutor
-        
-        executor = LimitOrderExecutor(testnet=self.client.testnet)
-        buy_orders = []
-        sell_orders = []
-        
-        for level in grid_levels:
-            try:
-                if level < current_price:
-                    # Place buy order
-                    logger.info(f"Placing BUY order at {level}")
-                    order = executor.execute_limit_order(
-                        symbol=symbol,
-                        side='BUY',
-                        quantity=quantity,
-                        price=level,
-                        post_only=True  # Ensure maker order
+    ) -> Tuple[GridBook, GridBook]:
+        """Place initial buy and sell orders in concurrent batchOrders requests"""
+        buy_levels = grid_levels[:split_idx].tolist()
+        sell_levels = [
+            level for level in grid_levels[split_idx:].tolist()
+            if level != current_price
+        ]
+        
+        orders = [
+            self._grid_order(symbol, side, quantity, level)
+            for side, levels in (('BUY', buy_levels), ('SELL', sell_levels))
+            for level in levels
+        ]
+        
+        batches = [
+            orders[i:i + BATCH_ORDER_LIMIT]
+            for i in range(0, len(orders), BATCH_ORDER_LIMIT)
+        ]
+        rate_limiter = asyncio.Semaphore(
+            max(1, MAX_ORDERS_PER_SECOND // BATCH_ORDER_LIMIT)
+        )
+        
+        results = await asyncio.gather(
+            *[self._place_batch(rate_limiter, batch) for batch in batches],
+            return_exceptions=True
+        )
+        
+        buy_orders = GridBook()
+        sell_orders = GridBook()
+        
+        for batch, responses in zip(batches, results):
+            if isinstance(responses, Exception):
+                log_error(logger, responses, "Failed to place grid batch")
+                continue
+            
+            for params, order in zip(batch, responses):
+                if 'code' in order:
+                    logger.error(
+                        f"Failed to place {params['side']} order at {params['price']}: "
+                        f"{order.get('msg')} (Code: {order.get('code')})"
                     )
-                    if order:
-                        buy_orders.append(order)
-                        time.sleep(0.2)  # Rate limiting
+                    continue
                 
-                elif level > current_price:
-                    # Place sell order
-                    logger.info(f"Placing SELL order at {level}")
-                    order = executor.execute_limit_order(
-                        symbol=symbol,
-                        side='SELL',
-                        quantity=quantity,
-                        price=level,
-                        post_only=True
-                    )
-                    if order:
-                        sell_orders.append(order)
-                        time.sleep(0.2)
+                log_trade(
+                    logger,
+                    order_type='LIMIT',
+                    symbol=symbol,
+                    side=params['side'],
+                    quantity=quantity,
+                    price=params['price'],
+                    order_id=order.get('orderId'),
+                    status=order.get('status'),
+                    time_in_force='GTX'
+                )
                 
-            except Exception as e:
-                log_error(logger, e, f"Failed to place order at {level}")
+                book = buy_orders if params['side'] == 'BUY' else sell_orders
+                book.add(order['orderId'], params['price'])
         
-        logger.info(f"\n✓ Placed {len(buy_orders)} BUY orders")
-        logger.info(f"✓ Placed {len(sell_orders)} SELL orders")
+        logger.info("\n✓ Placed %d BUY orders", len(buy_orders))
+        logger.info("✓ Placed %d SELL orders", len(sell_orders))
         
         return buy_orders, sell_orders
     
+    def _grid_order(self, symbol: str, side: str, quantity: float, price: float) -> Dict:
+        """Build batchOrders parameters for one post-only grid order"""
+        return {
+            'symbol': symbol,
+            'side': side,
+            'type': 'LIMIT',
+            'quantity': quantity,
+            'price': price,
+            'timeInForce': 'GTX',  # Ensure maker order
+            'positionSide': 'BOTH',
+        }
+    
+    async def _place_batch(
+        self,
+        rate_limiter: asyncio.Semaphore,
+        batch: List[Dict]
+    ) -> List[Dict]:
+        """Submit one batchOrders request, holding a rate-limit slot for one second"""
+        async with rate_limiter:
+            started = time.monotonic()
+            if logger.isEnabledFor(logging.DEBUG):
+                levels = ', '.join(f"{o['side']} @ {o['price']}" for o in batch)
+                logger.debug("Placing batch: %s", levels)
+            
+            loop = asyncio.get_running_loop()
+            responses = await loop.run_in_executor(
+                None, self.client.place_batch_orders, batch
+            )
+            
+            # Keep the slot until the one-second window has passed
+            remaining = 1.0 - (time.monotonic() - started)
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+            
+            return responses
+    
     def monitor_grid(
         self, 
         symbol: str, 
         check_interval: int = 10,
-        max_runtime_hours: float = None
+        max_runtime_hours: float = None,
+        use_websocket: bool = True,
+        verbose: bool = False
     ):
         """
-        Monitor and maintain grid trading
+        Monitor and maintain grid trading (blocking wrapper around amonitor_grid)
         
         Args:
             symbol: Trading pair to monitor
             check_interval: Check interval in seconds
             max_runtime_hours: Maximum runtime in hours (None for infinite)
+            use_websocket: Listen for fills on the user-data stream if True
+            verbose: Print the full status block every iteration if True
         """
         try:
-            symbol = validate_symbol(symbol)
-            
-            # Find active grid for this symbol
-            grid_config = None
-            for grid in self.active_grids:
-                if grid['symbol'] == symbol:
-                    grid_config = grid
-                    break
+            run_async(self.amonitor_grid(
+                symbols=[symbol],
+                check_interval=check_interval,
+                max_runtime_hours=max_runtime_hours,
+                use_websocket=use_websocket,
+                verbose=verbose
+            ))
+        
+        except KeyboardInterrupt:
+            logger.info("\n⚠️  Grid monitoring stopped by user")
+            grid_config = self.active_grids.get(symbol.upper().strip())
+            if grid_config:
+                self._display_final_stats(grid_config)
+    
+    async def amonitor_grid(
+        self,
+        symbols: List[str] = None,
+        check_interval: int = 10,
+        max_runtime_hours: float = None,
+        use_websocket: bool = True,
+        verbose: bool = False
+    ):
+        """
+        Monitor and maintain several grids concurrently on one event loop
+        
+        Fills are pushed over the user-data websocket; REST polling of open
+        orders is used only if the stream is disabled or fails to start.
+        Once the stream is subscribed, open orders are swept over REST once so
+        levels that filled before the subscription are still rebalanced.
+        
+        Args:
+            symbols: Trading pairs to monitor (all active grids if None)
+            check_interval: Check interval in seconds
+            max_runtime_hours: Maximum runtime in hours (None for infinite)
+            use_websocket: Listen for fills on the user-data stream if True
+            verbose: Print the full status block every iteration if True
+        """
+        stream = None
+        async_client = None
+        
+        try:
+            if symbols is None:
+                symbols = list(self.active_grids)
             
-            if not grid_config:
-                logger.error(f"No active grid found for {symbol}")
+            grids = []
+            for symbol in symbols:
+                symbol = validate_symbol(symbol)
+                
+                # Find active grid for this symbol
+                grid_config = self.active_grids.get(symbol)
+                if grid_config:
+                    grids.append(grid_config)
+                else:
+                    logger.error(f"No active grid found for {symbol}")
+            
+            if not grids:
                 return
             
-            logger.info("="*60)
-            logger.info("🤖 GRID MONITORING STARTED")
-            logger.info("="*60)
-            logger.info(f"Symbol: {symbol}")
-            logger.info(f"Check Interval: {check_interval}s")
-            if max_runtime_hours:
-                logger.info(f"Max Runtime: {max_runtime_hours} hours")
-            logger.info("Press Ctrl+C to stop")
-            logger.info("="*60 + "\n")
-            
-            start_time = datetime.now()
+            if use_websocket:
+                stream = UserDataStream(self.client)
+                if not stream.start():
+                    logger.warning("Falling back to REST polling of open orders")
+                    stream = None
+            
+            async_client = await BinanceFuturesAsyncClient.create(self.client.testnet)
+            
+            if stream:
+                # Fills between placement and subscription never reach the
+                # stream; reconcile them once now that new fills are queued
+                await asyncio.gather(
+                    *[self._poll_and_rebalance(async_client, g) for g in grids]
+                )
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(DIVIDER)
+                logger.info("🤖 GRID MONITORING STARTED")
+                logger.info(DIVIDER)
+                logger.info("Symbols: %s", ', '.join(g['symbol'] for g in grids))
+                logger.info("Mode: %s", 'WebSocket' if stream else 'REST polling')
+                logger.info("Check Interval: %ss", check_interval)
+                if max_runtime_hours:
+                    logger.info("Max Runtime: %s hours", max_runtime_hours)
+                logger.info("Press Ctrl+C to stop")
+                logger.info(DIVIDER + "\n")
+            
+            loop = asyncio.get_running_loop()
+            start_time = time.monotonic()
+            max_seconds = max_runtime_hours * 3600 if max_runtime_hours else None
             iteration = 0
             
             while True:
                 iteration += 1
-                logger.info(f"[Iteration {iteration}] Checking grid status...")
+                logger.debug("[Iteration %d] Checking grid status...", iteration)
                 
                 # Check if max runtime exceeded
-                if max_runtime_hours:
-                    elapsed_hours = (datetime.now() - start_time).total_seconds() / 3600
-                    if elapsed_hours >= max_runtime_hours:
-                        logger.info(f"Max runtime of {max_runtime_hours} hours reached")
-                        break
-                
-                # Get current open orders
-                open_orders = self.client.get_open_orders(symbol)
-                open_order_ids = {o['orderId'] for o in open_orders}
+                if max_seconds and time.monotonic() - start_time >= max_seconds:
+                    logger.info("Max runtime of %s hours reached", max_runtime_hours)
+                    break
                 
-                # Check for filled orders and rebalance
-                self._check_and_rebalance(grid_config, open_order_ids)
+                if stream:
+                    # Block until fills arrive (or the interval elapses)
+                    updates = await loop.run_in_executor(
+                        None, stream.get_order_updates, check_interval
+                    )
+                    await asyncio.gather(
+                        *[self._rebalance_from_updates(g, updates) for g in grids]
+                    )
+                else:
+                    await asyncio.gather(
+                        *[self._poll_and_rebalance(async_client, g) for g in grids]
+                    )
                 
                 # Display status
-                self._display_grid_status(grid_config)
+                if verbose:
+                    self._display_grid_status(grids)
+                elif logger.isEnabledFor(logging.INFO):
+                    for grid_config in grids:
+                        logger.info(
+                            "%s: %d BUY / %d SELL open, %d trades, %.2f USDT profit",
+                            grid_config['symbol'],
+                            len(grid_config['buy_orders']),
+                            len(grid_config['sell_orders']),
+                            grid_config['trades_executed'],
+                            grid_config['total_profit']
+                        )
                 
-                # Wait before next check
-                time.sleep(check_interval)
+                # Wait before next check (the stream already waited for updates)
+                if not stream:
+                    await asyncio.sleep(check_interval)
             
             logger.info("Grid monitoring stopped")
             
-        except KeyboardInterrupt:
-            logger.info("\n⚠️  Grid monitoring stopped by user")
-            self._display_final_stats(grid_config)
-            
         except Exception as e:
             log_error(logger, e, "Grid monitoring failed")
+        
+        finally:
+            if stream:
+                stream.stop()
+            if async_client:
+                await async_client.close()
+    
+    async def _poll_and_rebalance(
+        self,
+        async_client: BinanceFuturesAsyncClient,
+        grid_config: Dict
+    ):
+        """Poll open orders for one grid and rebalance filled levels"""
+        # Get current open orders
+        open_orders = await async_client.get_open_orders(grid_config['symbol'])
+        if open_orders is None:
+            return  # Request failed; an empty book would look like every level filled
+        open_order_ids = set(map(_get_order_id, open_orders))
+        
+        # Check for filled orders and rebalance
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, self._check_and_rebalance, grid_config, open_order_ids
+        )
+    
+    async def _rebalance_from_updates(self, grid_config: Dict, updates: List[Dict]):
+        """Rebalance one grid from order updates pushed by the user-data stream"""
+        symbol = grid_config['symbol']
+        filled_ids = {
+            o['i'] for o in updates
+            if o['s'] == symbol and o['X'] == 'FILLED'
+        }
+        
+        if not filled_ids:
+            return
+        
+        tracked_ids = (
+            grid_config['buy_orders'].keys() | grid_config['sell_orders'].keys()
+        )
+        
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, self._check_and_rebalance, grid_config, tracked_ids - filled_ids
+        )
     
     def _check_and_rebalance(self, grid_config: Dict, open_order_ids: set):
         """Check for filled orders and place new opposite orders"""
-        from src.core.limit_orders import LimitOrderExecutor
-        
         if not grid_config.get('auto_rebalance'):
             return
         
-        executor = LimitOrderExecutor(testnet=self.client.testnet)
         symbol = grid_config['symbol']
         quantity = grid_config['quantity_per_grid']
         grid_levels = grid_config['grid_levels']
         
+        buy_orders = grid_config['buy_orders']
+        sell_orders = grid_config['sell_orders']
+        
+        # Tracked orders no longer open were filled (computed before placing new ones)
+        filled_buy_ids = list(buy_orders.keys() - open_order_ids)
+        filled_sell_ids = list(sell_orders.keys() - open_order_ids)
+        
+        # Opposite orders for every fill in this tick: (params, book, profit)
+        pending = []
+        
         # Check buy orders
-        for order in grid_config['buy_orders'][:]:
-            order_id = order['orderId']
-            
-            if order_id not in open_order_ids:
-                # Order was filled
-                filled_price = float(order['price'])
-                logger.info(f"✓ BUY order filled at {filled_price}")
-                
-                # Find next higher grid level for sell order
-                next_sell_level = None
-                for level in grid_levels:
-                    if level > filled_price:
-                        next_sell_level = level
-                        break
-                
-                if next_sell_level:
-                    logger.info(f"Placing SELL order at {next_sell_level}")
-                    new_order = executor.execute_limit_order(
-                        symbol=symbol,
-                        side='SELL',
-                        quantity=quantity,
-                        price=next_sell_level,
-                        post_only=True
-                    )
-                    
-                    if new_order:
-                        grid_config['sell_orders'].append(new_order)
-                        
-                        # Calculate profit
-                        profit = (next_sell_level - filled_price) * quantity
-                        grid_config['total_profit'] += profit
-                        grid_config['trades_executed'] += 1
-                        
-                        logger.info(f"💰 Estimated profit: {profit:.2f} USDT")
-                
-                # Remove filled order from tracking
-                grid_config['buy_orders'].remove(order)
+        for order_id in filled_buy_ids:
+            # Remove filled order from tracking
+            filled_price = buy_orders.pop(order_id)
+            logger.info("✓ BUY order filled at %s", filled_price)
+            
+            # Find next higher grid level for sell order (levels are sorted)
+            idx = int(np.searchsorted(grid_levels, filled_price, side='right'))
+            if idx < len(grid_levels):
+                next_sell_level = float(grid_levels[idx])
+                profit = (next_sell_level - filled_price) * quantity
+                pending.append((
+                    self._grid_order(symbol, 'SELL', quantity, next_sell_level),
+                    sell_orders,
+                    profit
+                ))
         
         # Check sell orders
-        for order in grid_config['sell_orders'][:]:
-            order_id = order['orderId']
+        for order_id in filled_sell_ids:
+            # Remove filled order from tracking
+            filled_price = sell_orders.pop(order_id)
+            logger.info("✓ SELL order filled at %s", filled_price)
+            
+            # Find next lower grid level for buy order (levels are sorted)
+            idx = int(np.searchsorted(grid_levels, filled_price, side='left')) - 1
+            if idx >= 0:
+                next_buy_level = float(grid_levels[idx])
+                pending.append((
+                    self._grid_order(symbol, 'BUY', quantity, next_buy_level),
+                    buy_orders,
+                    0.0
+                ))
+        
+        if not pending:
+            return
+        
+        # One batchOrders request per BATCH_ORDER_LIMIT new orders
+        logger.info("Placing %d opposite order(s)", len(pending))
+        responses = self.client.place_batch_orders([params for params, _, _ in pending])
+        
+        for (params, book, profit), order in zip(pending, responses):
+            if 'code' in order:
+                logger.error(
+                    f"Failed to place {params['side']} order at {params['price']}: "
+                    f"{order.get('msg')} (Code: {order.get('code')})"
+                )
+                continue
             
-            if order_id not in open_order_ids:
-                # Order was filled
-                filled_price = float(order['price'])
-                logger.info(f"✓ SELL order filled at {filled_price}")
-                
-                # Find next lower grid level for buy order
-                next_buy_level = None
-                for level in reversed(grid_levels):
-                    if level < filled_price:
-                        next_buy_level = level
-                        break
-                
-                if next_buy_level:
-                    logger.info(f"Placing BUY order at {next_buy_level}")
-                    new_order = executor.execute_limit_order(
-                        symbol=symbol,
-                        side='BUY',
-                        quantity=quantity,
-                        price=next_buy_level,
-                        post_only=True
-                    )
-                    
-                    if new_order:
-                        grid_config['buy_orders'].append(new_order)
-                        grid_config['trades_executed'] += 1
-                
-                # Remove filled order from tracking
-                grid_config['sell_orders'].remove(order)
+            log_trade(
+                logger,
+                order_type='LIMIT',
+                symbol=symbol,
+                side=params['side'],
+                quantity=quantity,
+                price=params['price'],
+                order_id=order.get('orderId'),
+                status=order.get('status'),
+                time_in_force='GTX'
+            )
+            
+            book.add(order['orderId'], params['price'])
+            grid_config['trades_executed'] += 1
+            
+            if profit:
+                grid_config['total_profit'] += profit
+                logger.info("💰 Estimated profit: %.2f USDT", profit)
     
     def _display_grid_summary(self, grid_config: Dict):
         """Display grid configuration summary"""
-        from tabulate import tabulate
-        
-        print("\n" + "="*60)
+        print("\n" + DIVIDER)
         print("📊 GRID CONFIGURATION")
-        print("="*60)
+        print(DIVIDER)
         
         config_data = [
             ["Symbol", grid_config['symbol']],
@@ -400,26 +672,33 @@ class GridTradingBot:
         ]
         
         print(tabulate(config_data, tablefmt="simple"))
-        print("="*60 + "\n")
+        print(DIVIDER + "\n")
     
-    def _display_grid_status(self, grid_config: Dict):
-        """Display current grid status"""
-        print(f"\n--- Grid Status ({datetime.now().strftime('%H:%M:%S')}) ---")
-        print(f"Active BUY orders: {len(grid_config['buy_orders'])}")
-        print(f"Active SELL orders: {len(grid_config['sell_orders'])}")
-        print(f"Total trades: {grid_config['trades_executed']}")
-        print(f"Estimated profit: {grid_config['total_profit']:.2f} USDT")
-        print("-" * 40)
+    def _display_grid_status(self, grids: List[Dict]):
+        """Display current status of each grid in a single stdout write"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        lines = []
+        
+        for grid_config in grids:
+            lines.append(
+                f"\n--- {grid_config['symbol']} Grid Status ({timestamp}) ---\n"
+                f"Active BUY orders: {len(grid_config['buy_orders'])}\n"
+                f"Active SELL orders: {len(grid_config['sell_orders'])}\n"
+                f"Total trades: {grid_config['trades_executed']}\n"
+                f"Estimated profit: {grid_config['total_profit']:.2f} USDT\n"
+                + "-" * 40 + "\n"
+            )
+        
+        sys.stdout.write(''.join(lines))
+        sys.stdout.flush()
     
     def _display_final_stats(self, grid_config: Dict):
         """Display final statistics"""
-        from tabulate import tabulate
-        
         runtime = datetime.now() - grid_config['created_at']
         
-        print("\n" + "="*60)
+        print("\n" + DIVIDER)
         print("📈 GRID TRADING FINAL STATISTICS")
-        print("="*60)
+        print(DIVIDER)
         
         stats = [
             ["Total Runtime", str(runtime).split('.')[0]],
@@ -430,7 +709,7 @@ class GridTradingBot:
         ]
         
         print(tabulate(stats, tablefmt="simple"))
-        print("="*60 + "\n")
+        print(DIVIDER + "\n")
     
     def stop_grid(self, symbol: str) -> bool:
         """
@@ -451,7 +730,7 @@ class GridTradingBot:
             result = self.client.cancel_all_orders(symbol)
             
             # Remove from active grids
-            self.active_grids = [g for g in self.active_grids if g['symbol'] != symbol]
+            self.active_grids.pop(symbol, None)
             
             logger.info("✓ Grid stopped and all orders cancelled")
             return True
@@ -469,8 +748,10 @@ def main():
         print("   python src/advanced/grid.py create <SYMBOL> <LOWER> <UPPER> <GRIDS> <QTY>")
         print("   Example: python src/advanced/grid.py create BTCUSDT 90000 100000 10 0.001")
         print("\n2. Monitor Grid:")
-        print("   python src/advanced/grid.py monitor <SYMBOL> [--interval SECONDS]")
+        print("   python src/advanced/grid.py monitor <SYMBOL> [--interval SECONDS] [--poll] [--verbose]")
         print("   Example: python src/advanced/grid.py monitor BTCUSDT --interval 30")
+        print("   (--poll uses REST polling instead of the user-data websocket)")
+        print("   (--verbose prints the full grid status block every iteration)")
         print("\n3. Stop Grid:")
         print("   python src/advanced/grid.py stop <SYMBOL>")
         print("   Example: python src/advanced/grid.py stop BTCUSDT")
@@ -520,7 +801,12 @@ def main():
                 if idx + 1 < len(sys.argv):
                     interval = int(sys.argv[idx + 1])
             
-            bot.monitor_grid(symbol, check_interval=interval)
+            bot.monitor_grid(
+                symbol,
+                check_interval=interval,
+                use_websocket='--poll' not in sys.argv,
+                verbose='--verbose' in sys.argv
+            )
             
         elif command == "stop":
             if len(sys.argv) < 3:
@@ -4,22 +4,57 @@ Place take-profit and stop-loss orders simultaneously
 """
 
 import sys
+import asyncio
+import logging
 from typing import Optional, Dict, List
-from binance.exceptions import BinanceAPIException
 import time
+from dataclasses import dataclass
+from functools import partial
 
-from src.utils.client import get_client
+from src.utils.client import get_client, run_async, BinanceFuturesAsyncClient
 from src.utils.logger import setup_logger, log_trade, log_error
+from src.utils.streams import UserDataStream
 from src.utils.validators import (
     validate_symbol, validate_side, validate_quantity, validate_price
 )
 
 logger = setup_logger("OCOOrders")
 
+# Order statuses after which a leg can no longer fill
+TERMINAL_STATUSES = {'FILLED', 'CANCELED', 'EXPIRED', 'REJECTED'}
+
+# Adaptive REST polling: most legs fill soon after placement, so young groups
+# are polled fast (HOT), then WARM, then at check_interval (COLD)
+POLL_HOT_SECONDS = 3
+POLL_HOT_INTERVAL = 0.3
+POLL_WARM_SECONDS = 30
+POLL_WARM_INTERVAL = 1.0
+
+# Cached prices younger than this are used inline for the TP/SL sanity check
+PRICE_CHECK_MAX_AGE = 0.5
+
+DIVIDER = "=" * 60
+SUMMARY_HEADERS = ("Type", "Order ID", "Price", "Status")
+
+
+@dataclass
+class OCOGroup:
+    """Take-profit/stop-loss order pair where one leg cancels the other"""
+    
+    __slots__ = ('id', 'symbol', 'tp_order_id', 'sl_order_id', 'placed_at')
+    
+    id: int
+    symbol: str
+    tp_order_id: int
+    sl_order_id: int
+    placed_at: float  # time.monotonic() at placement
+
 
 class OCOOrderExecutor:
     """Execute OCO (One-Cancels-the-Other) orders"""
     
+    __slots__ = ('client', 'groups_by_symbol', 'oco_by_order_id', '_next_group_id')
+    
     def __init__(self, testnet: bool = None):
         """
         Initialize OCO order executor
@@ -28,7 +63,9 @@ class OCOOrderExecutor:
             testnet: Use testnet if True
         """
         self.client = get_client(testnet)
-        self.active_oco_groups = []  # Track OCO groups
+        self.groups_by_symbol: Dict[str, Dict[int, OCOGroup]] = {}  # symbol -> {group ID -> OCO group}
+        self.oco_by_order_id: Dict[int, OCOGroup] = {}  # TP/SL order ID -> OCO group
+        self._next_group_id = 0
         logger.info("OCO Order Executor initialized")
     
     def execute_oco_order(
@@ -40,7 +77,8 @@ class OCOOrderExecutor:
         stop_loss_price: float,
         stop_limit_price: float = None,
         reduce_only: bool = True,
-        position_side: str = "BOTH"
+        position_side: str = "BOTH",
+        current_price: float = None
     ) -> Optional[Dict]:
         """
         Execute OCO order with take-profit and stop-loss
@@ -57,6 +95,7 @@ class OCOOrderExecutor:
             stop_limit_price: Stop limit price (defaults to stop_loss_price if None)
             reduce_only: If True, orders will only reduce position
             position_side: BOTH, LONG, or SHORT
+            current_price: Known market price for the sanity check (looked up if None)
         
         Returns:
             Dictionary with take_profit and stop_loss order responses
@@ -74,30 +113,18 @@ class OCOOrderExecutor:
             else:
                 stop_limit_price = validate_price(stop_limit_price, symbol)
             
-            logger.info(f"Placing OCO orders: {side} {quantity} {symbol}")
-            logger.info(f"Take Profit: {take_profit_price} | Stop Loss: {stop_loss_price}")
+            logger.info("Placing OCO orders: %s %s %s", side, quantity, symbol)
+            logger.info("Take Profit: %s | Stop Loss: %s", take_profit_price, stop_loss_price)
             
-            # Get current price for validation
-            current_price = self.client.get_current_price(symbol)
+            # Sanity-check TP/SL against the current price (warn-only, never
+            # delays order placement)
+            check = partial(self._check_against_price, side, take_profit_price, stop_loss_price)
             if current_price:
-                logger.info(f"Current price: {current_price}")
-                
-                # Validate OCO logic
-                if side == "SELL":
-                    # For closing long position
-                    if take_profit_price <= current_price:
-                        logger.warning("⚠️  Take profit should be above current price for SELL")
-                    if stop_loss_price >= current_price:
-                        logger.warning("⚠️  Stop loss should be below current price for SELL")
-                else:  # BUY
-                    # For closing short position
-                    if take_profit_price >= current_price:
-                        logger.warning("⚠️  Take profit should be below current price for BUY")
-                    if stop_loss_price <= current_price:
-                        logger.warning("⚠️  Stop loss should be above current price for BUY")
-            
-            # Place take profit order (limit order)
-            logger.info("Placing take profit order...")
+                check(current_price)
+            else:
+                self.client.check_price_soon(symbol, check, PRICE_CHECK_MAX_AGE)
+            
+            # Take profit (limit) and stop loss (stop market) go out in one batchOrders request
             tp_params = {
                 'symbol': symbol,
                 'side': side,
@@ -107,18 +134,6 @@ class OCOOrderExecutor:
                 'timeInForce': 'GTC',
                 'positionSide': position_side,
             }
-            
-            if reduce_only:
-                tp_params['reduceOnly'] = 'true'
-            
-            tp_order = self.client.client.futures_create_order(**tp_params)
-            logger.info(f"✓ Take profit order placed: {tp_order['orderId']}")
-            
-            # Small delay to ensure orders don't conflict
-            time.sleep(0.2)
-            
-            # Place stop loss order (stop market)
-            logger.info("Placing stop loss order...")
             sl_params = {
                 'symbol': symbol,
                 'side': side,
@@ -129,19 +144,47 @@ class OCOOrderExecutor:
             }
             
             if reduce_only:
+                tp_params['reduceOnly'] = 'true'
                 sl_params['reduceOnly'] = 'true'
             
-            sl_order = self.client.client.futures_create_order(**sl_params)
-            logger.info(f"✓ Stop loss order placed: {sl_order['orderId']}")
+            logger.info("Placing take profit and stop loss orders...")
+            tp_order, sl_order = self.client.place_batch_orders([tp_params, sl_params])
+            
+            tp_failed = 'code' in tp_order
+            sl_failed = 'code' in sl_order
+            
+            if tp_failed or sl_failed:
+                for leg, order in (("Take profit", tp_order), ("Stop loss", sl_order)):
+                    if 'code' in order:
+                        logger.error(
+                            f"{leg} order failed: {order.get('msg')} (Code: {order.get('code')})"
+                        )
+                
+                # Never leave a single unprotected leg on the book
+                if not tp_failed:
+                    logger.warning("Cancelling take profit order due to stop loss failure...")
+                    self.client.cancel_order(symbol, tp_order['orderId'])
+                elif not sl_failed:
+                    logger.warning("Cancelling stop loss order due to take profit failure...")
+                    self.client.cancel_order(symbol, sl_order['orderId'])
+                
+                return None
+            
+            logger.info("✓ Take profit order placed: %s", tp_order['orderId'])
+            logger.info("✓ Stop loss order placed: %s", sl_order['orderId'])
             
             # Track OCO group
-            oco_group = {
-                'symbol': symbol,
-                'tp_order_id': tp_order['orderId'],
-                'sl_order_id': sl_order['orderId'],
-                'timestamp': time.time()
-            }
-            self.active_oco_groups.append(oco_group)
+            oco_group = OCOGroup(
+                id=self._next_group_id,
+                symbol=symbol,
+                tp_order_id=tp_order['orderId'],
+                sl_order_id=sl_order['orderId'],
+                placed_at=time.monotonic()
+            )
+            self._next_group_id += 1
+            self.groups_by_symbol.setdefault(symbol, {})[oco_group.id] = oco_group
+            self.oco_by_order_id[oco_group.tp_order_id] = oco_group
+            self.oco_by_order_id[oco_group.sl_order_id] = oco_group
             
             # Log successful trades
             log_trade(
@@ -170,7 +213,7 @@ class OCOOrderExecutor:
             result = {
                 'take_profit': tp_order,
                 'stop_loss': sl_order,
-                'oco_group_id': len(self.active_oco_groups) - 1
+                'oco_group_id': oco_group.id
             }
             
             logger.info("✓ OCO orders placed successfully")
@@ -178,100 +221,281 @@ class OCOOrderExecutor:
             
             return result
             
-        except BinanceAPIException as e:
-            logger.error(f"Binance API Error: {e.message} (Code: {e.code})")
-            
-            # If take profit was placed but stop loss failed, cancel take profit
-            if 'tp_order' in locals():
-                logger.warning("Cancelling take profit order due to stop loss failure...")
-                self.client.cancel_order(symbol, tp_order['orderId'])
-            
-            return None
-            
         except Exception as e:
             log_error(logger, e, "OCO order execution failed")
             return None
     
-    def monitor_and_cancel_oco(self, symbol: str, check_interval: int = 5):
+    def _check_against_price(
+        self,
+        side: str,
+        take_profit_price: float,
+        stop_loss_price: float,
+        current_price: float
+    ):
+        """Warn if TP/SL sit on the wrong side of the current price"""
+        logger.info("Current price: %s", current_price)
+        
+        if side == "SELL":
+            # For closing long position
+            if take_profit_price <= current_price:
+                logger.warning("⚠️  Take profit should be above current price for SELL")
+            if stop_loss_price >= current_price:
+                logger.warning("⚠️  Stop loss should be below current price for SELL")
+        else:  # BUY
+            # For closing short position
+            if take_profit_price >= current_price:
+                logger.warning("⚠️  Take profit should be below current price for BUY")
+            if stop_loss_price <= current_price:
+                logger.warning("⚠️  Stop loss should be above current price for BUY")
+    
+    def monitor_and_cancel_oco(
+        self,
+        symbol: str,
+        check_interval: int = 5,
+        use_websocket: bool = True
+    ):
         """
         Monitor OCO orders and cancel the opposite order when one fills
+        (blocking wrapper around amonitor_oco)
         
         Args:
             symbol: Trading pair to monitor
             check_interval: Check interval in seconds
+            use_websocket: Listen for fills on the user-data stream if True
         """
         try:
-            symbol = validate_symbol(symbol)
-            
-            logger.info(f"Monitoring OCO orders for {symbol}...")
-            logger.info(f"Press Ctrl+C to stop monitoring")
-            
-            while self.active_oco_groups:
-                for oco_group in self.active_oco_groups[:]:  # Copy to iterate safely
-                    if oco_group['symbol'] != symbol:
-                        continue
-                    
-                    # Check order status
-                    orders = self.client.get_open_orders(symbol)
-                    tp_exists = any(o['orderId'] == oco_group['tp_order_id'] for o in orders)
-                    sl_exists = any(o['orderId'] == oco_group['sl_order_id'] for o in orders)
-                    
-                    # If take profit filled, cancel stop loss
-                    if not tp_exists and sl_exists:
-                        logger.info(f"✓ Take profit executed! Cancelling stop loss...")
-                        self.client.cancel_order(symbol, oco_group['sl_order_id'])
-                        self.active_oco_groups.remove(oco_group)
-                        logger.info("OCO group resolved")
-                    
-                    # If stop loss filled, cancel take profit
-                    elif not sl_exists and tp_exists:
-                        logger.info(f"🛑 Stop loss executed! Cancelling take profit...")
-                        self.client.cancel_order(symbol, oco_group['tp_order_id'])
-                        self.active_oco_groups.remove(oco_group)
-                        logger.info("OCO group resolved")
-                    
-                    # If both gone, remove from tracking
-                    elif not tp_exists and not sl_exists:
-                        self.active_oco_groups.remove(oco_group)
-                        logger.info("OCO group completed")
-                
-                time.sleep(check_interval)
+            run_async(self.amonitor_oco(
+                symbols=[symbol],
+                check_interval=check_interval,
+                use_websocket=use_websocket
+            ))
+        
+        except KeyboardInterrupt:
+            logger.info("\n⚠️  Monitoring stopped by user")
+    
+    async def amonitor_oco(
+        self,
+        symbols: List[str] = None,
+        check_interval: int = 5,
+        use_websocket: bool = True
+    ):
+        """
+        Monitor OCO groups of several symbols concurrently on one event loop
+        
+        Fills are pushed over the user-data websocket; REST polling of open
+        orders is used only if the stream is disabled or fails to start.
+        Once the stream is subscribed, open orders are swept over REST once so
+        legs that finished before the subscription still resolve their group.
+        
+        Args:
+            symbols: Trading pairs to monitor (all tracked symbols if None)
+            check_interval: Check interval in seconds (longest wait between REST polls)
+            use_websocket: Listen for fills on the user-data stream if True
+        """
+        stream = None
+        async_client = None
+        
+        try:
+            if symbols is None:
+                symbols = set(self.groups_by_symbol)
+            symbols = {validate_symbol(symbol) for symbol in symbols}
+            
+            if use_websocket:
+                stream = UserDataStream(self.client)
+                if not stream.start():
+                    logger.warning("Falling back to REST polling of open orders")
+                    stream = None
+            
+            async_client = await BinanceFuturesAsyncClient.create(self.client.testnet)
+            
+            if stream:
+                # Legs that finished before the subscription never reach the
+                # stream; resolve them once now that new updates are queued
+                await asyncio.gather(*[
+                    self._sweep_open_orders(async_client, symbol)
+                    for symbol in symbols if self._has_active_groups((symbol,))
+                ])
+            
+            logger.info("Monitoring OCO orders for %s...", ', '.join(sorted(symbols)))
+            logger.info("Press Ctrl+C to stop monitoring")
+            
+            if stream:
+                await self._monitor_from_stream(symbols, stream, check_interval)
+            else:
+                await asyncio.gather(*[
+                    self._monitor_by_polling(async_client, symbol, check_interval)
+                    for symbol in symbols
+                ])
             
             logger.info("No more active OCO groups to monitor")
             
-        except KeyboardInterrupt:
-            logger.info("\n⚠️  Monitoring stopped by user")
         except Exception as e:
             log_error(logger, e, "OCO monitoring failed")
+        
+        finally:
+            if stream:
+                stream.stop()
+            if async_client:
+                await async_client.close()
     
-    def _display_oco_summary(self, tp_order: Dict, sl_order: Dict):
-        """Display formatted OCO order summary"""
-        from tabulate import tabulate
+    def _has_active_groups(self, symbols) -> bool:
+        """Check whether any OCO group for the given symbols is still being tracked"""
+        return any(self.groups_by_symbol.get(symbol) for symbol in symbols)
+    
+    def _resolve_group(self, oco_group: OCOGroup):
+        """Stop tracking an OCO group"""
+        groups = self.groups_by_symbol[oco_group.symbol]
+        del groups[oco_group.id]
+        if not groups:
+            del self.groups_by_symbol[oco_group.symbol]
+        
+        self.oco_by_order_id.pop(oco_group.tp_order_id, None)
+        self.oco_by_order_id.pop(oco_group.sl_order_id, None)
+    
+    def _poll_interval(self, symbol: str, max_wait: float) -> float:
+        """Pick the polling interval from the age of the youngest group for symbol"""
+        youngest = min(
+            time.monotonic() - g.placed_at
+            for g in self.groups_by_symbol[symbol].values()
+        )
+        
+        if youngest < POLL_HOT_SECONDS:
+            return min(POLL_HOT_INTERVAL, max_wait)
+        if youngest < POLL_WARM_SECONDS:
+            return min(POLL_WARM_INTERVAL, max_wait)
+        return max_wait
+    
+    async def _cancel_orders(self, pending_cancels: Dict[str, List[int]]):
+        """Cancel sibling legs with one batch cancel per symbol, off the event loop"""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[
+            loop.run_in_executor(None, self.client.cancel_orders, symbol, order_ids)
+            for symbol, order_ids in pending_cancels.items()
+        ])
+    
+    async def _monitor_from_stream(self, symbols, stream: UserDataStream, check_interval: int):
+        """Cancel the sibling leg as soon as the user-data stream reports a leg as done"""
+        loop = asyncio.get_running_loop()
+        
+        while self._has_active_groups(symbols):
+            # Block until order updates arrive (or the interval elapses)
+            updates = await loop.run_in_executor(
+                None, stream.get_order_updates, check_interval
+            )
+            
+            pending_cancels: Dict[str, List[int]] = {}  # symbol -> sibling order IDs
+            
+            for update in updates:
+                if update['s'] not in symbols or update['X'] not in TERMINAL_STATUSES:
+                    continue
+                
+                oco_group = self.oco_by_order_id.get(update['i'])
+                if not oco_group:
+                    continue
+                
+                if update['i'] == oco_group.tp_order_id:
+                    logger.info("✓ Take profit %s! Cancelling stop loss...", update['X'].lower())
+                    sibling_id = oco_group.sl_order_id
+                else:
+                    logger.info("🛑 Stop loss %s! Cancelling take profit...", update['X'].lower())
+                    sibling_id = oco_group.tp_order_id
+                
+                pending_cancels.setdefault(oco_group.symbol, []).append(sibling_id)
+                self._resolve_group(oco_group)
+                logger.info("OCO group resolved")
+            
+            if pending_cancels:
+                await self._cancel_orders(pending_cancels)
+    
+    async def _monitor_by_polling(
+        self,
+        async_client: BinanceFuturesAsyncClient,
+        symbol: str,
+        check_interval: int
+    ):
+        """Poll open orders for one symbol (HOT→WARM→COLD) and cancel the sibling leg once one leg is gone"""
+        while self._has_active_groups((symbol,)):
+            await self._sweep_open_orders(async_client, symbol)
+            
+            if self._has_active_groups((symbol,)):
+                await asyncio.sleep(self._poll_interval(symbol, check_interval))
+    
+    async def _sweep_open_orders(self, async_client: BinanceFuturesAsyncClient, symbol: str):
+        """Fetch open orders once and resolve every group of symbol with a leg gone"""
+        sibling_ids: List[int] = []
+        done_groups: List[OCOGroup] = []  # Removed after the sweep, no snapshot needed
+        
+        # Check order status once per sweep for every group of this symbol
+        orders = await async_client.get_open_orders(symbol)
+        if orders is None:
+            return  # Request failed; an empty book would wrongly resolve every group
+        open_ids = {o['orderId'] for o in orders}
+        
+        for oco_group in self.groups_by_symbol[symbol].values():
+            tp_exists = oco_group.tp_order_id in open_ids
+            sl_exists = oco_group.sl_order_id in open_ids
+            
+            # If take profit filled, cancel stop loss
+            if not tp_exists and sl_exists:
+                logger.info("✓ Take profit executed! Cancelling stop loss...")
+                sibling_ids.append(oco_group.sl_order_id)
+                done_groups.append(oco_group)
+                logger.info("OCO group resolved")
+            
+            # If stop loss filled, cancel take profit
+            elif not sl_exists and tp_exists:
+                logger.info("🛑 Stop loss executed! Cancelling take profit...")
+                sibling_ids.append(oco_group.tp_order_id)
+                done_groups.append(oco_group)
+                logger.info("OCO group resolved")
+            
+            # If both gone, remove from tracking
+            elif not tp_exists and not sl_exists:
+                done_groups.append(oco_group)
+                logger.info("OCO group completed")
         
-        summary_data = [
-            ["Type", "Order ID", "Price", "Status"],
-            [
+        for oco_group in done_groups:
+            self._resolve_group(oco_group)
+        
+        if sibling_ids:
+            await self._cancel_orders({symbol: sibling_ids})
+    
+    def _display_oco_summary(self, tp_order: Dict, sl_order: Dict):
+        """Display formatted OCO order summary (plain columns if tabulate is missing)"""
+        summary_data = (
+            (
                 "Take Profit",
                 tp_order['orderId'],
                 tp_order.get('price', 'N/A'),
                 tp_order['status']
-            ],
-            [
+            ),
+            (
                 "Stop Loss",
                 sl_order['orderId'],
                 sl_order.get('stopPrice', 'N/A'),
                 sl_order['status']
-            ]
-        ]
+            )
+        )
         
-        print("\n" + "="*60)
-        print("⚖️  OCO ORDER SUMMARY")
-        print("="*60)
-        print(tabulate(summary_data, headers="firstrow", tablefmt="simple"))
-        print("="*60)
-        print("💡 Tip: When one order fills, manually cancel the other")
-        print("    or use the monitor function to automate this.")
-        print("="*60 + "\n")
+        try:
+            from tabulate import tabulate
+            table = tabulate(summary_data, headers=SUMMARY_HEADERS, tablefmt='simple')
+        except ImportError:
+            table = "\n".join(
+                "  ".join(f"{value!s:<12}" for value in row)
+                for row in (SUMMARY_HEADERS,) + summary_data
+            )
+        
+        print(
+            f"\n{DIVIDER}\n"
+            "⚖️  OCO ORDER SUMMARY\n"
+            f"{DIVIDER}\n"
+            f"{table}\n"
+            f"{DIVIDER}\n"
+            "💡 Tip: When one order fills, manually cancel the other\n"
+            "    or use the monitor function to automate this.\n"
+            f"{DIVIDER}\n"
+        )
     
     def execute_oco_for_position(
         self,
@@ -295,14 +519,12 @@ class OCOOrderExecutor:
         try:
             symbol = validate_symbol(symbol)
             
-            # Get current position
-            positions = self.client.get_open_positions()
-            position = None
-            
-            for pos in positions:
-                if pos['symbol'] == symbol and pos['positionSide'] == position_side:
-                    position = pos
-                    break
+            # Get current position (filtered to this symbol by the server)
+            positions = {
+                (pos['symbol'], pos['positionSide']): pos
+                for pos in self.client.get_open_positions(symbol)
+            }
+            position = positions.get((symbol, position_side))
             
             if not position:
                 logger.error(f"No open position found for {symbol}")
@@ -320,17 +542,15 @@ class OCOOrderExecutor:
             is_long = position_amt > 0
             exit_side = 'SELL' if is_long else 'BUY'
             
-            # Calculate prices
-            if is_long:
-                tp_price = entry_price * (1 + take_profit_percentage / 100)
-                sl_price = entry_price * (1 - stop_loss_percentage / 100)
-            else:
-                tp_price = entry_price * (1 - take_profit_percentage / 100)
-                sl_price = entry_price * (1 + stop_loss_percentage / 100)
+            # Calculate prices (TP above entry for longs, below for shorts; SL mirrored)
+            sign = 1 if is_long else -1
+            tp_price = entry_price * (1 + sign * take_profit_percentage / 100)
+            sl_price = entry_price * (1 - sign * stop_loss_percentage / 100)
             
-            logger.info(f"Position: {position_amt} @ {entry_price}")
-            logger.info(f"Setting TP: {tp_price} (+{take_profit_percentage}%)")
-            logger.info(f"Setting SL: {sl_price} (-{stop_loss_percentage}%)")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Position: %s @ %s", position_amt, entry_price)
+                logger.info("Setting TP: %s (+%s%%)", tp_price, take_profit_percentage)
+                logger.info("Setting SL: %s (-%s%%)", sl_price, stop_loss_percentage)
             
             return self.execute_oco_order(
                 symbol=symbol,
@@ -339,7 +559,8 @@ class OCOOrderExecutor:
                 take_profit_price=tp_price,
                 stop_loss_price=sl_price,
                 reduce_only=True,
-                position_side=position_side
+                position_side=position_side,
+                current_price=float(position['markPrice'])
             )
             
         except Exception as e:
@@ -358,8 +579,9 @@ def main():
         print("   python src/advanced/oco.py --position <SYMBOL> <TP_%> <SL_%>")
         print("   Example: python src/advanced/oco.py --position BTCUSDT 5.0 2.0")
         print("\n3. Monitor OCO orders:")
-        print("   python src/advanced/oco.py --monitor <SYMBOL>")
+        print("   python src/advanced/oco.py --monitor <SYMBOL> [--poll]")
         print("   Example: python src/advanced/oco.py --monitor BTCUSDT")
+        print("   (--poll uses REST polling instead of the user-data websocket)")
         print("\n")
         sys.exit(1)
     
@@ -384,7 +606,10 @@ def main():
             idx = sys.argv.index('--monitor')
             symbol = sys.argv[idx + 1]
             
-            executor.monitor_and_cancel_oco(symbol)
+            executor.monitor_and_cancel_oco(
+                symbol,
+                use_websocket='--poll' not in sys.argv
+            )
             sys.exit(0)
             
         else:
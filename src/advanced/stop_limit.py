@@ -4,29 +4,68 @@ Execute orders when price reaches a trigger point
 """
 
 import sys
-from typing import Optional, Dict
+import json
+import argparse
+from functools import partial
+from operator import itemgetter
+from typing import Optional, Dict, List
 from binance.exceptions import BinanceAPIException
 
 from src.utils.client import get_client
 from src.utils.logger import setup_logger, log_trade, log_error
+from src.utils.rate_limit import throttle_order
 from src.utils.validators import (
-    validate_symbol, validate_side, validate_quantity, validate_price
+    validate_symbol, validate_side, validate_quantity, validate_price,
+    validate_order_type, validate_time_in_force, ValidationError
 )
 
 logger = setup_logger("StopLimitOrders")
 
+# Prices younger than this (seconds) are reused for the advisory stop check
+PRICE_CHECK_MAX_AGE = 0.25
+
+# Order types accepted by execute_batch_stop_orders
+STOP_ORDER_TYPES = frozenset({
+    'STOP', 'STOP_MARKET', 'TAKE_PROFIT', 'TAKE_PROFIT_MARKET', 'TRAILING_STOP_MARKET'
+})
+
+DIVIDER = "=" * 50
+SUMMARY_ROW = "{:<12} {}"
+SUMMARY_FIELDS = (
+    ("Order ID", 'orderId'),
+    ("Symbol", 'symbol'),
+    ("Side", 'side'),
+    ("Type", 'type'),
+    ("Quantity", 'origQty'),
+    ("Stop Price", 'stopPrice'),
+    ("Price", 'price'),
+    ("Status", 'status'),
+)
+SUMMARY_LABELS, SUMMARY_KEYS = zip(*SUMMARY_FIELDS)
+
+# Reads every summary field in one call; fields missing from a response show N/A
+_SUMMARY_DEFAULTS = dict.fromkeys(SUMMARY_KEYS, 'N/A')
+_summary_values = itemgetter(*SUMMARY_KEYS)
+
 
 class StopLimitOrderExecutor:
     """Execute stop-limit and stop-market orders"""
     
-    def __init__(self, testnet: bool = None):
+    def __init__(self, testnet: bool = None, quiet: bool = False):
         """
         Initialize stop-limit order executor
         
         Args:
             testnet: Use testnet if True
+            quiet: Skip printing the order summary if True
         """
         self.client = get_client(testnet)
+        self.quiet = quiet
+        
+        # Fixed order fields, copied and filled in per order
+        self._stop_limit_tmpl = {'type': 'STOP', 'timeInForce': 'GTC'}
+        self._stop_market_tmpl = {'type': 'STOP_MARKET'}
+        self._trailing_stop_tmpl = {'type': 'TRAILING_STOP_MARKET'}
         logger.info("Stop-Limit Order Executor initialized")
     
     def execute_stop_limit_order(
@@ -38,7 +77,8 @@ class StopLimitOrderExecutor:
         limit_price: float,
         reduce_only: bool = False,
         position_side: str = "BOTH",
-        working_type: str = "CONTRACT_PRICE"
+        working_type: str = "CONTRACT_PRICE",
+        skip_sanity_check: bool = False
     ) -> Optional[Dict]:
         """
         Execute a stop-limit order
@@ -52,6 +92,7 @@ class StopLimitOrderExecutor:
             reduce_only: If True, order will only reduce position
             position_side: BOTH, LONG, or SHORT
             working_type: CONTRACT_PRICE or MARK_PRICE
+            skip_sanity_check: If True, skip the advisory stop vs. market check
         
         Returns:
             Order response dictionary or None if failed
@@ -64,39 +105,35 @@ class StopLimitOrderExecutor:
             stop_price = validate_price(stop_price, symbol)
             limit_price = validate_price(limit_price, symbol)
             
-            logger.info(f"Placing stop-limit order: {side} {quantity} {symbol}")
-            logger.info(f"Stop: {stop_price} | Limit: {limit_price}")
+            logger.info("Placing stop-limit order: %s %s %s", side, quantity, symbol)
+            logger.info("Stop: %s | Limit: %s", stop_price, limit_price)
             
-            # Get current price for reference
-            current_price = self.client.get_current_price(symbol)
-            if current_price:
-                stop_diff = ((stop_price - current_price) / current_price) * 100
-                logger.info(f"Current price: {current_price} (Stop {stop_diff:+.2f}% from market)")
-                
-                # Validate stop price logic
-                if side == "BUY" and stop_price <= current_price:
-                    logger.warning("⚠️  BUY stop should typically be above current price")
-                elif side == "SELL" and stop_price >= current_price:
-                    logger.warning("⚠️  SELL stop should typically be below current price")
+            # Sanity-check the stop against the last price (warn-only, never delays
+            # the order POST). MARK_PRICE stops trigger off a different price, so
+            # the check is skipped for them.
+            if not skip_sanity_check and working_type != "MARK_PRICE":
+                self.client.check_price_soon(
+                    symbol, partial(self._check_stop_price, side, stop_price), PRICE_CHECK_MAX_AGE
+                )
             
             # Prepare order parameters
-            order_params = {
-                'symbol': symbol,
-                'side': side,
-                'type': 'STOP',
-                'quantity': quantity,
-                'price': limit_price,
-                'stopPrice': stop_price,
-                'timeInForce': 'GTC',
-                'positionSide': position_side,
-                'workingType': working_type,
-            }
+            order_params = self._stop_limit_tmpl.copy()
+            order_params.update(
+                symbol=symbol,
+                side=side,
+                quantity=quantity,
+                price=limit_price,
+                stopPrice=stop_price,
+                positionSide=position_side,
+                workingType=working_type,
+            )
             
             if reduce_only:
                 order_params['reduceOnly'] = 'true'
             
             # Execute order
-            logger.debug(f"Order parameters: {order_params}")
+            logger.debug("Order parameters: %s", order_params)
+            throttle_order()
             order_response = self.client.client.futures_create_order(**order_params)
             
             # Log successful trade
@@ -118,7 +155,7 @@ class StopLimitOrderExecutor:
             return order_response
             
         except BinanceAPIException as e:
-            logger.error(f"Binance API Error: {e.message} (Code: {e.code})")
+            logger.error("Binance API Error: %s (Code: %s)", e.message, e.code)
             return None
         except Exception as e:
             log_error(logger, e, "Stop-limit order execution failed")
@@ -151,29 +188,20 @@ class StopLimitOrderExecutor:
         """
         try:
             # Validate inputs
-            symbol = validate_symbol(symbol)
-            side = validate_side(side)
-            quantity = validate_quantity(quantity, symbol)
-            stop_price = validate_price(stop_price, symbol)
-            
-            logger.info(f"Placing stop-market order: {side} {quantity} {symbol} @ {stop_price}")
-            
-            # Prepare order parameters
-            order_params = {
-                'symbol': symbol,
-                'side': side,
-                'type': 'STOP_MARKET',
-                'quantity': quantity,
-                'stopPrice': stop_price,
-                'positionSide': position_side,
-                'workingType': working_type,
-            }
+            order_params = self._build_stop_market_params(
+                symbol, side, quantity, stop_price,
+                reduce_only, position_side, working_type
+            )
+            symbol = order_params['symbol']
+            side = order_params['side']
+            quantity = order_params['quantity']
+            stop_price = order_params['stopPrice']
             
-            if reduce_only:
-                order_params['reduceOnly'] = 'true'
+            logger.info("Placing stop-market order: %s %s %s @ %s", side, quantity, symbol, stop_price)
             
             # Execute order
-            logger.debug(f"Order parameters: {order_params}")
+            logger.debug("Order parameters: %s", order_params)
+            throttle_order()
             order_response = self.client.client.futures_create_order(**order_params)
             
             # Log successful trade
@@ -194,12 +222,72 @@ class StopLimitOrderExecutor:
             return order_response
             
         except BinanceAPIException as e:
-            logger.error(f"Binance API Error: {e.message} (Code: {e.code})")
+            logger.error("Binance API Error: %s (Code: %s)", e.message, e.code)
             return None
         except Exception as e:
             log_error(logger, e, "Stop-market order execution failed")
             return None
     
+    def _build_stop_market_params(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+        reduce_only: bool = False,
+        position_side: str = "BOTH",
+        working_type: str = "CONTRACT_PRICE"
+    ) -> Dict:
+        """
+        Validate inputs and build stop-market order parameters (no network call)
+        
+        Returns:
+            Order parameter dictionary for futures_create_order/batchOrders
+        """
+        symbol = validate_symbol(symbol)
+        side = validate_side(side)
+        
+        order_params = self._stop_market_tmpl.copy()
+        order_params.update(
+            symbol=symbol,
+            side=side,
+            quantity=validate_quantity(quantity, symbol),
+            stopPrice=validate_price(stop_price, symbol),
+            positionSide=position_side,
+            workingType=working_type,
+        )
+        
+        if reduce_only:
+            order_params['reduceOnly'] = 'true'
+        
+        return order_params
+    
+    def _build_batch_order_params(self, order: Dict) -> Dict:
+        """
+        Validate one caller-built stop order into new parameters (input is left untouched)
+        
+        Returns:
+            Order parameter dictionary for batchOrders
+        """
+        order_params = dict(order)
+        symbol = order_params['symbol'] = validate_symbol(order['symbol'])
+        order_params['side'] = validate_side(order['side'])
+        
+        order_type = order_params['type'] = validate_order_type(order['type'])
+        if order_type not in STOP_ORDER_TYPES:
+            raise ValidationError(f"Not a stop order type: {order_type}")
+        
+        if 'quantity' in order:
+            order_params['quantity'] = validate_quantity(order['quantity'], symbol)
+        if 'stopPrice' in order:
+            order_params['stopPrice'] = validate_price(order['stopPrice'], symbol)
+        if 'price' in order:
+            order_params['price'] = validate_price(order['price'], symbol)
+        if 'timeInForce' in order:
+            order_params['timeInForce'] = validate_time_in_force(order['timeInForce'])
+        
+        return order_params
+    
     def execute_trailing_stop(
         self,
         symbol: str,
@@ -234,28 +322,29 @@ class StopLimitOrderExecutor:
             if not (0.1 <= callback_rate <= 5.0):
                 raise ValueError("Callback rate must be between 0.1 and 5.0")
             
-            logger.info(f"Placing trailing stop: {side} {quantity} {symbol}")
-            logger.info(f"Callback rate: {callback_rate}%")
+            logger.info("Placing trailing stop: %s %s %s", side, quantity, symbol)
+            logger.info("Callback rate: %s%%", callback_rate)
             
             # Prepare order parameters
-            order_params = {
-                'symbol': symbol,
-                'side': side,
-                'type': 'TRAILING_STOP_MARKET',
-                'quantity': quantity,
-                'callbackRate': callback_rate,
-                'positionSide': position_side,
-            }
+            order_params = self._trailing_stop_tmpl.copy()
+            order_params.update(
+                symbol=symbol,
+                side=side,
+                quantity=quantity,
+                callbackRate=callback_rate,
+                positionSide=position_side,
+            )
             
             if activation_price:
                 order_params['activationPrice'] = validate_price(activation_price, symbol)
-                logger.info(f"Activation price: {activation_price}")
+                logger.info("Activation price: %s", activation_price)
             
             if reduce_only:
                 order_params['reduceOnly'] = 'true'
             
             # Execute order
-            logger.debug(f"Order parameters: {order_params}")
+            logger.debug("Order parameters: %s", order_params)
+            throttle_order()
             order_response = self.client.client.futures_create_order(**order_params)
             
             # Log successful trade
@@ -276,32 +365,97 @@ class StopLimitOrderExecutor:
             return order_response
             
         except BinanceAPIException as e:
-            logger.error(f"Binance API Error: {e.message} (Code: {e.code})")
+            logger.error("Binance API Error: %s (Code: %s)", e.message, e.code)
             return None
         except Exception as e:
             log_error(logger, e, "Trailing stop order execution failed")
             return None
     
+    def execute_batch_stop_orders(self, orders: List[Dict]) -> List[Dict]:
+        """
+        Submit pre-built stop orders through batchOrders
+        
+        Each order is validated into new parameters; the caller's dicts are not modified.
+        
+        Args:
+            orders: Order parameter dicts using Binance field names
+                (symbol, side, type, quantity, stopPrice, ...)
+        
+        Returns:
+            Accepted order responses (rejected orders are logged and dropped)
+        """
+        try:
+            orders = [self._build_batch_order_params(order) for order in orders]
+            
+            logger.info("Placing %s stop orders via batchOrders", len(orders))
+            placed = []
+            for params, order in zip(orders, self.client.place_batch_orders(orders)):
+                if 'code' in order:
+                    logger.error("Batch order rejected: %s (Code: %s)", order.get('msg'), order.get('code'))
+                    continue
+                
+                log_trade(
+                    logger,
+                    order_type=params.get('type'),
+                    symbol=params['symbol'],
+                    side=params['side'],
+                    quantity=params.get('quantity'),
+                    stop_price=params.get('stopPrice'),
+                    order_id=order.get('orderId'),
+                    status=order.get('status')
+                )
+                placed.append(order)
+            
+            return placed
+            
+        except Exception as e:
+            log_error(logger, e, "Batch stop order execution failed")
+            return []
+    
+    def _check_stop_price(self, side: str, stop_price: float, current_price: float):
+        """Warn if the stop sits on the wrong side of the current price"""
+        stop_diff = ((stop_price - current_price) / current_price) * 100
+        logger.info("Current price: %s (Stop %+.2f%% from market)", current_price, stop_diff)
+        
+        # Validate stop price logic
+        if side == "BUY" and stop_price <= current_price:
+            logger.warning("⚠️  BUY stop should typically be above current price")
+        elif side == "SELL" and stop_price >= current_price:
+            logger.warning("⚠️  SELL stop should typically be below current price")
+    
     def _display_order_summary(self, order: Dict):
         """Display formatted order summary"""
-        from tabulate import tabulate
+        if self.quiet:
+            return
         
-        summary_data = [
-            ["Order ID", order.get('orderId', 'N/A')],
-            ["Symbol", order.get('symbol', 'N/A')],
-            ["Side", order.get('side', 'N/A')],
-            ["Type", order.get('type', 'N/A')],
-            ["Quantity", order.get('origQty', 'N/A')],
-            ["Stop Price", order.get('stopPrice', 'N/A')],
-            ["Price", order.get('price', 'N/A')],
-            ["Status", order.get('status', 'N/A')],
-        ]
-        
-        print("\n" + "="*50)
-        print("🛑 STOP ORDER SUMMARY")
-        print("="*50)
-        print(tabulate(summary_data, tablefmt="simple"))
-        print("="*50 + "\n")
+        rows = "\n".join(
+            SUMMARY_ROW.format(label, value)
+            for label, value in zip(SUMMARY_LABELS, _summary_values({**_SUMMARY_DEFAULTS, **order}))
+        )
+        print(f"\n{DIVIDER}\n🛑 STOP ORDER SUMMARY\n{DIVIDER}\n{rows}\n{DIVIDER}\n")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the stop order CLI parser"""
+    parser = argparse.ArgumentParser(
+        prog="python src/advanced/stop_limit.py",
+        description="Place stop-limit, stop-market and trailing stop orders"
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--stop-market', action='store_true', help="Place a stop-market order")
+    mode.add_argument('--trailing', action='store_true', help="Place a trailing stop (VALUE is the callback rate)")
+    mode.add_argument('--orders', metavar='FILE', help="Submit a JSON list of stop orders via batchOrders")
+    parser.add_argument('symbol', nargs='?', help="Trading pair (e.g., BTCUSDT)")
+    parser.add_argument('side', nargs='?', help="BUY or SELL")
+    parser.add_argument('quantity', nargs='?', type=float, help="Order quantity")
+    parser.add_argument('value', nargs='?', type=float, help="Stop price, or callback rate with --trailing")
+    parser.add_argument('limit_price', nargs='?', type=float, help="Limit price (stop-limit only)")
+    parser.add_argument('--reduce-only', action='store_true', help="Only reduce an existing position")
+    parser.add_argument('--no-summary', action='store_true', help="Skip the order summary table")
+    return parser
+
+
+_parser = _build_parser()
 
 
 def main():
@@ -317,61 +471,62 @@ def main():
         print("\n3. Trailing Stop:")
         print("   python src/advanced/stop_limit.py --trailing <SYMBOL> <SIDE> <QTY> <CALLBACK_RATE>")
         print("   Example: python src/advanced/stop_limit.py --trailing BTCUSDT SELL 0.01 1.0")
+        print("\n4. Batch of Stop Orders:")
+        print("   python src/advanced/stop_limit.py --orders <FILE.json>")
+        print("   (FILE.json holds a list of order dicts using Binance field names)")
+        print("\nOptions: --reduce-only, --no-summary (skip the order summary table)")
         print("\n")
         sys.exit(1)
     
+    args = _parser.parse_args()
+    
     try:
-        executor = StopLimitOrderExecutor()
+        executor = StopLimitOrderExecutor(quiet=args.no_summary)
         
-        # Check for order type flags
-        if '--stop-market' in sys.argv:
-            # Stop-market order
-            idx = sys.argv.index('--stop-market')
-            symbol = sys.argv[idx + 1]
-            side = sys.argv[idx + 2]
-            quantity = float(sys.argv[idx + 3])
-            stop_price = float(sys.argv[idx + 4])
-            
-            result = executor.execute_stop_market_order(
-                symbol=symbol,
-                side=side,
-                quantity=quantity,
-                stop_price=stop_price,
-                reduce_only='--reduce-only' in sys.argv
-            )
+        if args.orders:
+            # Batch of stop orders from file
+            with open(args.orders) as f:
+                orders = json.load(f)
             
-        elif '--trailing' in sys.argv:
-            # Trailing stop order
-            idx = sys.argv.index('--trailing')
-            symbol = sys.argv[idx + 1]
-            side = sys.argv[idx + 2]
-            quantity = float(sys.argv[idx + 3])
-            callback_rate = float(sys.argv[idx + 4])
-            
-            result = executor.execute_trailing_stop(
-                symbol=symbol,
-                side=side,
-                quantity=quantity,
-                callback_rate=callback_rate,
-                reduce_only='--reduce-only' in sys.argv
-            )
+            result = executor.execute_batch_stop_orders(orders)
             
         else:
-            # Regular stop-limit order
-            symbol = sys.argv[1]
-            side = sys.argv[2]
-            quantity = float(sys.argv[3])
-            stop_price = float(sys.argv[4])
-            limit_price = float(sys.argv[5])
-            
-            result = executor.execute_stop_limit_order(
-                symbol=symbol,
-                side=side,
-                quantity=quantity,
-                stop_price=stop_price,
-                limit_price=limit_price,
-                reduce_only='--reduce-only' in sys.argv
-            )
+            if args.value is None:
+                raise ValueError("SYMBOL, SIDE, QTY and a stop price/callback rate are required")
+            
+            if args.stop_market:
+                # Stop-market order
+                result = executor.execute_stop_market_order(
+                    symbol=args.symbol,
+                    side=args.side,
+                    quantity=args.quantity,
+                    stop_price=args.value,
+                    reduce_only=args.reduce_only
+                )
+                
+            elif args.trailing:
+                # Trailing stop order
+                result = executor.execute_trailing_stop(
+                    symbol=args.symbol,
+                    side=args.side,
+                    quantity=args.quantity,
+                    callback_rate=args.value,
+                    reduce_only=args.reduce_only
+                )
+                
+            else:
+                # Regular stop-limit order
+                if args.limit_price is None:
+                    raise ValueError("LIMIT_PRICE is required for a stop-limit order")
+                
+                result = executor.execute_stop_limit_order(
+                    symbol=args.symbol,
+                    side=args.side,
+                    quantity=args.quantity,
+                    stop_price=args.value,
+                    limit_price=args.limit_price,
+                    reduce_only=args.reduce_only
+                )
         
         if result:
             logger.info("✓ Stop order placed successfully")
@@ -380,8 +535,8 @@ def main():
             logger.error("✗ Stop order placement failed")
             sys.exit(1)
             
-    except (IndexError, ValueError) as e:
-        logger.error(f"Invalid arguments: {e}")
+    except (OSError, ValueError) as e:
+        logger.error("Invalid arguments: %s", e)
         sys.exit(1)
     except KeyboardInterrupt:
         logger.warning("\n⚠️  Operation cancelled by user")
@@ -390,6 +545,5 @@ def main():
         log_error(logger, e, "Unexpected error")
         sys.exit(1)
 
-
 if __name__ == "__main__":
     main()
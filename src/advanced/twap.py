@@ -5,31 +5,76 @@ Split large orders into smaller chunks executed over time
 
 import sys
 import time
-from typing import Optional, List, Dict
-from datetime import datetime, timedelta
+import logging
+import argparse
+from collections import deque
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Tuple
+from datetime import datetime
 
-from src.utils.client import get_client
+import numpy as np
+from binance.exceptions import BinanceAPIException
+
+from src.utils.client import get_client, BATCH_ORDER_LIMIT
 from src.utils.logger import setup_logger, log_trade, log_error
+from src.utils.rate_limit import throttle_order
+from src.utils.streams import UserDataStream
 from src.utils.validators import (
     validate_symbol, validate_side, validate_quantity, 
-    validate_positive_integer
+    validate_price, validate_positive_integer
 )
 
 logger = setup_logger("TWAP")
 
+# Prices younger than this (seconds) are reused when adapting limit prices
+ADAPTIVE_PRICE_MAX_AGE = 0.5
+
+# Adaptive limit prices are re-derived only after the market moves this far (5 bps)
+ADAPTIVE_REPRICE_THRESHOLD = 5e-4
+
+# Seconds to wait after the last tick for fills to arrive on the user-data stream
+FILL_WAIT_SECONDS = 5
+
+# Most recent executed orders kept in TWAPExecutor.execution_history
+HISTORY_MAXLEN = 10_000
+
+# Order statuses after which no further fills can arrive
+TERMINAL_STATUSES = {'FILLED', 'CANCELED', 'EXPIRED', 'REJECTED'}
+
+# Randomized order sizes: Dirichlet concentration (higher = closer to equal)
+# and the largest share of the total a single order may take
+SIZE_DIRICHLET_ALPHA = 4.0
+MAX_ORDER_SHARE = 0.8
+
+_rng = np.random.default_rng()
+
+DIVIDER = "=" * 60
+DETAIL_HEADER = f"{'#':>3}  {'Time':<8}  {'Order ID':<12}  {'Quantity':<12}  {'Avg Price':<14}  Status"
+DETAIL_ROW = "{:>3}  {:<8}  {:<12}  {:<12}  {:<14}  {}"
+
+NS_PER_SECOND = 1_000_000_000
+
 
 class TWAPExecutor:
     """Execute TWAP (Time-Weighted Average Price) orders"""
     
-    def __init__(self, testnet: bool = None):
+    def __init__(self, testnet: bool = None, quiet: bool = False):
         """
         Initialize TWAP executor
         
         Args:
             testnet: Use testnet if True
+            quiet: Skip printing the execution summary if True
         """
         self.client = get_client(testnet)
-        self.execution_history = []
+        self.quiet = quiet
+        # (monotonic_ns, order_num, order_id, executed_qty, avg_price, status)
+        self.execution_history: deque = deque(maxlen=HISTORY_MAXLEN)
+        self._adaptive_prices: Dict[str, Tuple[float, float]] = {}  # symbol -> (reference, limit)
+        
+        # execute_twap reads the LOT_SIZE step; fetch exchange info before it is needed
+        self.client.prefetch_symbol_info()
         logger.info("TWAP Executor initialized")
     
     def execute_twap(
@@ -42,7 +87,9 @@ class TWAPExecutor:
         order_type: str = "MARKET",
         limit_price: float = None,
         randomize_timing: bool = False,
-        randomize_quantity: bool = False
+        randomize_quantity: bool = False,
+        batch_size: int = 1,
+        use_websocket: bool = True
     ) -> List[Dict]:
         """
         Execute TWAP strategy
@@ -56,11 +103,19 @@ class TWAPExecutor:
             order_type: MARKET or LIMIT
             limit_price: Limit price (required if order_type is LIMIT)
             randomize_timing: Add random variance to intervals (±20%)
-            randomize_quantity: Add random variance to order sizes (±10%)
+            randomize_quantity: Split the total by a Dirichlet(SIZE_DIRICHLET_ALPHA)
+                draw instead of equally; any one order is capped at
+                MAX_ORDER_SHARE of the total
+            batch_size: Sub-slices submitted together per interval in one
+                batchOrders request (1 to BATCH_ORDER_LIMIT)
+            use_websocket: Collect fills from the user-data stream if True (and
+                feed LIMIT re-pricing from the client's mark price stream)
         
         Returns:
             List of executed order responses
         """
+        stream = None
+        placed = []  # (monotonic_ns, order_num, order response) per accepted order
         try:
             # Validate inputs
             symbol = validate_symbol(symbol)
@@ -80,142 +135,293 @@ class TWAPExecutor:
             
             order_type = order_type.upper()
             
-            logger.info("="*60)
+            # Validated once here; chunks are submitted without re-validation
+            if order_type == "LIMIT":
+                limit_price = validate_price(limit_price, symbol)
+            
+            batch_size = validate_positive_integer(batch_size, "batch_size")
+            if batch_size > BATCH_ORDER_LIMIT:
+                raise ValueError(f"batch_size is limited to {BATCH_ORDER_LIMIT} orders")
+            num_ticks = -(-num_orders // batch_size)
+            
+            logger.info(DIVIDER)
             logger.info("🕐 STARTING TWAP EXECUTION")
-            logger.info("="*60)
-            logger.info(f"Symbol: {symbol}")
-            logger.info(f"Side: {side}")
-            logger.info(f"Total Quantity: {total_quantity}")
-            logger.info(f"Number of Orders: {num_orders}")
-            logger.info(f"Time Interval: {time_interval_seconds}s")
-            logger.info(f"Order Type: {order_type}")
+            logger.info(DIVIDER)
+            logger.info("Symbol: %s", symbol)
+            logger.info("Side: %s", side)
+            logger.info("Total Quantity: %s", total_quantity)
+            logger.info("Number of Orders: %s", num_orders)
+            logger.info("Time Interval: %ss", time_interval_seconds)
+            logger.info("Order Type: %s", order_type)
             if limit_price:
-                logger.info(f"Limit Price: {limit_price}")
-            logger.info(f"Randomize Timing: {randomize_timing}")
-            logger.info(f"Randomize Quantity: {randomize_quantity}")
+                logger.info("Limit Price: %s", limit_price)
+            logger.info("Randomize Timing: %s", randomize_timing)
+            logger.info("Randomize Quantity: %s", randomize_quantity)
+            if batch_size > 1:
+                logger.info("Batch Size: %s orders per interval", batch_size)
             
             # Calculate total execution time
-            total_time_seconds = (num_orders - 1) * time_interval_seconds
-            end_time = datetime.now() + timedelta(seconds=total_time_seconds)
-            logger.info(f"Estimated completion: {end_time.strftime('%H:%M:%S')}")
-            logger.info("="*60 + "\n")
+            total_time_seconds = (num_ticks - 1) * time_interval_seconds
+            end_time = time.localtime(time.time() + total_time_seconds)
+            logger.info("Estimated completion: %s", time.strftime('%H:%M:%S', end_time))
+            logger.info(DIVIDER + "\n")
             
             # Calculate order sizes
             order_sizes = self._calculate_order_sizes(
                 total_quantity, 
                 num_orders, 
-                randomize_quantity
+                randomize_quantity,
+                self._quantity_step(symbol)
             )
             
-            executed_orders = []
+            # Absolute wake-up times for ticks 2..n, fixed up front so slow
+            # submissions or logging never push later ticks back
+            wait_times = self._calculate_wait_times(
+                time_interval_seconds,
+                num_ticks - 1,
+                randomize_timing
+            )
+            start_ns = time.monotonic_ns()
+            tick_targets = (start_ns + np.cumsum(wait_times) * NS_PER_SECOND).tolist()
             
-            # Execute orders
-            for i in range(num_orders):
-                order_num = i + 1
-                order_size = order_sizes[i]
-                
-                logger.info(f"[{order_num}/{num_orders}] Executing order: {order_size} {symbol}")
-                
-                try:
-                    # Execute order based on type
-                    if order_type == "MARKET":
-                        order_result = self._execute_market_chunk(
-                            symbol, side, order_size
-                        )
-                    else:  # LIMIT
-                        # Update limit price based on current market
-                        current_limit_price = self._get_adaptive_limit_price(
-                            symbol, side, limit_price
-                        )
-                        order_result = self._execute_limit_chunk(
-                            symbol, side, order_size, current_limit_price
-                        )
-                    
-                    if order_result:
-                        executed_orders.append(order_result)
-                        self.execution_history.append({
-                            'timestamp': datetime.now(),
-                            'order_num': order_num,
-                            'result': order_result
-                        })
-                        logger.info(f"✓ Order {order_num} executed successfully")
-                    else:
-                        logger.error(f"✗ Order {order_num} failed")
-                
-                except Exception as e:
-                    log_error(logger, e, f"Order {order_num} execution error")
+            # Fills are pushed on the user-data stream while orders go out; the
+            # REST acks of market orders usually report nothing filled yet
+            if use_websocket:
+                stream = UserDataStream(self.client)
+                if not stream.start():
+                    stream = None
                 
-                # Wait before next order (except for last order)
-                if i < num_orders - 1:
-                    wait_time = self._calculate_wait_time(
-                        time_interval_seconds, 
-                        randomize_timing
+                # Pushed prices keep the adaptive limit price off the REST ticker;
+                # the subscription belongs to the shared client and outlives this run
+                if order_type == "LIMIT":
+                    self.client.stream_prices([symbol])
+            
+            self._adaptive_prices.pop(symbol, None)
+            
+            # Execute orders, batch_size sub-slices per interval. Submissions run on
+            # a single worker thread (preserving order) so the HTTP round trip
+            # overlaps the wait instead of stretching every interval.
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="twap") as order_pool:
+                for tick in range(num_ticks):
+                    first = tick * batch_size
+                    order_pool.submit(
+                        self._execute_tick,
+                        symbol, side, order_type, limit_price,
+                        order_sizes[first:first + batch_size], first + 1,
+                        num_orders, placed
                     )
-                    logger.info(f"Waiting {wait_time}s until next order...\n")
-                    time.sleep(wait_time)
+                    
+                    # Wait before next order (except for last order)
+                    if tick < num_ticks - 1:
+                        wait_time = (tick_targets[tick] - time.monotonic_ns()) / NS_PER_SECOND
+                        if wait_time > 0:
+                            logger.info("Waiting %.1fs until next order...\n", wait_time)
+                            time.sleep(wait_time)
+            
+            executed_orders = [order for _, _, order in placed]
+            if stream:
+                self._collect_fills(stream, executed_orders)
             
             # Display execution summary
-            self._display_execution_summary(executed_orders, total_quantity)
+            records = self._record_history(placed)
+            self._display_execution_summary(records, total_quantity)
             
             return executed_orders
             
         except KeyboardInterrupt:
             logger.warning("\n⚠️  TWAP execution interrupted by user")
-            logger.info(f"Executed {len(executed_orders)}/{num_orders} orders")
-            return executed_orders
+            logger.info("Executed %s/%s orders", len(placed), num_orders)
+            self._record_history(placed)
+            return [order for _, _, order in placed]
             
         except Exception as e:
             log_error(logger, e, "TWAP execution failed")
             return []
+        
+        finally:
+            if stream:
+                stream.stop()
+    
+    def _collect_fills(self, stream: UserDataStream, orders: List[Dict]):
+        """Overlay fills pushed on the user-data stream onto the REST order acks"""
+        pending = {
+            order.get('orderId'): order
+            for order in orders
+            if order.get('status') not in TERMINAL_STATUSES
+        }
+        deadline = time.monotonic() + FILL_WAIT_SECONDS
+        
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning("No final fill update for %s order(s)", len(pending))
+                break
+            
+            for update in stream.get_order_updates(timeout=remaining):
+                order = pending.get(update['i'])
+                if order is None:
+                    continue
+                
+                order['executedQty'] = update['z']
+                order['avgPrice'] = update['ap']
+                order['status'] = update['X']
+                if update['X'] in TERMINAL_STATUSES:
+                    del pending[update['i']]
+    
+    def _record_history(self, placed: List[Tuple[int, int, Dict]]) -> List[Tuple]:
+        """Append the minimal fields of each placed order to execution_history"""
+        records = [
+            (
+                timestamp,
+                order_num,
+                order.get('orderId'),
+                float(order.get('executedQty', 0)),
+                float(order.get('avgPrice', 0)),
+                order.get('status', 'N/A')
+            )
+            for timestamp, order_num, order in placed
+        ]
+        self.execution_history.extend(records)
+        return records
+    
+    def _execute_tick(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        limit_price: Optional[float],
+        chunk_sizes: List[float],
+        first_num: int,
+        num_orders: int,
+        placed: List[Tuple[int, int, Dict]]
+    ):
+        """Submit one interval's sub-slice(s) and record the results"""
+        if len(chunk_sizes) == 1:
+            logger.info(
+                "[%s/%s] Executing order: %s %s",
+                first_num, num_orders, chunk_sizes[0], symbol
+            )
+        else:
+            logger.info(
+                "[%s-%s/%s] Executing batch: %s %s",
+                first_num, first_num + len(chunk_sizes) - 1, num_orders,
+                ', '.join(map(str, chunk_sizes)), symbol
+            )
+        
+        try:
+            # Update limit price based on current market
+            current_limit_price = None
+            if order_type == "LIMIT":
+                current_limit_price = self._get_adaptive_limit_price(
+                    symbol, side, limit_price
+                )
+            
+            # Execute order(s) based on type
+            if len(chunk_sizes) > 1:
+                results = self._execute_batch_chunk(
+                    symbol, side, order_type, chunk_sizes, current_limit_price
+                )
+            elif order_type == "MARKET":
+                results = [self._execute_market_chunk(
+                    symbol, side, chunk_sizes[0]
+                )]
+            else:  # LIMIT
+                results = [self._execute_limit_chunk(
+                    symbol, side, chunk_sizes[0], current_limit_price
+                )]
+            
+            for order_num, order_result in enumerate(results, first_num):
+                if order_result:
+                    placed.append((time.monotonic_ns(), order_num, order_result))
+                    logger.info("✓ Order %s executed successfully", order_num)
+                else:
+                    logger.error("✗ Order %s failed", order_num)
+        
+        except Exception as e:
+            log_error(logger, e, f"Order {first_num} execution error")
+    
+    def _quantity_step(self, symbol: str) -> Optional[Decimal]:
+        """Quantity step size from the symbol's LOT_SIZE filter, or None if unknown"""
+        symbol_info = self.client.get_symbol_info(symbol)
+        for symbol_filter in (symbol_info or {}).get('filters', ()):
+            if symbol_filter.get('filterType') == 'LOT_SIZE':
+                step = Decimal(symbol_filter['stepSize'])
+                return step if step > 0 else None
+        
+        logger.warning("No LOT_SIZE filter for %s, order sizes are not rounded", symbol)
+        return None
     
     def _calculate_order_sizes(
         self, 
         total_quantity: float, 
         num_orders: int, 
-        randomize: bool
+        randomize: bool,
+        step: Optional[Decimal] = None
     ) -> List[float]:
-        """Calculate individual order sizes"""
-        import random
+        """
+        Calculate individual order sizes
         
-        if not randomize:
-            # Equal distribution
-            base_size = total_quantity / num_orders
-            return [base_size] * num_orders
+        Args:
+            total_quantity: Total quantity to split
+            num_orders: Number of orders
+            randomize: Split by a Dirichlet draw instead of equally
+            step: Quantity step size; every order except the last is rounded
+                down to it and the last takes the remainder
         
-        # Random distribution with constraints
-        sizes = []
-        remaining = total_quantity
+        Returns:
+            Order sizes, summing to the total (rounded down to step)
         
-        for i in range(num_orders - 1):
-            # Random size between 50% and 150% of average
-            avg_remaining = remaining / (num_orders - i)
-            min_size = avg_remaining * 0.5
-            max_size = avg_remaining * 1.5
-            
-            order_size = random.uniform(min_size, max_size)
-            order_size = min(order_size, remaining * 0.8)  # Don't use more than 80% in one order
-            
-            sizes.append(order_size)
-            remaining -= order_size
+        Raises:
+            ValueError: If the total has fewer steps than there are orders
+        """
+        if randomize:
+            # Symmetric random partition of the total from one Dirichlet draw; redraw
+            # in the rare case one order would take more than MAX_ORDER_SHARE
+            alpha = np.full(num_orders, SIZE_DIRICHLET_ALPHA)
+            shares = _rng.dirichlet(alpha)
+            while num_orders > 1 and shares.max() > MAX_ORDER_SHARE:
+                shares = _rng.dirichlet(alpha)
+        else:
+            # Equal distribution
+            shares = np.full(num_orders, 1 / num_orders)
         
-        # Last order gets all remaining
-        sizes.append(remaining)
+        if step is None:
+            sizes = (shares * total_quantity).tolist()
+        else:
+            # Split whole steps so each size is an exact multiple of step
+            total_steps = int(Decimal(str(total_quantity)) / step)
+            if total_steps < num_orders:
+                raise ValueError(
+                    f"Total quantity {total_quantity} is too small for {num_orders} orders "
+                    f"of at least one step ({step})"
+                )
+            
+            steps = np.maximum(np.floor(shares[:-1] * total_steps), 1).astype(int).tolist()
+            steps.append(total_steps - sum(steps))
+            if steps[-1] < 1:
+                # Bumping small slices to one step left the last slice empty
+                steps = [total_steps // num_orders] * (num_orders - 1)
+                steps.append(total_steps - sum(steps))
+            sizes = [float(n * step) for n in steps]
         
-        logger.debug(f"Order sizes calculated: {[f'{s:.6f}' for s in sizes]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Order sizes calculated: %s", [f'{s:.6f}' for s in sizes])
         return sizes
     
-    def _calculate_wait_time(self, base_interval: int, randomize: bool) -> int:
-        """Calculate wait time with optional randomization"""
-        import random
-        
+    def _calculate_wait_times(
+        self,
+        base_interval: int,
+        count: int,
+        randomize: bool
+    ) -> List[int]:
+        """Calculate all wait times up front with optional randomization"""
         if not randomize:
-            return base_interval
+            return [base_interval] * count
         
-        # Add ±20% variance
+        # Add ±20% variance, minimum 1 second
         variance = base_interval * 0.2
-        wait_time = base_interval + random.uniform(-variance, variance)
-        
-        return max(1, int(wait_time))  # Minimum 1 second
+        waits = base_interval + _rng.uniform(-variance, variance, size=count)
+        return np.maximum(1, waits.astype(int)).tolist()
     
     def _get_adaptive_limit_price(
         self, 
@@ -225,22 +431,73 @@ class TWAPExecutor:
     ) -> float:
         """
         Get adaptive limit price based on current market
-        Updates limit price to stay competitive
+        Updates limit price to stay competitive, re-deriving it only once the
+        market has moved ADAPTIVE_REPRICE_THRESHOLD from the last reference
         """
-        current_price = self.client.get_current_price(symbol)
+        current_price = self.client.get_current_price(symbol, max_age=ADAPTIVE_PRICE_MAX_AGE)
         
         if not current_price:
             return base_limit_price
         
+        reference = self._adaptive_prices.get(symbol)
+        if reference and abs(current_price - reference[0]) <= reference[0] * ADAPTIVE_REPRICE_THRESHOLD:
+            return reference[1]
+        
         # Adjust limit price to be slightly better than market
         if side == "BUY":
             # For buy, place slightly above market to increase fill probability
-            adaptive_price = current_price * 1.001  # 0.1% above market
-            return min(adaptive_price, base_limit_price)
+            adaptive_price = min(current_price * 1.001, base_limit_price)  # 0.1% above market
         else:  # SELL
             # For sell, place slightly below market
-            adaptive_price = current_price * 0.999  # 0.1% below market
-            return max(adaptive_price, base_limit_price)
+            adaptive_price = max(current_price * 0.999, base_limit_price)  # 0.1% below market
+        
+        self._adaptive_prices[symbol] = (current_price, adaptive_price)
+        return adaptive_price
+    
+    def _chunk_params(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: float,
+        price: float = None
+    ) -> Dict:
+        """Build the order parameters for one chunk"""
+        params = {
+            'symbol': symbol,
+            'side': side,
+            'type': order_type,
+            'quantity': quantity,
+        }
+        if order_type == "LIMIT":
+            params['price'] = price
+            params['timeInForce'] = 'IOC'  # Immediate or Cancel
+        return params
+    
+    def _log_chunk(self, params: Dict, order: Dict):
+        """Log an accepted chunk order"""
+        log_trade(
+            logger,
+            order_type=params['type'],
+            symbol=params['symbol'],
+            side=params['side'],
+            quantity=params['quantity'],
+            price=params.get('price'),
+            order_id=order.get('orderId'),
+            status=order.get('status')
+        )
+    
+    def _submit_chunk(self, params: Dict) -> Optional[Dict]:
+        """Submit one chunk order; inputs were validated once in execute_twap"""
+        try:
+            throttle_order()
+            order = self.client.client.futures_create_order(**params)
+        except BinanceAPIException as e:
+            logger.error("Binance API Error: %s (Code: %s)", e.message, e.code)
+            return None
+        
+        self._log_chunk(params, order)
+        return order
     
     def _execute_market_chunk(
         self, 
@@ -249,10 +506,9 @@ class TWAPExecutor:
         quantity: float
     ) -> Optional[Dict]:
         """Execute a single market order chunk"""
-        from src.core.market_orders import MarketOrderExecutor
-        
-        executor = MarketOrderExecutor(testnet=self.client.testnet)
-        return executor.execute_market_order(symbol, side, quantity)
+        return self._submit_chunk(
+            self._chunk_params(symbol, side, "MARKET", quantity)
+        )
     
     def _execute_limit_chunk(
         self, 
@@ -262,55 +518,102 @@ class TWAPExecutor:
         price: float
     ) -> Optional[Dict]:
         """Execute a single limit order chunk"""
-        from src.core.limit_orders import LimitOrderExecutor
-        
-        executor = LimitOrderExecutor(testnet=self.client.testnet)
-        return executor.execute_limit_order(
-            symbol, side, quantity, price, time_in_force="IOC"  # Immediate or Cancel
+        return self._submit_chunk(
+            self._chunk_params(symbol, side, "LIMIT", quantity, price)
         )
     
-    def _display_execution_summary(self, orders: List[Dict], total_quantity: float):
-        """Display TWAP execution summary"""
-        from tabulate import tabulate
+    def _execute_batch_chunk(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantities: List[float],
+        price: float = None
+    ) -> List[Optional[Dict]]:
+        """Execute several order chunks in one batchOrders request"""
+        orders = [
+            self._chunk_params(symbol, side, order_type, quantity, price)
+            for quantity in quantities
+        ]
+        
+        results = []
+        for params, order in zip(orders, self.client.place_batch_orders(orders)):
+            if 'code' in order:
+                logger.error("Batch order rejected: %s (Code: %s)", order.get('msg'), order.get('code'))
+                results.append(None)
+                continue
+            
+            self._log_chunk(params, order)
+            results.append(order)
         
-        if not orders:
+        return results
+    
+    def _display_execution_summary(self, records: List[Tuple], total_quantity: float):
+        """Display TWAP execution summary from execution_history records"""
+        if not records:
             logger.warning("No orders executed")
             return
         
-        executed_qty = sum(float(o.get('executedQty', 0)) for o in orders)
+        if self.quiet:
+            return
+        
+        executed_qty = sum(record[3] for record in records)
         avg_price = sum(
-            float(o.get('avgPrice', 0)) * float(o.get('executedQty', 0)) 
-            for o in orders
+            qty * price for _, _, _, qty, price, _ in records
         ) / executed_qty if executed_qty > 0 else 0
         
-        print("\n" + "="*60)
-        print("📊 TWAP EXECUTION SUMMARY")
-        print("="*60)
-        print(f"Total Orders Placed: {len(orders)}")
-        print(f"Target Quantity: {total_quantity}")
-        print(f"Executed Quantity: {executed_qty}")
-        print(f"Fill Rate: {(executed_qty/total_quantity)*100:.2f}%")
-        print(f"Average Price: {avg_price}")
-        print("="*60)
-        
         # Detail table
-        detail_data = []
-        for i, order in enumerate(orders, 1):
-            detail_data.append([
+        # Monotonic timestamps are converted to wall-clock only for display
+        wall_offset = time.time() - time.monotonic_ns() / NS_PER_SECOND
+        details = "\n".join(
+            DETAIL_ROW.format(
                 i,
-                order.get('orderId', 'N/A'),
-                order.get('executedQty', 'N/A'),
-                order.get('avgPrice', 'N/A'),
-                order.get('status', 'N/A')
-            ])
+                datetime.fromtimestamp(wall_offset + ts / NS_PER_SECOND).strftime('%H:%M:%S'),
+                order_id, qty, price, status
+            )
+            for i, (ts, _, order_id, qty, price, status) in enumerate(records, 1)
+        )
         
-        print("\nOrder Details:")
-        print(tabulate(
-            detail_data,
-            headers=['#', 'Order ID', 'Quantity', 'Avg Price', 'Status'],
-            tablefmt='simple'
-        ))
-        print("="*60 + "\n")
+        print(
+            f"\n{DIVIDER}\n"
+            f"📊 TWAP EXECUTION SUMMARY\n"
+            f"{DIVIDER}\n"
+            f"Total Orders Placed: {len(records)}\n"
+            f"Target Quantity: {total_quantity}\n"
+            f"Executed Quantity: {executed_qty}\n"
+            f"Fill Rate: {(executed_qty/total_quantity)*100:.2f}%\n"
+            f"Average Price: {avg_price}\n"
+            f"{DIVIDER}\n"
+            f"\nOrder Details:\n"
+            f"{DETAIL_HEADER}\n"
+            f"{details}\n"
+            f"{DIVIDER}\n"
+        )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the TWAP CLI parser"""
+    parser = argparse.ArgumentParser(
+        prog="python src/advanced/twap.py",
+        description="Split a large order into smaller chunks executed over time"
+    )
+    parser.add_argument('symbol', help="Trading pair (e.g., BTCUSDT)")
+    parser.add_argument('side', help="BUY or SELL")
+    parser.add_argument('total_quantity', type=float, help="Total quantity to execute")
+    parser.add_argument('num_orders', type=int, help="Number of orders to split into")
+    parser.add_argument('interval_seconds', type=int, help="Seconds between orders")
+    parser.add_argument('--limit', type=float, metavar='PRICE', help="Use limit orders at specified price")
+    parser.add_argument('--randomize', action='store_true', help="Randomize timing and quantities")
+    parser.add_argument('--randomize-time', action='store_true', help="Only randomize timing")
+    parser.add_argument('--randomize-qty', action='store_true', help="Only randomize quantities")
+    parser.add_argument('--batch', type=int, default=1, metavar='N',
+                        help=f"Submit N sub-slices per interval in one request (max {BATCH_ORDER_LIMIT})")
+    parser.add_argument('--no-summary', action='store_true', help="Skip the execution summary table")
+    parser.add_argument('--poll', action='store_true', help="Report fills from REST acks instead of the user-data stream")
+    return parser
+
+
+_parser = _build_parser()
 
 
 def main():
@@ -336,38 +639,28 @@ def main():
         print("  --randomize         - Randomize timing and quantities")
         print("  --randomize-time    - Only randomize timing")
         print("  --randomize-qty     - Only randomize quantities")
+        print(f"  --batch <N>         - Submit N sub-slices per interval in one request (max {BATCH_ORDER_LIMIT})")
+        print("  --no-summary        - Skip the execution summary table")
+        print("  --poll              - Report fills from REST acks instead of the user-data stream")
         print("\n")
         sys.exit(1)
     
-    symbol = sys.argv[1]
-    side = sys.argv[2]
-    total_quantity = float(sys.argv[3])
-    num_orders = int(sys.argv[4])
-    interval_seconds = int(sys.argv[5])
-    
-    # Parse options
-    order_type = "MARKET"
-    limit_price = None
-    randomize_timing = False
-    randomize_quantity = False
-    
-    if '--limit' in sys.argv:
-        order_type = "LIMIT"
-        limit_idx = sys.argv.index('--limit')
-        if limit_idx + 1 < len(sys.argv):
-            limit_price = float(sys.argv[limit_idx + 1])
+    args = _parser.parse_args()
+    symbol = args.symbol
+    side = args.side
+    total_quantity = args.total_quantity
+    num_orders = args.num_orders
+    interval_seconds = args.interval_seconds
     
-    if '--randomize' in sys.argv:
-        randomize_timing = True
-        randomize_quantity = True
-    else:
-        if '--randomize-time' in sys.argv:
-            randomize_timing = True
-        if '--randomize-qty' in sys.argv:
-            randomize_quantity = True
+    # Resolve options
+    order_type = "LIMIT" if args.limit is not None else "MARKET"
+    limit_price = args.limit
+    randomize_timing = args.randomize or args.randomize_time
+    randomize_quantity = args.randomize or args.randomize_qty
+    batch_size = args.batch
     
     try:
-        executor = TWAPExecutor()
+        executor = TWAPExecutor(quiet=args.no_summary)
         
         # Confirm execution
         print("\n⚠️  TWAP Execution Plan:")
@@ -379,7 +672,10 @@ def main():
         print(f"   Order Type: {order_type}")
         if limit_price:
             print(f"   Limit Price: {limit_price}")
-        print(f"   Total Time: ~{(num_orders-1)*interval_seconds}s ({((num_orders-1)*interval_seconds)/60:.1f} minutes)")
+        if batch_size > 1:
+            print(f"   Batch Size: {batch_size}")
+        num_ticks = -(-num_orders // max(1, batch_size))
+        print(f"   Total Time: ~{(num_ticks-1)*interval_seconds}s ({((num_ticks-1)*interval_seconds)/60:.1f} minutes)")
         
         response = input("\nProceed with execution? (yes/no): ")
         if response.lower() not in ['yes', 'y']:
@@ -397,7 +693,9 @@ def main():
             order_type=order_type,
             limit_price=limit_price,
             randomize_timing=randomize_timing,
-            randomize_quantity=randomize_quantity
+            randomize_quantity=randomize_quantity,
+            batch_size=batch_size,
+            use_websocket=not args.poll
         )
         
         if executed_orders:
@@ -3,12 +3,20 @@ Limit Orders Module
 Place orders at specific price levels with control over execution
 """
 
+import asyncio
+import logging
 import sys
-from typing import Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from operator import itemgetter
+from typing import Optional, Dict, List
 from binance.exceptions import BinanceAPIException
 
-from src.utils.client import get_client
+from src.advanced.stop_limit import StopLimitOrderExecutor
+from src.utils.cli import build_order_parser
+from src.utils.client import get_client, resolve_testnet, BinanceFuturesAsyncClient
 from src.utils.logger import setup_logger, log_trade, log_error
+from src.utils.rate_limit import throttle_order
 from src.utils.validators import (
     validate_symbol, validate_side, validate_quantity, 
     validate_price, validate_time_in_force
@@ -16,20 +24,87 @@ from src.utils.validators import (
 
 logger = setup_logger("LimitOrders")
 
+# Prices younger than this (seconds) are reused for the reference price log
+PRICE_CHECK_MAX_AGE = 0.5
+
+# Limit prices further than this fraction from market trigger a warning
+PRICE_WARN_THRESHOLD_FRAC = 0.10
+
+DIVIDER = "=" * 50
+SUMMARY_ROW = "{:<14} {}"
+SUMMARY_FIELDS = (
+    ("Order ID", 'orderId'),
+    ("Symbol", 'symbol'),
+    ("Side", 'side'),
+    ("Type", 'type'),
+    ("Quantity", 'origQty'),
+    ("Price", 'price'),
+    ("Status", 'status'),
+    ("Time in Force", 'timeInForce'),
+    ("Update Time", 'updateTime'),
+)
+SUMMARY_LABELS, SUMMARY_KEYS = zip(*SUMMARY_FIELDS)
+
+# Reads every summary field in one call; fields missing from a response show N/A
+_SUMMARY_DEFAULTS = dict.fromkeys(SUMMARY_KEYS, 'N/A')
+_summary_values = itemgetter(*SUMMARY_KEYS)
+
+# Binance error code for an unknown order ID
+ORDER_NOT_FOUND = -2013
+
+# Binance errors rejecting an in-place amend that a cancel-and-replace can still
+# carry out: -5025 only limit orders can be modified, -5026 the order reached its
+# modification limit (USDⓈ-M Futures API docs, "Error Codes", 50xx section)
+AMEND_FALLBACK_CODES = frozenset({-5025, -5026})
+
+# Binance error when an amend changes nothing ("No need to modify the order")
+AMEND_UNCHANGED = -5027
+
+# Statuses of an order still resting on the book
+OPEN_STATUSES = {'NEW', 'PARTIALLY_FILLED'}
+
+# Orders an async executor keeps in flight at once
+ASYNC_MAX_IN_FLIGHT = 10
+
+
+def _log_api_error(e: BinanceAPIException):
+    """Log a rejected limit order with a hint for the common error codes"""
+    logger.error("Binance API Error: %s (Code: %s)", e.message, e.code)
+    if e.code == -2019:
+        logger.error("Insufficient margin. Please add funds or reduce position size.")
+    elif e.code == -1111:
+        logger.error("Invalid precision. Check symbol filters for quantity/price.")
+    elif e.code == -4061:
+        logger.error("Order price is outside allowable range.")
+
 
 class LimitOrderExecutor:
     """Execute limit orders on Binance Futures"""
     
-    def __init__(self, testnet: bool = None):
+    # Fixed order fields, copied and filled in per order
+    _LIMIT_TMPL = {'type': 'LIMIT'}
+    
+    def __init__(self, testnet: bool = None, quiet: bool = False, base_url: str = None):
         """
         Initialize limit order executor
         
         Args:
             testnet: Use testnet if True
+            quiet: Skip printing order summaries if True
+            base_url: Futures REST host to use (e.g., https://fapi1.binance.com)
         """
-        self.client = get_client(testnet)
+        self.client = get_client(testnet, base_url)
+        self.quiet = quiet
+        
+        # Open the connection now so the first order skips the TLS handshake
+        self.client.warm_connection()
         logger.info("Limit Order Executor initialized")
     
+    @cached_property
+    def _stop_executor(self) -> StopLimitOrderExecutor:
+        """Stop executor for bracket stop losses, created on first use"""
+        return StopLimitOrderExecutor(quiet=self.quiet)
+    
     def execute_limit_order(
         self,
         symbol: str,
@@ -39,7 +114,8 @@ class LimitOrderExecutor:
         time_in_force: str = "GTC",
         reduce_only: bool = False,
         position_side: str = "BOTH",
-        post_only: bool = False
+        post_only: bool = False,
+        skip_price_check: bool = False
     ) -> Optional[Dict]:
         """
         Execute a limit order
@@ -54,64 +130,114 @@ class LimitOrderExecutor:
             reduce_only: If True, order will only reduce position
             position_side: BOTH, LONG, or SHORT
             post_only: If True, order will only be maker (GTX)
+            skip_price_check: If True, skip the current price comparison
         
         Returns:
             Order response dictionary or None if failed
         """
         try:
             # Validate inputs
-            symbol = validate_symbol(symbol)
-            side = validate_side(side)
-            quantity = validate_quantity(quantity, symbol)
-            price = validate_price(price, symbol)
-            
-            if post_only:
-                time_in_force = "GTX"
-            else:
-                time_in_force = validate_time_in_force(time_in_force)
-            
-            logger.info(f"Placing limit order: {side} {quantity} {symbol} @ {price}")
-            
-            # Get current price for comparison
-            current_price = self.client.get_current_price(symbol)
-            if current_price:
-                price_diff = ((price - current_price) / current_price) * 100
-                logger.info(f"Current price: {current_price} (Limit {price_diff:+.2f}% from market)")
-                
-                # Warn if price is far from market
-                if abs(price_diff) > 10:
-                    logger.warning(f"⚠️  Limit price is {abs(price_diff):.2f}% from market price")
-            
-            # Prepare order parameters
-            order_params = {
-                'symbol': symbol,
-                'side': side,
-                'type': 'LIMIT',
-                'quantity': quantity,
-                'price': price,
-                'timeInForce': time_in_force,
-                'positionSide': position_side,
-            }
-            
-            if reduce_only:
-                order_params['reduceOnly'] = 'true'
+            order_params = self._build_limit_params(
+                symbol, side, quantity, price, time_in_force,
+                reduce_only, position_side, post_only
+            )
+            
+            logger.info(
+                "Placing limit order: %s %s %s @ %s",
+                order_params['side'], order_params['quantity'],
+                order_params['symbol'], order_params['price']
+            )
             
+            if not skip_price_check:
+                self._check_against_market(order_params)
+            
+        except Exception as e:
+            log_error(logger, e, "Limit order execution failed")
+            return None
+        
+        return self._send_limit(order_params)
+    
+    def _execute_limit_reduce_only(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        price: float,
+        position_side: str = "BOTH"
+    ) -> Optional[Dict]:
+        """Reduce-only GTC entry point for exits; skips the market distance check"""
+        try:
+            order_params = self._LIMIT_TMPL.copy()
+            order_params.update(
+                symbol=validate_symbol(symbol),
+                side=validate_side(side),
+                quantity=validate_quantity(quantity, symbol),
+                price=validate_price(price, symbol),
+                timeInForce='GTC',
+                positionSide=position_side,
+                reduceOnly='true',
+            )
+        except Exception as e:
+            log_error(logger, e, "Limit order execution failed")
+            return None
+        
+        return self._send_limit(order_params)
+    
+    def _check_against_market(self, order_params: Dict):
+        """Log the limit price against the current price, warning if far away"""
+        # Both lines would be filtered out, so skip the price lookup entirely
+        if not logger.isEnabledFor(logging.WARNING):
+            return
+        
+        symbol = order_params['symbol']
+        price = order_params['price']
+        
+        # Get current price for comparison
+        current_price = self.client.get_current_price(symbol, max_age=PRICE_CHECK_MAX_AGE)
+        if not current_price:
+            return
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Current price: %s (Limit %+.2f%% from market)",
+                current_price, (price - current_price) / current_price * 100
+            )
+        
+        # Warn if price is far from market
+        if abs(price - current_price) > current_price * PRICE_WARN_THRESHOLD_FRAC:
+            logger.warning(
+                "⚠️  Limit price is %.2f%% from market price",
+                abs(price - current_price) / current_price * 100
+            )
+    
+    def _send_limit(self, order_params: Dict) -> Optional[Dict]:
+        """
+        Submit validated limit order parameters, log the trade and show the summary
+        
+        Args:
+            order_params: Parameters built by _build_limit_params or an entry point
+        
+        Returns:
+            Order response dictionary or None if failed
+        """
+        try:
             # Execute order
-            logger.debug(f"Order parameters: {order_params}")
+            logger.debug("Order parameters: %s", order_params)
+            throttle_order()
             order_response = self.client.client.futures_create_order(**order_params)
             
             # Log successful trade
             log_trade(
                 logger,
                 order_type='LIMIT',
-                symbol=symbol,
-                side=side,
-                quantity=quantity,
-                price=price,
+                symbol=order_params['symbol'],
+                side=order_params['side'],
+                quantity=order_params['quantity'],
+                price=order_params['price'],
                 order_id=order_response.get('orderId'),
                 status=order_response.get('status'),
-                time_in_force=time_in_force,
-                reduce_only=reduce_only
+                time_in_force=order_params['timeInForce'],
+                reduce_only='reduceOnly' in order_params
             )
             
             # Display order summary
@@ -120,40 +246,65 @@ class LimitOrderExecutor:
             return order_response
             
         except BinanceAPIException as e:
-            logger.error(f"Binance API Error: {e.message} (Code: {e.code})")
-            if e.code == -2019:
-                logger.error("Insufficient margin. Please add funds or reduce position size.")
-            elif e.code == -1111:
-                logger.error("Invalid precision. Check symbol filters for quantity/price.")
-            elif e.code == -4061:
-                logger.error("Order price is outside allowable range.")
+            _log_api_error(e)
             return None
             
         except Exception as e:
             log_error(logger, e, "Limit order execution failed")
             return None
     
+    def _build_limit_params(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        price: float,
+        time_in_force: str = "GTC",
+        reduce_only: bool = False,
+        position_side: str = "BOTH",
+        post_only: bool = False
+    ) -> Dict:
+        """
+        Validate inputs and build limit order parameters (no network call)
+        
+        Returns:
+            Order parameter dictionary for futures_create_order/batchOrders
+        """
+        symbol = validate_symbol(symbol)
+        side = validate_side(side)
+        quantity = validate_quantity(quantity, symbol)
+        price = validate_price(price, symbol)
+        
+        if post_only:
+            time_in_force = "GTX"
+        else:
+            time_in_force = validate_time_in_force(time_in_force)
+        
+        order_params = self._LIMIT_TMPL.copy()
+        order_params.update(
+            symbol=symbol,
+            side=side,
+            quantity=quantity,
+            price=price,
+            timeInForce=time_in_force,
+            positionSide=position_side,
+        )
+        
+        if reduce_only:
+            order_params['reduceOnly'] = 'true'
+        
+        return order_params
+    
     def _display_order_summary(self, order: Dict):
         """Display formatted order summary"""
-        from tabulate import tabulate
-        
-        summary_data = [
-            ["Order ID", order.get('orderId', 'N/A')],
-            ["Symbol", order.get('symbol', 'N/A')],
-            ["Side", order.get('side', 'N/A')],
-            ["Type", order.get('type', 'N/A')],
-            ["Quantity", order.get('origQty', 'N/A')],
-            ["Price", order.get('price', 'N/A')],
-            ["Status", order.get('status', 'N/A')],
-            ["Time in Force", order.get('timeInForce', 'N/A')],
-            ["Update Time", order.get('updateTime', 'N/A')],
-        ]
-        
-        print("\n" + "="*50)
-        print("📊 LIMIT ORDER SUMMARY")
-        print("="*50)
-        print(tabulate(summary_data, tablefmt="simple"))
-        print("="*50 + "\n")
+        if self.quiet:
+            return
+        
+        rows = "\n".join(
+            SUMMARY_ROW.format(label, value)
+            for label, value in zip(SUMMARY_LABELS, _summary_values({**_SUMMARY_DEFAULTS, **order}))
+        )
+        print(f"\n{DIVIDER}\n📊 LIMIT ORDER SUMMARY\n{DIVIDER}\n{rows}\n{DIVIDER}\n")
     
     def modify_limit_order(
         self,
@@ -172,47 +323,94 @@ class LimitOrderExecutor:
             new_price: New price (optional)
         
         Returns:
-            New order response or None
+            Modified (or replacement) order response or None
         """
         try:
             symbol = validate_symbol(symbol)
             
             # Get existing order details
-            orders = self.client.get_open_orders(symbol)
-            existing_order = None
+            try:
+                existing_order = self.client.client.futures_get_order(symbol=symbol, orderId=order_id)
+            except BinanceAPIException as e:
+                if e.code != ORDER_NOT_FOUND:
+                    raise
+                existing_order = None
             
-            for order in orders:
-                if order['orderId'] == order_id:
-                    existing_order = order
-                    break
-            
-            if not existing_order:
-                logger.error(f"Order {order_id} not found or already filled/cancelled")
+            if not existing_order or existing_order.get('status') not in OPEN_STATUSES:
+                logger.error("Order %s not found or already filled/cancelled", order_id)
                 return None
             
-            # Cancel existing order
-            logger.info(f"Cancelling order {order_id} to modify...")
-            if not self.client.cancel_order(symbol, order_id):
-                return None
+            quantity = validate_quantity(
+                new_quantity if new_quantity else float(existing_order['origQty']), symbol
+            )
+            price = validate_price(
+                new_price if new_price else float(existing_order['price']), symbol
+            )
             
-            # Place new order with modified parameters
-            quantity = new_quantity if new_quantity else float(existing_order['origQty'])
-            price = new_price if new_price else float(existing_order['price'])
+            # Amend in place (PUT /fapi/v1/order): one round trip, and the order
+            # keeps its queue priority unless the price changes
+            logger.info("Modifying order %s: %s @ %s", order_id, quantity, price)
+            try:
+                throttle_order()
+                order_response = self.client.client._request_futures_api(
+                    'put', 'order', True,
+                    data={
+                        'symbol': symbol,
+                        'orderId': order_id,
+                        'side': existing_order['side'],
+                        'quantity': quantity,
+                        'price': price,
+                    }
+                )
+            except BinanceAPIException as e:
+                if e.code == AMEND_UNCHANGED:
+                    logger.info("Order %s already at %s @ %s, nothing to modify", order_id, quantity, price)
+                    return existing_order
+                if e.code not in AMEND_FALLBACK_CODES:
+                    raise
+                logger.warning("In-place amend not supported (%s), cancelling and replacing", e.message)
+                return self._cancel_and_replace(existing_order, quantity, price)
             
-            logger.info(f"Placing modified order...")
-            return self.execute_limit_order(
+            log_trade(
+                logger,
+                order_type='LIMIT_MODIFY',
                 symbol=symbol,
                 side=existing_order['side'],
                 quantity=quantity,
                 price=price,
-                time_in_force=existing_order.get('timeInForce', 'GTC'),
-                position_side=existing_order.get('positionSide', 'BOTH')
+                order_id=order_response.get('orderId'),
+                status=order_response.get('status')
             )
             
+            self._display_order_summary(order_response)
+            
+            return order_response
+            
         except Exception as e:
             log_error(logger, e, "Failed to modify order")
             return None
     
+    def _cancel_and_replace(self, existing_order: Dict, quantity: float, price: float) -> Optional[Dict]:
+        """Modify an order by cancelling it and placing a new one"""
+        symbol = existing_order['symbol']
+        order_id = existing_order['orderId']
+        
+        # Cancel existing order
+        logger.info("Cancelling order %s to modify...", order_id)
+        if not self.client.cancel_order(symbol, order_id):
+            return None
+        
+        # Place new order with modified parameters
+        logger.info("Placing modified order...")
+        return self.execute_limit_order(
+            symbol=symbol,
+            side=existing_order['side'],
+            quantity=quantity,
+            price=price,
+            time_in_force=existing_order.get('timeInForce', 'GTC'),
+            position_side=existing_order.get('positionSide', 'BOTH')
+        )
+    
     def place_bracket_orders(
         self,
         symbol: str,
@@ -220,7 +418,8 @@ class LimitOrderExecutor:
         quantity: float,
         entry_price: float,
         take_profit_price: float,
-        stop_loss_price: float
+        stop_loss_price: float,
+        use_batch: bool = True
     ) -> Dict[str, Optional[Dict]]:
         """
         Place entry order with take profit and stop loss
@@ -232,101 +431,299 @@ class LimitOrderExecutor:
             entry_price: Entry limit price
             take_profit_price: Take profit target
             stop_loss_price: Stop loss price
+            use_batch: Send all three orders in one batchOrders request if True,
+                otherwise place the entry, then take profit and stop loss concurrently
         
         Returns:
             Dictionary with entry, take_profit, and stop_loss order responses
         """
         try:
-            logger.info(f"Placing bracket orders for {symbol}")
+            logger.info("Placing bracket orders for %s", symbol)
+            stop_executor = self._stop_executor
             
-            # Place entry order
-            entry_order = self.execute_limit_order(
-                symbol=symbol,
-                side=entry_side,
-                quantity=quantity,
-                price=entry_price
+            entry_params = self._build_limit_params(symbol, entry_side, quantity, entry_price)
+            
+            # Determine exit side (opposite of entry)
+            exit_side = 'SELL' if entry_params['side'] == 'BUY' else 'BUY'
+            
+            take_profit_params = self._build_limit_params(
+                symbol, exit_side, quantity, take_profit_price, reduce_only=True
+            )
+            stop_loss_params = stop_executor._build_stop_market_params(
+                symbol, exit_side, quantity, stop_loss_price, reduce_only=True
             )
             
-            if not entry_order:
+            if not use_batch:
+                return self._place_bracket_sequential(
+                    stop_executor, entry_params, exit_side, take_profit_price, stop_loss_price
+                )
+            
+            # Entry, take profit and stop loss go out in one batchOrders request
+            batch = [entry_params, take_profit_params, stop_loss_params]
+            responses = self.client.place_batch_orders(batch)
+            
+            orders = {}
+            displays = (self._display_order_summary, self._display_order_summary,
+                        stop_executor._display_order_summary)
+            for key, params, order, display in zip(
+                ('entry', 'take_profit', 'stop_loss'), batch, responses, displays
+            ):
+                if 'code' in order:
+                    logger.error("%s order rejected: %s (Code: %s)", key, order.get('msg'), order.get('code'))
+                    orders[key] = None
+                    continue
+                
+                log_trade(
+                    logger,
+                    order_type=params['type'],
+                    symbol=params['symbol'],
+                    side=params['side'],
+                    quantity=params['quantity'],
+                    price=params.get('price'),
+                    stop_price=params.get('stopPrice'),
+                    order_id=order.get('orderId'),
+                    status=order.get('status'),
+                    reduce_only=params.get('reduceOnly') == 'true'
+                )
+                display(order)
+                orders[key] = order
+            
+            if not orders['entry']:
+                # Exits without an entry must not stay on the book
+                exit_ids = [o['orderId'] for o in (orders['take_profit'], orders['stop_loss']) if o]
+                if exit_ids:
+                    self.client.cancel_orders(entry_params['symbol'], exit_ids)
                 logger.error("Entry order failed, aborting bracket orders")
                 return {'entry': None, 'take_profit': None, 'stop_loss': None}
             
-            # Determine exit side (opposite of entry)
-            exit_side = 'SELL' if entry_side == 'BUY' else 'BUY'
+            logger.info("✓ Bracket orders placed successfully")
+            
+            return orders
             
-            # Place take profit order
-            logger.info("Placing take profit order...")
-            take_profit_order = self.execute_limit_order(
+        except Exception as e:
+            log_error(logger, e, "Failed to place bracket orders")
+            return {'entry': None, 'take_profit': None, 'stop_loss': None}
+    
+    def _place_bracket_sequential(
+        self,
+        stop_executor,
+        entry_params: Dict,
+        exit_side: str,
+        take_profit_price: float,
+        stop_loss_price: float
+    ) -> Dict[str, Optional[Dict]]:
+        """Place the entry, then submit take profit and stop loss on two threads"""
+        symbol = entry_params['symbol']
+        quantity = entry_params['quantity']
+        
+        entry_order = self.execute_limit_order(
+            symbol=symbol,
+            side=entry_params['side'],
+            quantity=quantity,
+            price=entry_params['price']
+        )
+        
+        if not entry_order:
+            logger.error("Entry order failed, aborting bracket orders")
+            return {'entry': None, 'take_profit': None, 'stop_loss': None}
+        
+        # Both exits only depend on the entry, so their round trips overlap
+        logger.info("Placing take profit and stop loss orders...")
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="bracket") as pool:
+            take_profit_future = pool.submit(
+                self._execute_limit_reduce_only,
+                symbol, exit_side, quantity, take_profit_price
+            )
+            stop_loss_future = pool.submit(
+                stop_executor.execute_stop_market_order,
                 symbol=symbol,
                 side=exit_side,
                 quantity=quantity,
-                price=take_profit_price,
+                stop_price=stop_loss_price,
                 reduce_only=True
             )
+        
+        logger.info("✓ Bracket orders placed successfully")
+        
+        return {
+            'entry': entry_order,
+            'take_profit': take_profit_future.result(),
+            'stop_loss': stop_loss_future.result()
+        }
+
+
+class AsyncLimitOrderExecutor:
+    """
+    Submit limit orders concurrently over one aiohttp session
+    
+    Concurrency only pays off because AsyncClient's HTTP layer is non-blocking:
+    gathered orders overlap their round trips instead of queueing on one socket.
+    Use as ``async with AsyncLimitOrderExecutor() as executor: ...``
+    """
+    
+    # Params and summaries are built exactly as in the sync executor
+    _LIMIT_TMPL = LimitOrderExecutor._LIMIT_TMPL
+    _build_limit_params = LimitOrderExecutor._build_limit_params
+    _display_order_summary = LimitOrderExecutor._display_order_summary
+    
+    def __init__(self, testnet: bool = None, quiet: bool = False):
+        """
+        Initialize async limit order executor (connects on first use)
+        
+        Args:
+            testnet: Use testnet if True
+            quiet: Skip printing order summaries if True
+        """
+        self.testnet = resolve_testnet(testnet)
+        self.quiet = quiet
+        self.client: Optional[BinanceFuturesAsyncClient] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+    
+    async def connect(self):
+        """Open the async client session"""
+        if self.client is None:
+            self.client = await BinanceFuturesAsyncClient.create(self.testnet)
+            self._in_flight = asyncio.Semaphore(ASYNC_MAX_IN_FLIGHT)
+            logger.info("Async Limit Order Executor initialized")
+    
+    async def close(self):
+        """Close the async client session"""
+        if self.client:
+            await self.client.close()
+            self.client = None
+    
+    async def __aenter__(self) -> 'AsyncLimitOrderExecutor':
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def execute_limit_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        price: float,
+        time_in_force: str = "GTC",
+        reduce_only: bool = False,
+        position_side: str = "BOTH",
+        post_only: bool = False
+    ) -> Optional[Dict]:
+        """
+        Place a limit order without blocking the event loop
+        
+        Args:
+            symbol: Trading pair (e.g., BTCUSDT)
+            side: BUY or SELL
+            quantity: Order quantity
+            price: Limit price
+            time_in_force: GTC, IOC, FOK, or GTX
+            reduce_only: If True, order will only reduce position
+            position_side: BOTH, LONG, or SHORT
+            post_only: If True, use GTX (Post-only)
+        
+        Returns:
+            Order response dictionary or None if failed
+        """
+        try:
+            await self.connect()
+            order_params = self._build_limit_params(
+                symbol, side, quantity, price, time_in_force, reduce_only, position_side, post_only
+            )
             
-            # Import here to avoid circular dependency
-            from src.advanced.stop_limit import StopLimitOrderExecutor
-            stop_executor = StopLimitOrderExecutor()
+            async with self._in_flight:
+                order_response = await self.client.create_order(order_params)
             
-            # Place stop loss order
-            logger.info("Placing stop loss order...")
-            stop_loss_order = stop_executor.execute_stop_market_order(
-                symbol=symbol,
-                side=exit_side,
-                quantity=quantity,
-                stop_price=stop_loss_price,
-                reduce_only=True
+            log_trade(
+                logger,
+                order_type='LIMIT',
+                symbol=order_params['symbol'],
+                side=order_params['side'],
+                quantity=order_params['quantity'],
+                price=order_params['price'],
+                order_id=order_response.get('orderId'),
+                status=order_response.get('status'),
+                time_in_force=order_params['timeInForce'],
+                reduce_only=reduce_only
             )
+            self._display_order_summary(order_response)
             
-            logger.info("✓ Bracket orders placed successfully")
+            return order_response
             
-            return {
-                'entry': entry_order,
-                'take_profit': take_profit_order,
-                'stop_loss': stop_loss_order
-            }
+        except BinanceAPIException as e:
+            _log_api_error(e)
+            return None
             
         except Exception as e:
-            log_error(logger, e, "Failed to place bracket orders")
-            return {'entry': None, 'take_profit': None, 'stop_loss': None}
+            log_error(logger, e, "Async limit order execution failed")
+            return None
+    
+    async def submit_many(self, orders: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Place several limit orders concurrently
+        
+        At most ASYNC_MAX_IN_FLIGHT requests are open at once, and every
+        order still waits on the shared rate limit buckets.
+        
+        Args:
+            orders: Keyword arguments for execute_limit_order, one dict per order
+        
+        Returns:
+            Order responses (None for failures) in input order
+        """
+        await self.connect()
+        return await asyncio.gather(*[self.execute_limit_order(**order) for order in orders])
+
+
+USAGE = """
+📖 Usage: python src/core/limit_orders.py <SYMBOL> <SIDE> <QUANTITY> <PRICE> [OPTIONS]
+
+Examples:
+  python src/core/limit_orders.py BTCUSDT BUY 0.01 95000
+  python src/core/limit_orders.py ETHUSDT SELL 0.1 3500 --post-only
+
+Arguments:
+  SYMBOL    - Trading pair (e.g., BTCUSDT, ETHUSDT)
+  SIDE      - BUY or SELL
+  QUANTITY  - Order quantity (must be > 0)
+  PRICE     - Limit price
+
+Options:
+  --post-only      - Ensure order is maker (GTX)
+  --reduce-only    - Only reduce existing position
+  --tif <GTC|IOC|FOK> - Time in force (default: GTC)
+  --no-summary        - Skip the order summary table
+"""
+
+_parser = build_order_parser(
+    "python src/core/limit_orders.py",
+    "Place limit orders on Binance Futures",
+    with_price=True
+)
+_parser.add_argument('--post-only', action='store_true', help="Ensure order is maker (GTX)")
+_parser.add_argument('--tif', default="GTC", help="Time in force: GTC, IOC or FOK (default: GTC)")
 
 
 def main():
     """CLI entry point for limit orders"""
     if len(sys.argv) < 5:
-        print("\n📖 Usage: python src/core/limit_orders.py <SYMBOL> <SIDE> <QUANTITY> <PRICE> [OPTIONS]")
-        print("\nExamples:")
-        print("  python src/core/limit_orders.py BTCUSDT BUY 0.01 95000")
-        print("  python src/core/limit_orders.py ETHUSDT SELL 0.1 3500 --post-only")
-        print("\nArguments:")
-        print("  SYMBOL    - Trading pair (e.g., BTCUSDT, ETHUSDT)")
-        print("  SIDE      - BUY or SELL")
-        print("  QUANTITY  - Order quantity (must be > 0)")
-        print("  PRICE     - Limit price")
-        print("\nOptions:")
-        print("  --post-only      - Ensure order is maker (GTX)")
-        print("  --reduce-only    - Only reduce existing position")
-        print("  --tif <GTC|IOC|FOK> - Time in force (default: GTC)")
-        print("\n")
+        print(USAGE)
         sys.exit(1)
     
-    symbol = sys.argv[1]
-    side = sys.argv[2]
-    quantity = float(sys.argv[3])
-    price = float(sys.argv[4])
+    args = _parser.parse_args()
+    symbol = args.symbol
+    side = args.side
+    quantity = args.quantity
+    price = args.price
     
     # Parse options
-    post_only = '--post-only' in sys.argv
-    reduce_only = '--reduce-only' in sys.argv
-    
-    time_in_force = "GTC"
-    if '--tif' in sys.argv:
-        tif_index = sys.argv.index('--tif')
-        if tif_index + 1 < len(sys.argv):
-            time_in_force = sys.argv[tif_index + 1]
+    post_only = args.post_only
+    reduce_only = args.reduce_only
+    time_in_force = args.tif
     
     try:
-        executor = LimitOrderExecutor()
+        executor = LimitOrderExecutor(quiet=args.no_summary)
         result = executor.execute_limit_order(
             symbol=symbol,
             side=side,
@@ -3,28 +3,74 @@ Market Orders Module
 Executes immediate buy/sell orders at current market price
 """
 
+import asyncio
 import sys
-from typing import Optional, Dict
+from operator import itemgetter
+from typing import Optional, Dict, List
 from binance.exceptions import BinanceAPIException
 
-from src.utils.client import get_client
+from src.utils.cli import build_order_parser
+from src.utils.client import get_client, resolve_testnet, BinanceFuturesAsyncClient
 from src.utils.logger import setup_logger, log_trade, log_error
+from src.utils.rate_limit import throttle_order
 from src.utils.validators import validate_symbol, validate_side, validate_quantity
 
 logger = setup_logger("MarketOrders")
 
+# Prices younger than this (seconds) are reused for the reference price log
+PRICE_CHECK_MAX_AGE = 0.5
+
+DIVIDER = "=" * 50
+SUMMARY_ROW = "{:<14} {}"
+SUMMARY_FIELDS = (
+    ("Order ID", 'orderId'),
+    ("Symbol", 'symbol'),
+    ("Side", 'side'),
+    ("Type", 'type'),
+    ("Quantity", 'origQty'),
+    ("Status", 'status'),
+    ("Avg Price", 'avgPrice'),
+    ("Update Time", 'updateTime'),
+)
+SUMMARY_LABELS, SUMMARY_KEYS = zip(*SUMMARY_FIELDS)
+
+# Reads every summary field in one call; fields missing from a response show N/A
+_SUMMARY_DEFAULTS = dict.fromkeys(SUMMARY_KEYS, 'N/A')
+_summary_values = itemgetter(*SUMMARY_KEYS)
+
+# Orders an async executor keeps in flight at once
+ASYNC_MAX_IN_FLIGHT = 10
+
+
+def _log_api_error(e: BinanceAPIException):
+    """Log a rejected market order with a hint for the common error codes"""
+    logger.error("Binance API Error: %s (Code: %s)", e.message, e.code)
+    if e.code == -2019:
+        logger.error("Insufficient margin. Please add funds or reduce position size.")
+    elif e.code == -1111:
+        logger.error("Invalid quantity precision. Check symbol filters.")
+
 
 class MarketOrderExecutor:
     """Execute market orders on Binance Futures"""
     
-    def __init__(self, testnet: bool = None):
+    # Fixed order fields, copied and filled in per order
+    _MARKET_TMPL = {'type': 'MARKET'}
+    
+    def __init__(self, testnet: bool = None, quiet: bool = False, base_url: str = None):
         """
         Initialize market order executor
         
         Args:
             testnet: Use testnet if True
+            quiet: Skip printing order summaries if True
+            base_url: Futures REST host to use (e.g., https://fapi1.binance.com)
         """
-        self.client = get_client(testnet)
+        self.client = get_client(testnet, base_url)
+        self.quiet = quiet
+        
+        # Open the connection now so the first order skips the TLS handshake
+        self.client.warm_connection()
         logger.info("Market Order Executor initialized")
     
     def execute_market_order(
@@ -33,7 +79,8 @@ class MarketOrderExecutor:
         side: str,
         quantity: float,
         reduce_only: bool = False,
-        position_side: str = "BOTH"
+        position_side: str = "BOTH",
+        skip_price_check: bool = False
     ) -> Optional[Dict]:
         """
         Execute a market order
@@ -44,37 +91,28 @@ class MarketOrderExecutor:
             quantity: Order quantity
             reduce_only: If True, order will only reduce position
             position_side: BOTH, LONG, or SHORT (for hedge mode)
+            skip_price_check: If True, skip the reference price lookup
         
         Returns:
             Order response dictionary or None if failed
         """
         try:
-            # Validate inputs
-            symbol = validate_symbol(symbol)
-            side = validate_side(side)
-            quantity = validate_quantity(quantity, symbol)
+            order_params = self._build_market_params(symbol, side, quantity, reduce_only, position_side)
+            symbol = order_params['symbol']
+            side = order_params['side']
+            quantity = order_params['quantity']
             
-            logger.info(f"Executing market order: {side} {quantity} {symbol}")
+            logger.info("Executing market order: %s %s %s", side, quantity, symbol)
             
             # Get current price for reference
-            current_price = self.client.get_current_price(symbol)
-            if current_price:
-                logger.info(f"Current market price: {current_price}")
-            
-            # Prepare order parameters
-            order_params = {
-                'symbol': symbol,
-                'side': side,
-                'type': 'MARKET',
-                'quantity': quantity,
-                'positionSide': position_side,
-            }
-            
-            if reduce_only:
-                order_params['reduceOnly'] = 'true'
+            if not skip_price_check:
+                current_price = self.client.get_current_price(symbol, max_age=PRICE_CHECK_MAX_AGE)
+                if current_price:
+                    logger.info("Current market price: %s", current_price)
             
             # Execute order
-            logger.debug(f"Order parameters: {order_params}")
+            logger.debug("Order parameters: %s", order_params)
+            throttle_order()
             order_response = self.client.client.futures_create_order(**order_params)
             
             # Log successful trade
@@ -95,38 +133,52 @@ class MarketOrderExecutor:
             return order_response
             
         except BinanceAPIException as e:
-            logger.error(f"Binance API Error: {e.message} (Code: {e.code})")
-            if e.code == -2019:
-                logger.error("Insufficient margin. Please add funds or reduce position size.")
-            elif e.code == -1111:
-                logger.error("Invalid quantity precision. Check symbol filters.")
+            _log_api_error(e)
             return None
             
         except Exception as e:
             log_error(logger, e, "Market order execution failed")
             return None
     
+    def _build_market_params(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        reduce_only: bool = False,
+        position_side: str = "BOTH"
+    ) -> Dict:
+        """
+        Validate inputs and build market order parameters (no network call)
+        
+        Returns:
+            Order parameter dictionary for futures_create_order
+        """
+        symbol = validate_symbol(symbol)
+        
+        order_params = self._MARKET_TMPL.copy()
+        order_params.update(
+            symbol=symbol,
+            side=validate_side(side),
+            quantity=validate_quantity(quantity, symbol),
+            positionSide=position_side,
+        )
+        
+        if reduce_only:
+            order_params['reduceOnly'] = 'true'
+        
+        return order_params
+    
     def _display_order_summary(self, order: Dict):
         """Display formatted order summary"""
-        from tabulate import tabulate
-        
-        # Extract key information
-        summary_data = [
-            ["Order ID", order.get('orderId', 'N/A')],
-            ["Symbol", order.get('symbol', 'N/A')],
-            ["Side", order.get('side', 'N/A')],
-            ["Type", order.get('type', 'N/A')],
-            ["Quantity", order.get('origQty', 'N/A')],
-            ["Status", order.get('status', 'N/A')],
-            ["Avg Price", order.get('avgPrice', 'N/A')],
-            ["Update Time", order.get('updateTime', 'N/A')],
-        ]
-        
-        print("\n" + "="*50)
-        print("📊 ORDER SUMMARY")
-        print("="*50)
-        print(tabulate(summary_data, tablefmt="simple"))
-        print("="*50 + "\n")
+        if self.quiet:
+            return
+        
+        rows = "\n".join(
+            SUMMARY_ROW.format(label, value)
+            for label, value in zip(SUMMARY_LABELS, _summary_values({**_SUMMARY_DEFAULTS, **order}))
+        )
+        print(f"\n{DIVIDER}\n📊 ORDER SUMMARY\n{DIVIDER}\n{rows}\n{DIVIDER}\n")
     
     def close_position(self, symbol: str, position_side: str = "BOTH") -> Optional[Dict]:
         """
@@ -142,8 +194,8 @@ class MarketOrderExecutor:
         try:
             symbol = validate_symbol(symbol)
             
-            # Get current position
-            positions = self.client.get_open_positions()
+            # Get current position (only this symbol's rows are fetched)
+            positions = self.client.get_open_positions(symbol)
             position = None
             
             for pos in positions:
@@ -152,27 +204,28 @@ class MarketOrderExecutor:
                     break
             
             if not position:
-                logger.warning(f"No open position found for {symbol} ({position_side})")
+                logger.warning("No open position found for %s (%s)", symbol, position_side)
                 return None
             
             position_amt = float(position['positionAmt'])
             
             if position_amt == 0:
-                logger.info(f"Position already closed for {symbol}")
+                logger.info("Position already closed for %s", symbol)
                 return None
             
             # Determine close side (opposite of position)
             close_side = 'SELL' if position_amt > 0 else 'BUY'
             close_quantity = abs(position_amt)
             
-            logger.info(f"Closing position: {close_quantity} {symbol} (Side: {close_side})")
+            logger.info("Closing position: %s %s (Side: %s)", close_quantity, symbol, close_side)
             
             return self.execute_market_order(
                 symbol=symbol,
                 side=close_side,
                 quantity=close_quantity,
                 reduce_only=True,
-                position_side=position_side
+                position_side=position_side,
+                skip_price_check=True
             )
             
         except Exception as e:
@@ -180,33 +233,162 @@ class MarketOrderExecutor:
             return None
 
 
+class AsyncMarketOrderExecutor:
+    """
+    Submit market orders concurrently over one aiohttp session
+    
+    Concurrency only pays off because AsyncClient's HTTP layer is non-blocking:
+    gathered orders overlap their round trips instead of queueing on one socket.
+    Use as ``async with AsyncMarketOrderExecutor() as executor: ...``
+    """
+    
+    # Params and summaries are built exactly as in the sync executor
+    _MARKET_TMPL = MarketOrderExecutor._MARKET_TMPL
+    _build_market_params = MarketOrderExecutor._build_market_params
+    _display_order_summary = MarketOrderExecutor._display_order_summary
+    
+    def __init__(self, testnet: bool = None, quiet: bool = False):
+        """
+        Initialize async market order executor (connects on first use)
+        
+        Args:
+            testnet: Use testnet if True
+            quiet: Skip printing order summaries if True
+        """
+        self.testnet = resolve_testnet(testnet)
+        self.quiet = quiet
+        self.client: Optional[BinanceFuturesAsyncClient] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+    
+    async def connect(self):
+        """Open the async client session"""
+        if self.client is None:
+            self.client = await BinanceFuturesAsyncClient.create(self.testnet)
+            self._in_flight = asyncio.Semaphore(ASYNC_MAX_IN_FLIGHT)
+            logger.info("Async Market Order Executor initialized")
+    
+    async def close(self):
+        """Close the async client session"""
+        if self.client:
+            await self.client.close()
+            self.client = None
+    
+    async def __aenter__(self) -> 'AsyncMarketOrderExecutor':
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def execute_market_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        reduce_only: bool = False,
+        position_side: str = "BOTH"
+    ) -> Optional[Dict]:
+        """
+        Place a market order without blocking the event loop
+        
+        Args:
+            symbol: Trading pair (e.g., BTCUSDT)
+            side: BUY or SELL
+            quantity: Order quantity
+            reduce_only: If True, order will only reduce position
+            position_side: BOTH, LONG, or SHORT (for hedge mode)
+        
+        Returns:
+            Order response dictionary or None if failed
+        """
+        try:
+            await self.connect()
+            order_params = self._build_market_params(symbol, side, quantity, reduce_only, position_side)
+            
+            async with self._in_flight:
+                order_response = await self.client.create_order(order_params)
+            
+            log_trade(
+                logger,
+                order_type='MARKET',
+                symbol=order_params['symbol'],
+                side=order_params['side'],
+                quantity=order_params['quantity'],
+                order_id=order_response.get('orderId'),
+                status=order_response.get('status'),
+                reduce_only=reduce_only
+            )
+            self._display_order_summary(order_response)
+            
+            return order_response
+            
+        except BinanceAPIException as e:
+            _log_api_error(e)
+            return None
+            
+        except Exception as e:
+            log_error(logger, e, "Async market order execution failed")
+            return None
+    
+    async def submit_many(self, orders: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Place several market orders concurrently
+        
+        At most ASYNC_MAX_IN_FLIGHT requests are open at once, and every
+        order still waits on the shared rate limit buckets.
+        
+        Args:
+            orders: Keyword arguments for execute_market_order, one dict per order
+        
+        Returns:
+            Order responses (None for failures) in input order
+        """
+        await self.connect()
+        return await asyncio.gather(*[self.execute_market_order(**order) for order in orders])
+
+
+USAGE = """
+📖 Usage: python src/core/market_orders.py <SYMBOL> <SIDE> <QUANTITY> [OPTIONS]
+
+Examples:
+  python src/core/market_orders.py BTCUSDT BUY 0.01
+  python src/core/market_orders.py ETHUSDT SELL 0.1
+
+Arguments:
+  SYMBOL    - Trading pair (e.g., BTCUSDT, ETHUSDT)
+  SIDE      - BUY or SELL
+  QUANTITY  - Order quantity (must be > 0)
+
+Options:
+  --reduce-only    - Only reduce existing position
+  --close          - Close existing position
+  --no-summary     - Skip the order summary table
+"""
+
+_parser = build_order_parser(
+    "python src/core/market_orders.py",
+    "Execute market orders on Binance Futures"
+)
+_parser.add_argument('--close', action='store_true', help="Close existing position")
+
+
 def main():
     """CLI entry point for market orders"""
     if len(sys.argv) < 4:
-        print("\n📖 Usage: python src/core/market_orders.py <SYMBOL> <SIDE> <QUANTITY> [OPTIONS]")
-        print("\nExamples:")
-        print("  python src/core/market_orders.py BTCUSDT BUY 0.01")
-        print("  python src/core/market_orders.py ETHUSDT SELL 0.1")
-        print("\nArguments:")
-        print("  SYMBOL    - Trading pair (e.g., BTCUSDT, ETHUSDT)")
-        print("  SIDE      - BUY or SELL")
-        print("  QUANTITY  - Order quantity (must be > 0)")
-        print("\nOptions:")
-        print("  --reduce-only    - Only reduce existing position")
-        print("  --close          - Close existing position")
-        print("\n")
+        print(USAGE)
         sys.exit(1)
     
-    symbol = sys.argv[1]
-    side = sys.argv[2]
-    quantity = float(sys.argv[3])
+    args = _parser.parse_args()
+    symbol = args.symbol
+    side = args.side
+    quantity = args.quantity
     
     # Parse options
-    reduce_only = '--reduce-only' in sys.argv
-    close_position = '--close' in sys.argv
+    reduce_only = args.reduce_only
+    close_position = args.close
     
     try:
-        executor = MarketOrderExecutor()
+        executor = MarketOrderExecutor(quiet=args.no_summary)
         
         if close_position:
             logger.info("Closing position...")
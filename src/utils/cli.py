@@ -0,0 +1,30 @@
+"""
+CLI Helpers Module
+Argument parsing shared by the order command-line entry points
+"""
+
+import argparse
+
+
+def build_order_parser(prog: str, description: str, with_price: bool = False) -> argparse.ArgumentParser:
+    """
+    Build a parser with the arguments common to the order CLIs
+    
+    Args:
+        prog: Program name shown in usage/errors
+        description: One-line description of the CLI
+        with_price: Add a positional PRICE argument if True
+    
+    Returns:
+        ArgumentParser with SYMBOL, SIDE, QUANTITY [, PRICE], --reduce-only
+        and --no-summary; callers add their own options
+    """
+    parser = argparse.ArgumentParser(prog=prog, description=description)
+    parser.add_argument('symbol', help="Trading pair (e.g., BTCUSDT, ETHUSDT)")
+    parser.add_argument('side', help="BUY or SELL")
+    parser.add_argument('quantity', type=float, help="Order quantity (must be > 0)")
+    if with_price:
+        parser.add_argument('price', type=float, help="Limit price")
+    parser.add_argument('--reduce-only', action='store_true', help="Only reduce existing position")
+    parser.add_argument('--no-summary', action='store_true', help="Skip the order summary table")
+    return parser
@@ -3,13 +3,38 @@ Binance Futures API Client Wrapper
 Handles connection, authentication, and common API operations
 """
 
+import asyncio
 import os
-from typing import Dict, Optional, List
-from binance.client import Client
+import hmac
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Callable, Dict, Optional, List, Tuple
+from urllib.parse import quote_plus
+import aiohttp
+from binance.client import Client, AsyncClient
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 from dotenv import load_dotenv
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib JSON decoder
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional: fall back to the default asyncio event loop
+    uvloop = None
 
 from src.utils.logger import setup_logger, log_error
+from src.utils.rate_limit import WEIGHT_BUCKET, throttle_order
+from src.utils.streams import MarkPriceStream
 from src.utils.validators import validate_symbol, validate_leverage
 
 # Load environment variables
@@ -17,58 +42,310 @@ load_dotenv()
 
 logger = setup_logger("BinanceClient")
 
+# Maximum number of orders accepted per batchOrders request
+BATCH_ORDER_LIMIT = 5
+
+# Request weight of each futures REST call by (method, path), charged to
+# WEIGHT_BUCKET before the request is sent; calls not listed weigh 1
+# (e.g. DELETE batchOrders, unlike POST/PUT)
+WEIGHT_TABLE = {
+    ('get', 'account'): 5,
+    ('get', 'balance'): 5,
+    ('get', 'positionRisk'): 5,
+    ('post', 'batchOrders'): 5,
+    ('put', 'batchOrders'): 5,
+    ('get', 'allOrders'): 5,
+    ('get', 'userTrades'): 5,
+    ('get', 'ticker/bookTicker'): 2,
+    ('post', 'countdownCancelAll'): 10,
+}
+
+# Weights for calls that cost more when made without a symbol
+WEIGHT_TABLE_ALL_SYMBOLS = {
+    ('get', 'openOrders'): 40,
+    ('get', 'ticker/price'): 2,
+    ('get', 'ticker/bookTicker'): 5,
+    ('get', 'premiumIndex'): 10,
+}
+
+# String forms Binance uses for a flat position, matched before parsing floats
+ZERO_POSITION_AMOUNTS = frozenset({'0', '0.0', '0.00', '0.000', '0.0000', '0.00000', '0.00000000'})
+_position_amt = itemgetter('positionAmt')
+
+# Maximum number of order IDs accepted per batch cancel request
+BATCH_CANCEL_LIMIT = 10
+
+# Seconds a fetched price is reused before hitting the ticker endpoint again
+PRICE_CACHE_TTL = 1.0
+
+# Seconds an account balance is reused; any order or cancel in between forces a refetch
+BALANCE_CACHE_TTL = 0.75
+
+# Seconds a pushed mark price stays valid for streamed symbols (pushes arrive every 1s)
+STREAMED_PRICE_MAX_AGE = 2.0
+
+# Seconds exchange info (symbol filters) is reused before being fetched again
+SYMBOL_INFO_TTL = 300
+
+# Keep-alive connection pool shared by every executor using this client
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 50
+
+# Seconds before a REST request is abandoned
+HTTP_TIMEOUT = 10
+
+# aiohttp connection pool size, DNS cache lifetime and idle keep-alive
+# (both in seconds) for async clients
+ASYNC_POOL_LIMIT = 64
+ASYNC_DNS_TTL = 300
+ASYNC_KEEPALIVE_TIMEOUT = 75
+
+# Seconds between background refreshes of the server clock offset
+TIME_SYNC_INTERVAL = 300
+
+# Live futures REST hosts compared by probe_fastest_endpoint()
+FUTURES_HOSTS = (
+    'https://fapi.binance.com',
+    'https://fapi1.binance.com',
+    'https://fapi2.binance.com',
+    'https://fapi3.binance.com',
+)
+
+# Seconds before an endpoint probe counts as unreachable
+PROBE_TIMEOUT = 2
+
+# Transient gateway errors retried on read-only (GET) requests; order
+# placement is never retried so a lost response cannot duplicate an order
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.1,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({'GET'}),
+    raise_on_status=False
+)
+
+# Runs deferred warn-only price checks (check_price_soon) off the order path
+_price_check_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="price-check")
+
+
+def _orjson_response_hook(response, *args, **kwargs):
+    """Make response.json() decode the body with orjson"""
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+
+def _ping_latency(host: str) -> float:
+    """Round-trip seconds for one futures ping to host, or inf if it failed"""
+    try:
+        start = time.perf_counter()
+        requests.get(f"{host}/fapi/v1/ping", timeout=PROBE_TIMEOUT).raise_for_status()
+        return time.perf_counter() - start
+    except Exception:
+        return float('inf')
+
+
+def probe_fastest_endpoint() -> Optional[str]:
+    """
+    Ping every live futures host concurrently and return the fastest
+    
+    Returns:
+        Host URL with the lowest ping latency, or None if none answered
+    """
+    with ThreadPoolExecutor(max_workers=len(FUTURES_HOSTS)) as pool:
+        latencies = dict(zip(FUTURES_HOSTS, pool.map(_ping_latency, FUTURES_HOSTS)))
+    
+    host = min(latencies, key=latencies.get)
+    if latencies[host] == float('inf'):
+        logger.warning("Endpoint probe failed for every futures host, keeping the default")
+        return None
+    
+    logger.info(f"Fastest futures endpoint: {host} ({latencies[host] * 1000:.1f}ms)")
+    return host
+
+
+class _OrjsonClientResponse(aiohttp.ClientResponse):
+    """aiohttp response whose json() decodes the body with orjson"""
+    
+    async def json(self, *, loads=None, **kwargs):
+        return await super().json(loads=loads or orjson.loads, **kwargs)
+
+
+def run_async(coro):
+    """
+    Run a coroutine to completion, on uvloop when it is installed
+    
+    Args:
+        coro: Coroutine to run
+    
+    Returns:
+        The coroutine's result
+    """
+    if uvloop and not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
+
+
+def _encode_batch_orders(orders: List[Dict]) -> str:
+    """URL-encode a batchOrders payload as compact JSON in one pass"""
+    if orjson:
+        payload = orjson.dumps(orders).decode('utf-8')
+    else:
+        payload = json.dumps(orders, separators=(',', ':'))
+    return quote_plus(payload)
+
+
+class _CachedHmacMixin:
+    """Keys HMAC-SHA256 once per client and copies it per signature"""
+    
+    def __init__(self, api_key: str, api_secret: str, *args, **kwargs):
+        # Keyed HMAC state; copy() skips re-deriving the inner/outer key pads
+        self._hmac_template = hmac.new(api_secret.encode('utf-8'), digestmod=hashlib.sha256)
+        super().__init__(api_key, api_secret, *args, **kwargs)
+    
+    def _hmac_signature(self, query_string: str) -> str:
+        mac = self._hmac_template.copy()
+        mac.update(query_string.encode('utf-8'))
+        return mac.hexdigest()
+
+
+def _request_weight(method: str, path: str, kwargs: Dict) -> int:
+    """Binance request weight of a futures REST call"""
+    key = (method, path)
+    if 'symbol' not in (kwargs.get('data') or kwargs.get('params') or {}):
+        weight = WEIGHT_TABLE_ALL_SYMBOLS.get(key)
+        if weight:
+            return weight
+    return WEIGHT_TABLE.get(key, 1)
+
+
+class _CachedHmacClient(_CachedHmacMixin, Client):
+    """python-binance Client with a pre-keyed HMAC signer and weight-based pacing"""
+    
+    # Completed non-GET futures requests (orders, cancels, ...); lets callers
+    # detect that account state may have changed since they cached it
+    write_count = 0
+    
+    def _request_futures_api(self, method, path, signed=False, version: int = 1, **kwargs) -> Dict:
+        WEIGHT_BUCKET.consume(_request_weight(method, path, kwargs))
+        try:
+            return super()._request_futures_api(method, path, signed, version, **kwargs)
+        finally:
+            if method != 'get':
+                self.write_count += 1
+
+
+class _CachedHmacAsyncClient(_CachedHmacMixin, AsyncClient):
+    """python-binance AsyncClient with a pre-keyed HMAC signer and weight-based pacing"""
+    
+    async def _request_futures_api(self, method, path, signed=False, version=1, **kwargs) -> Dict:
+        # The bucket blocks, so wait for it off the event loop
+        await asyncio.get_running_loop().run_in_executor(
+            None, WEIGHT_BUCKET.consume, _request_weight(method, path, kwargs)
+        )
+        return await super()._request_futures_api(method, path, signed, version, **kwargs)
+
+
+def _load_credentials(testnet: bool) -> Tuple[str, str]:
+    """
+    Read API credentials for the selected environment from .env
+    
+    Args:
+        testnet: Read testnet credentials if True, live credentials if False
+    
+    Returns:
+        Tuple of (api_key, api_secret)
+    
+    Raises:
+        ValueError: If the credentials are not set
+    """
+    if testnet:
+        api_key = os.getenv('TESTNET_API_KEY')
+        api_secret = os.getenv('TESTNET_API_SECRET')
+        
+        if not api_key or not api_secret:
+            raise ValueError(
+                "Testnet API credentials not found. "
+                "Please set TESTNET_API_KEY and TESTNET_API_SECRET in .env file"
+            )
+    else:
+        api_key = os.getenv('BINANCE_API_KEY')
+        api_secret = os.getenv('BINANCE_API_SECRET')
+        
+        if not api_key or not api_secret:
+            raise ValueError(
+                "Binance API credentials not found. "
+                "Please set BINANCE_API_KEY and BINANCE_API_SECRET in .env file"
+            )
+    
+    return api_key, api_secret
+
 
 class BinanceFuturesClient:
     """Wrapper for Binance Futures API client with error handling"""
     
-    def __init__(self, testnet: bool = True):
+    def __init__(self, testnet: bool = True, base_url: str = None, skip_test: bool = False):
         """
         Initialize Binance Futures client
         
         Args:
             testnet: Use testnet if True, live trading if False
+            base_url: Futures REST host to use instead of the default
+                (e.g., https://fapi1.binance.com)
+            skip_test: Skip the ping + account check at startup (see reverify)
         """
         self.testnet = testnet
+        self.skip_test = skip_test
+        self._connection_verified_at: Optional[float] = None
         self.client = None
+        self._price_cache: Dict[str, Tuple[float, float]] = {}  # symbol -> (price, monotonic ts)
+        self._symbol_cache: Dict[str, Dict] = {}  # symbol -> exchange info entry
+        self._symbol_cache_ts = 0.0
+        self._symbol_cache_lock = threading.Lock()  # One exchange info fetch at a time
+        self._price_stream: Optional[MarkPriceStream] = None
+        self._streamed_symbols = frozenset()
+        self._balance_cache: Optional[Tuple[Dict, float, int]] = None  # (balance, monotonic ts, write_count)
         self._initialize_client()
+        
+        if base_url:
+            self.set_base_url(base_url)
     
     def _initialize_client(self):
         """Initialize Binance client with API credentials"""
         try:
+            api_key, api_secret = _load_credentials(self.testnet)
+            
             if self.testnet:
-                api_key = os.getenv('TESTNET_API_KEY')
-                api_secret = os.getenv('TESTNET_API_SECRET')
                 base_url = 'https://testnet.binancefuture.com'
-                
-                if not api_key or not api_secret:
-                    raise ValueError(
-                        "Testnet API credentials not found. "
-                        "Please set TESTNET_API_KEY and TESTNET_API_SECRET in .env file"
-                    )
-                
                 logger.info("Initializing Binance TESTNET Futures client")
                 logger.warning("⚠️  TESTNET MODE - No real funds will be used")
-                
             else:
-                api_key = os.getenv('BINANCE_API_KEY')
-                api_secret = os.getenv('BINANCE_API_SECRET')
                 base_url = None  # Use default
-                
-                if not api_key or not api_secret:
-                    raise ValueError(
-                        "Binance API credentials not found. "
-                        "Please set BINANCE_API_KEY and BINANCE_API_SECRET in .env file"
-                    )
-                
                 logger.warning("🚨 LIVE TRADING MODE - REAL FUNDS AT RISK 🚨")
             
-            self.client = Client(api_key, api_secret, testnet=self.testnet)
+            self.client = _CachedHmacClient(
+                api_key,
+                api_secret,
+                requests_params={'timeout': HTTP_TIMEOUT},
+                testnet=self.testnet
+            )
             
             if self.testnet and base_url:
                 self.client.API_URL = base_url
             
+            self._configure_session()
+            
+            # Sign requests against the server clock without per-request resyncs
+            self.sync_server_time()
+            self._schedule_time_sync()
+            
             # Test connection
-            self._test_connection()
+            if not self.skip_test:
+                self._test_connection()
+            
+            # Symbols whose prices are pushed into the cache instead of polled
+            stream_symbols = os.getenv('PRICE_STREAM_SYMBOLS', '')
+            if stream_symbols.strip():
+                self.stream_prices(stream_symbols.split(','))
             
             logger.info("✓ Binance Futures client initialized successfully")
             
@@ -76,6 +353,68 @@ class BinanceFuturesClient:
             log_error(logger, e, "Failed to initialize Binance client")
             raise
     
+    def set_base_url(self, base_url: str):
+        """
+        Send futures REST requests to another host and open a connection to it
+        
+        Args:
+            base_url: Host URL without the /fapi path (e.g., https://fapi1.binance.com)
+        """
+        futures_url = base_url.rstrip('/') + '/fapi'
+        if self.testnet:
+            self.client.FUTURES_TESTNET_URL = futures_url
+        else:
+            self.client.FUTURES_URL = futures_url
+        
+        logger.info(f"Using futures endpoint {futures_url}")
+        self.warm_connection()
+    
+    def warm_connection(self):
+        """Ping the futures API so a keep-alive connection is open before the next order"""
+        try:
+            self.client.futures_ping()
+        except Exception as e:
+            logger.debug("Connection warm-up failed: %s", e)
+    
+    def _configure_session(self):
+        """Mount a larger keep-alive connection pool and faster JSON decoding on the HTTP session"""
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=HTTP_RETRY
+        )
+        self.client.session.mount('https://', adapter)
+        logger.debug("HTTP pool configured (maxsize=%s)", HTTP_POOL_MAXSIZE)
+        
+        if orjson:
+            self.client.session.hooks['response'].append(_orjson_response_hook)
+            logger.debug("Decoding REST responses with orjson")
+    
+    def sync_server_time(self):
+        """Measure the local clock offset used to timestamp signed requests"""
+        try:
+            sent = time.time()
+            server_time = self.client.futures_time()['serverTime']
+            received = time.time()
+            
+            # Compare against the midpoint of the round trip, in milliseconds
+            self.client.timestamp_offset = server_time - int((sent + received) * 500)
+            logger.debug("Server time offset: %sms", self.client.timestamp_offset)
+            
+        except Exception as e:
+            log_error(logger, e, "Server time sync failed")
+    
+    def _schedule_time_sync(self):
+        """Refresh the server time offset every TIME_SYNC_INTERVAL seconds"""
+        timer = threading.Timer(TIME_SYNC_INTERVAL, self._refresh_server_time)
+        timer.daemon = True
+        timer.start()
+    
+    def _refresh_server_time(self):
+        """Timer callback: resync, then schedule the next refresh"""
+        self.sync_server_time()
+        self._schedule_time_sync()
+    
     def _test_connection(self):
         """Test API connection and permissions"""
         try:
@@ -86,7 +425,8 @@ class BinanceFuturesClient:
             account = self.client.futures_account()
             
             logger.info(f"Account Balance: {account.get('totalWalletBalance', 'N/A')} USDT")
-            logger.debug(f"Account permissions verified")
+            logger.debug("Account permissions verified")
+            self._connection_verified_at = time.monotonic()
             
         except BinanceAPIException as e:
             logger.error(f"Binance API Error: {e.message} (Code: {e.code})")
@@ -95,10 +435,33 @@ class BinanceFuturesClient:
             log_error(logger, e, "Connection test failed")
             raise
     
+    def reverify(self, max_age: float = 600) -> bool:
+        """
+        Re-run the connection test only if the last success is older than max_age
+        
+        Args:
+            max_age: Seconds a successful connection test stays valid
+        
+        Returns:
+            True if the connection is verified, False if the test failed
+        """
+        verified_at = self._connection_verified_at
+        if verified_at is not None and time.monotonic() - verified_at <= max_age:
+            return True
+        
+        try:
+            self._test_connection()
+            return True
+        except Exception:
+            return False
+
     def get_symbol_info(self, symbol: str) -> Optional[Dict]:
         """
         Get symbol trading info and filters
         
+        Exchange info for every symbol is fetched once and indexed by symbol,
+        then reused for SYMBOL_INFO_TTL seconds.
+        
         Args:
             symbol: Trading pair symbol
         
@@ -107,64 +470,207 @@ class BinanceFuturesClient:
         """
         try:
             symbol = validate_symbol(symbol)
-            exchange_info = self.client.futures_exchange_info()
+            self._refresh_symbol_cache()
             
-            for s in exchange_info['symbols']:
-                if s['symbol'] == symbol:
-                    logger.debug(f"Symbol info retrieved for {symbol}")
-                    return s
-            
-            logger.warning(f"Symbol {symbol} not found")
-            return None
+            info = self._symbol_cache.get(symbol)
+            if info is None:
+                logger.warning(f"Symbol {symbol} not found")
+            return info
             
         except Exception as e:
             log_error(logger, e, f"Failed to get symbol info for {symbol}")
             return None
     
-    def get_current_price(self, symbol: str) -> Optional[float]:
+    def prefetch_symbol_info(self):
+        """Warm the exchange info cache on a background thread"""
+        thread = threading.Thread(
+            target=self._prefetch_symbol_info, name="symbol-info-prefetch", daemon=True
+        )
+        thread.start()
+    
+    def _prefetch_symbol_info(self):
+        """Thread target: refresh the exchange info cache, failures are retried on first use"""
+        try:
+            self._refresh_symbol_cache()
+        except Exception as e:
+            logger.debug("Exchange info prefetch failed: %s", e)
+    
+    def _refresh_symbol_cache(self):
+        """Fetch exchange info if the cache is empty or older than SYMBOL_INFO_TTL"""
+        # Callers arriving during a fetch (e.g. the prefetch) wait for it instead of repeating it
+        with self._symbol_cache_lock:
+            if not self._symbol_cache or time.monotonic() - self._symbol_cache_ts > SYMBOL_INFO_TTL:
+                exchange_info = self.client.futures_exchange_info()
+                self._symbol_cache = {s['symbol']: s for s in exchange_info['symbols']}
+                self._symbol_cache_ts = time.monotonic()
+                logger.debug("Exchange info cached for %s symbols", len(self._symbol_cache))
+    
+    def get_current_price(self, symbol: str, max_age: float = PRICE_CACHE_TTL) -> Optional[float]:
         """
         Get current market price for symbol
         
+        Prices younger than max_age seconds are served from a cache shared by
+        every executor using this client (and kept fresh by price streams).
+        
         Args:
             symbol: Trading pair symbol
+            max_age: Maximum age in seconds of a cached price (0 forces a fetch)
         
         Returns:
             Current price or None
         """
         try:
             symbol = validate_symbol(symbol)
+            
+            # Streamed prices are pushed every second; only max_age=0 bypasses them
+            if max_age and symbol in self._streamed_symbols:
+                max_age = max(max_age, STREAMED_PRICE_MAX_AGE)
+            
+            cached_price = self.get_cached_price(symbol, max_age)
+            if cached_price is not None:
+                return cached_price
+            
             ticker = self.client.futures_symbol_ticker(symbol=symbol)
             price = float(ticker['price'])
+            self.update_price(symbol, price)
             
-            logger.debug(f"Current price for {symbol}: {price}")
+            logger.debug("Current price for %s: %s", symbol, price)
             return price
             
         except Exception as e:
             log_error(logger, e, f"Failed to get price for {symbol}")
             return None
     
+    def get_cached_price(self, symbol: str, max_age: float = PRICE_CACHE_TTL) -> Optional[float]:
+        """
+        Get a cached price without making a request
+        
+        Args:
+            symbol: Trading pair symbol (uppercase)
+            max_age: Maximum age in seconds of the cached price
+        
+        Returns:
+            Cached price, or None if missing or older than max_age
+        """
+        cached = self._price_cache.get(symbol)
+        if cached and time.monotonic() - cached[1] < max_age:
+            return cached[0]
+        return None
+    
+    def check_price_soon(self, symbol: str, check: Callable[[float], None], max_age: float = PRICE_CACHE_TTL):
+        """
+        Run a warn-only check against the current price without delaying the caller
+        
+        A cached price younger than max_age is checked inline; otherwise the
+        fetch and the check run on a background worker thread.
+        
+        Args:
+            symbol: Trading pair symbol (uppercase)
+            check: Called with the current price
+            max_age: Maximum age in seconds of a cached price
+        """
+        current_price = self.get_cached_price(symbol, max_age)
+        if current_price:
+            check(current_price)
+        else:
+            _price_check_pool.submit(self._fetch_and_check_price, symbol, check, max_age)
+    
+    def _fetch_and_check_price(self, symbol: str, check: Callable[[float], None], max_age: float):
+        """Fetch the current price and run check on it (worker thread)"""
+        current_price = self.get_current_price(symbol, max_age=max_age)
+        if current_price:
+            check(current_price)
+    
+    def update_price(self, symbol: str, price: float):
+        """
+        Store a price in the shared cache
+        
+        Args:
+            symbol: Trading pair symbol (uppercase)
+            price: Latest price
+        """
+        self._price_cache[symbol] = (price, time.monotonic())
+    
+    def stream_prices(self, symbols: List[str]) -> bool:
+        """
+        Keep the price cache fed by mark price pushes for these symbols
+        
+        While subscribed, get_current_price serves these symbols from the cache
+        for up to STREAMED_PRICE_MAX_AGE seconds instead of polling the ticker.
+        Symbols already streamed stay subscribed.
+        
+        Args:
+            symbols: Trading pairs to subscribe to
+        
+        Returns:
+            True if the stream is running
+        """
+        try:
+            symbols = {validate_symbol(symbol) for symbol in symbols}
+        except Exception as e:
+            log_error(logger, e, "Invalid price stream symbols")
+            return False
+        
+        if self._price_stream:
+            if symbols <= self._streamed_symbols:
+                return True
+            symbols |= self._streamed_symbols
+            self.stop_price_stream()
+        
+        stream = MarkPriceStream(self, sorted(symbols))
+        if not stream.start():
+            return False
+        
+        self._price_stream = stream
+        self._streamed_symbols = frozenset(symbols)
+        return True
+    
+    def stop_price_stream(self):
+        """Stop pushing mark prices into the cache"""
+        if self._price_stream:
+            self._price_stream.stop()
+            self._price_stream = None
+            self._streamed_symbols = frozenset()
+    
     def get_account_balance(self) -> Optional[Dict]:
         """
         Get futures account balance
         
+        A balance fetched less than BALANCE_CACHE_TTL seconds ago is reused,
+        unless an order or cancel request has completed since.
+        
         Returns:
             Account balance information or None
         """
         try:
+            write_count = self.client.write_count
+            cached = self._balance_cache
+            if (
+                cached
+                and cached[2] == write_count
+                and time.monotonic() - cached[1] < BALANCE_CACHE_TTL
+            ):
+                return cached[0]
+            
             account = self.client.futures_account()
             balance_info = {
                 'totalWalletBalance': float(account['totalWalletBalance']),
                 'availableBalance': float(account['availableBalance']),
                 'totalUnrealizedProfit': float(account['totalUnrealizedProfit']),
             }
+            self._balance_cache = (balance_info, time.monotonic(), write_count)
             
-            logger.debug(f"Account balance: {balance_info}")
+            logger.debug("Account balance: %s", balance_info)
             return balance_info
             
         except Exception as e:
             log_error(logger, e, "Failed to get account balance")
             return None
     
+    def invalidate_balance(self):
+        """Drop the cached balance so the next get_account_balance call fetches"""
+        self._balance_cache = None
+    
     def set_leverage(self, symbol: str, leverage: int) -> bool:
         """
         Set leverage for a symbol
@@ -186,7 +692,7 @@ class BinanceFuturesClient:
             )
             
             logger.info(f"Leverage set to {leverage}x for {symbol}")
-            logger.debug(f"Leverage response: {result}")
+            logger.debug("Leverage response: %s", result)
             return True
             
         except BinanceAPIException as e:
@@ -196,29 +702,81 @@ class BinanceFuturesClient:
             log_error(logger, e, f"Failed to set leverage for {symbol}")
             return False
     
-    def get_open_positions(self) -> List[Dict]:
+    def get_open_positions(self, symbol: str = None) -> List[Dict]:
         """
         Get all open positions
         
+        Args:
+            symbol: Filter by symbol on the server side (optional)
+        
         Returns:
             List of open positions
         """
         try:
-            positions = self.client.futures_position_information()
+            if symbol:
+                positions = self.client.futures_position_information(
+                    symbol=validate_symbol(symbol)
+                )
+            else:
+                positions = self.client.futures_position_information()
             
-            # Filter only positions with non-zero quantity
+            # Filter only positions with non-zero quantity; the common flat
+            # rows are rejected by string lookup without a float() parse
             open_positions = [
-                pos for pos in positions 
-                if float(pos.get('positionAmt', 0)) != 0
+                pos for pos in positions
+                if _position_amt(pos) not in ZERO_POSITION_AMOUNTS
+                and float(_position_amt(pos)) != 0
             ]
             
-            logger.debug(f"Found {len(open_positions)} open positions")
+            logger.debug("Found %s open positions", len(open_positions))
             return open_positions
             
         except Exception as e:
             log_error(logger, e, "Failed to get open positions")
             return []
     
+    def place_batch_orders(self, orders: List[Dict]) -> List[Dict]:
+        """
+        Place several orders through the batchOrders endpoint
+        
+        Orders are sent in chunks of BATCH_ORDER_LIMIT, one signed request per chunk.
+        A rejected order comes back as {'code': ..., 'msg': ...} at its original index.
+        
+        Args:
+            orders: List of order parameter dictionaries
+        
+        Returns:
+            List of order responses, one per input order
+        """
+        results = []
+        
+        for i in range(0, len(orders), BATCH_ORDER_LIMIT):
+            # batchOrders only accepts string values
+            chunk = [
+                {key: str(value) for key, value in order.items()}
+                for order in orders[i:i + BATCH_ORDER_LIMIT]
+            ]
+            
+            try:
+                throttle_order(len(chunk))
+                # Encoded here directly rather than via futures_place_batch_order,
+                # which urlencodes the dict repr and then patches the quotes
+                responses = self.client._request_futures_api(
+                    'post', 'batchOrders', True,
+                    data={'batchOrders': _encode_batch_orders(chunk)}
+                )
+                logger.debug("Batch order response: %s", responses)
+                results.extend(responses)
+                
+            except BinanceAPIException as e:
+                logger.error(f"Batch order request failed: {e.message} (Code: {e.code})")
+                results.extend({'code': e.code, 'msg': e.message} for _ in chunk)
+            except Exception as e:
+                log_error(logger, e, "Batch order request failed")
+                results.extend({'code': None, 'msg': str(e)} for _ in chunk)
+        
+        return results
+    
     def get_open_orders(self, symbol: str = None) -> List[Dict]:
         """
         Get all open orders
@@ -236,7 +794,7 @@ class BinanceFuturesClient:
             
             orders = self.client.futures_get_open_orders(**params)
             
-            logger.debug(f"Found {len(orders)} open orders")
+            logger.debug("Found %s open orders", len(orders))
             return orders
             
         except Exception as e:
@@ -263,7 +821,7 @@ class BinanceFuturesClient:
             )
             
             logger.info(f"Order {order_id} cancelled for {symbol}")
-            logger.debug(f"Cancel response: {result}")
+            logger.debug("Cancel response: %s", result)
             return True
             
         except BinanceAPIException as e:
@@ -273,6 +831,50 @@ class BinanceFuturesClient:
             log_error(logger, e, f"Failed to cancel order {order_id}")
             return False
     
+    def cancel_orders(self, symbol: str, order_ids: List[int]) -> bool:
+        """
+        Cancel several open orders of one symbol through the batch cancel endpoint
+        
+        Order IDs are sent in chunks of BATCH_CANCEL_LIMIT, one signed request per chunk.
+        
+        Args:
+            symbol: Trading pair symbol
+            order_ids: Order IDs to cancel
+        
+        Returns:
+            True if every order was cancelled, False otherwise
+        """
+        try:
+            symbol = validate_symbol(symbol)
+            success = True
+            
+            for i in range(0, len(order_ids), BATCH_CANCEL_LIMIT):
+                chunk = order_ids[i:i + BATCH_CANCEL_LIMIT]
+                results = self.client.futures_cancel_orders(
+                    symbol=symbol,
+                    orderIdList='[' + ','.join(str(order_id) for order_id in chunk) + ']'
+                )
+                logger.debug("Batch cancel response: %s", results)
+                
+                for order_id, result in zip(chunk, results):
+                    if 'code' in result:
+                        logger.error(
+                            f"Failed to cancel order {order_id}: "
+                            f"{result.get('msg')} (Code: {result.get('code')})"
+                        )
+                        success = False
+                    else:
+                        logger.info(f"Order {order_id} cancelled for {symbol}")
+            
+            return success
+            
+        except BinanceAPIException as e:
+            logger.error(f"Failed to cancel orders: {e.message} (Code: {e.code})")
+            return False
+        except Exception as e:
+            log_error(logger, e, f"Failed to cancel orders for {symbol}")
+            return False
+    
     def cancel_all_orders(self, symbol: str) -> bool:
         """
         Cancel all open orders for a symbol
@@ -289,7 +891,7 @@ class BinanceFuturesClient:
             result = self.client.futures_cancel_all_open_orders(symbol=symbol)
             
             logger.info(f"All orders cancelled for {symbol}")
-            logger.debug(f"Cancel all response: {result}")
+            logger.debug("Cancel all response: %s", result)
             return True
             
         except BinanceAPIException as e:
@@ -300,25 +902,261 @@ class BinanceFuturesClient:
             return False
 
 
-# Singleton instance
-_client_instance = None
+class BinanceFuturesAsyncClient:
+    """Async wrapper for Binance Futures API built on python-binance AsyncClient"""
+    
+    def __init__(self, testnet: bool = True):
+        """
+        Use BinanceFuturesAsyncClient.create() to obtain a connected instance
+        
+        Args:
+            testnet: Use testnet if True, live trading if False
+        """
+        self.testnet = testnet
+        self.client: Optional[AsyncClient] = None
+        self._symbol_cache: Dict[str, Dict] = {}  # symbol -> exchange info entry
+        self._symbol_cache_ts = 0.0
+    
+    @classmethod
+    async def create(cls, testnet: bool = True) -> 'BinanceFuturesAsyncClient':
+        """
+        Create and connect an async client
+        
+        Args:
+            testnet: Use testnet if True, live trading if False
+        
+        Returns:
+            Connected BinanceFuturesAsyncClient instance
+        """
+        instance = cls(testnet=testnet)
+        
+        try:
+            api_key, api_secret = _load_credentials(testnet)
+            session_params = {
+                'connector': aiohttp.TCPConnector(
+                    limit=ASYNC_POOL_LIMIT,
+                    ttl_dns_cache=ASYNC_DNS_TTL,
+                    keepalive_timeout=ASYNC_KEEPALIVE_TIMEOUT,
+                    enable_cleanup_closed=True
+                )
+            }
+            if orjson:
+                session_params['response_class'] = _OrjsonClientResponse
+            
+            instance.client = await _CachedHmacAsyncClient.create(
+                api_key, api_secret, testnet=testnet,
+                session_params=session_params
+            )
+            logger.info("✓ Binance Futures async client initialized")
+            return instance
+        
+        except Exception as e:
+            log_error(logger, e, "Failed to initialize Binance async client")
+            raise
+    
+    async def test_connection(self):
+        """Check connectivity and API key permissions with concurrent requests"""
+        try:
+            _, account = await asyncio.gather(
+                self.client.futures_ping(),
+                self.client.futures_account()
+            )
+            logger.info(f"Account Balance: {account.get('totalWalletBalance', 'N/A')} USDT")
+            
+        except BinanceAPIException as e:
+            logger.error(f"Binance API Error: {e.message} (Code: {e.code})")
+            raise
+        except Exception as e:
+            log_error(logger, e, "Connection test failed")
+            raise
+    
+    async def get_symbol_info(self, symbol: str) -> Optional[Dict]:
+        """
+        Get symbol trading info and filters (exchange info cached for SYMBOL_INFO_TTL)
+        
+        Args:
+            symbol: Trading pair symbol
+        
+        Returns:
+            Symbol information dictionary or None
+        """
+        try:
+            symbol = validate_symbol(symbol)
+            
+            if not self._symbol_cache or time.monotonic() - self._symbol_cache_ts > SYMBOL_INFO_TTL:
+                exchange_info = await self.client.futures_exchange_info()
+                self._symbol_cache = {s['symbol']: s for s in exchange_info['symbols']}
+                self._symbol_cache_ts = time.monotonic()
+            
+            info = self._symbol_cache.get(symbol)
+            if info is None:
+                logger.warning(f"Symbol {symbol} not found")
+            return info
+            
+        except Exception as e:
+            log_error(logger, e, f"Failed to get symbol info for {symbol}")
+            return None
+    
+    async def get_current_price(self, symbol: str) -> Optional[float]:
+        """
+        Get current market price for symbol
+        
+        Args:
+            symbol: Trading pair symbol
+        
+        Returns:
+            Current price or None
+        """
+        try:
+            symbol = validate_symbol(symbol)
+            ticker = await self.client.futures_symbol_ticker(symbol=symbol)
+            return float(ticker['price'])
+            
+        except Exception as e:
+            log_error(logger, e, f"Failed to get price for {symbol}")
+            return None
+    
+    async def get_account_balance(self) -> Optional[Dict]:
+        """
+        Get futures account balance
+        
+        Returns:
+            Account balance information or None
+        """
+        try:
+            account = await self.client.futures_account()
+            return {
+                'totalWalletBalance': float(account['totalWalletBalance']),
+                'availableBalance': float(account['availableBalance']),
+                'totalUnrealizedProfit': float(account['totalUnrealizedProfit']),
+            }
+            
+        except Exception as e:
+            log_error(logger, e, "Failed to get account balance")
+            return None
+    
+    async def gather_status(self, symbol: str) -> Dict:
+        """
+        Fetch price, symbol info and account balance concurrently
+        
+        The three requests overlap, so this takes one round trip instead of three.
+        
+        Args:
+            symbol: Trading pair symbol
+        
+        Returns:
+            Dictionary with 'price', 'symbol_info' and 'balance' (None where a request failed)
+        """
+        price, symbol_info, balance = await asyncio.gather(
+            self.get_current_price(symbol),
+            self.get_symbol_info(symbol),
+            self.get_account_balance()
+        )
+        return {'price': price, 'symbol_info': symbol_info, 'balance': balance}
+    
+    async def get_open_orders(self, symbol: str = None) -> Optional[List[Dict]]:
+        """
+        Get all open orders
+        
+        Args:
+            symbol: Filter by symbol (optional)
+        
+        Returns:
+            List of open orders, or None if the request failed
+        """
+        try:
+            params = {}
+            if symbol:
+                params['symbol'] = validate_symbol(symbol)
+            
+            orders = await self.client.futures_get_open_orders(**params)
+            
+            logger.debug("Found %s open orders", len(orders))
+            return orders
+        
+        except Exception as e:
+            log_error(logger, e, "Failed to get open orders")
+            return None
+    
+    async def create_order(self, order_params: Dict) -> Dict:
+        """
+        Place one order, waiting on the shared rate limit buckets first
+        
+        Args:
+            order_params: Order parameters for futures_create_order
+        
+        Returns:
+            Order response dictionary
+        
+        Raises:
+            BinanceAPIException: If Binance rejects the order
+        """
+        # The order bucket blocks, so wait for it off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, throttle_order)
+        return await self.client.futures_create_order(**order_params)
+    
+    async def close(self):
+        """Close the underlying HTTP session"""
+        if self.client:
+            await self.client.close_connection()
+            self.client = None
 
-def get_client(testnet: bool = None) -> BinanceFuturesClient:
+
+def resolve_testnet(testnet: bool = None) -> bool:
+    """Return testnet, reading USE_TESTNET from env if it is None"""
+    if testnet is None:
+        return os.getenv('USE_TESTNET', 'True').lower() == 'true'
+    return testnet
+
+
+# Shared instances, one per network (testnet / live)
+_client_instances: Dict[bool, BinanceFuturesClient] = {}
+_client_lock = threading.Lock()
+
+def get_client(
+    testnet: bool = None,
+    base_url: str = None,
+    probe: bool = None,
+    skip_test: bool = None
+) -> BinanceFuturesClient:
     """
-    Get Binance Futures client instance (singleton)
+    Get Binance Futures client instance (one shared instance per network)
+    
+    Every executor asking for the same network gets the same client, and so
+    the same requests session and connection pool.
     
     Args:
         testnet: Use testnet if True, live if False, or read from env if None
+        base_url: Futures REST host for this network; also repoints an existing client
+        probe: Pin a new live client to the fastest host in FUTURES_HOSTS,
+            or read PROBE_ENDPOINTS from env if None; ignored on testnet
+            or when base_url is given
+        skip_test: Create a new client without the startup connection test,
+            or read SKIP_CONNECTION_TEST from env if None
     
     Returns:
         BinanceFuturesClient instance
     """
-    global _client_instance
+    testnet = resolve_testnet(testnet)
     
-    if testnet is None:
-        testnet = os.getenv('USE_TESTNET', 'True').lower() == 'true'
+    client = _client_instances.get(testnet)
+    if client is None:
+        with _client_lock:
+            client = _client_instances.get(testnet)
+            if client is None:
+                if skip_test is None:
+                    skip_test = os.getenv('SKIP_CONNECTION_TEST', 'False').lower() == 'true'
+                
+                client = _client_instances[testnet] = BinanceFuturesClient(testnet=testnet, skip_test=skip_test)
+                
+                if probe is None:
+                    probe = os.getenv('PROBE_ENDPOINTS', 'False').lower() == 'true'
+                
+                # Later executors share this client, so the probe runs once
+                if probe and not testnet and not base_url:
+                    base_url = probe_fastest_endpoint()
     
-    if _client_instance is None:
-        _client_instance = BinanceFuturesClient(testnet=testnet)
+    if base_url:
+        client.set_base_url(base_url)
     
-    return _client_instance
+    return client
@@ -1,13 +1,19 @@
 """
 Logging utility for the Binance Futures Trading Bot
 Provides structured logging with timestamps, levels, and file rotation
+Log I/O runs on a background thread so trading code only enqueues records
 """
 
+import atexit
 import logging
 import os
+import queue
+import traceback
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from typing import Optional
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from colorama import Fore, Style, init
 
 # Initialize colorama
@@ -24,38 +30,69 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': Fore.RED + Style.BRIGHT,
     }
     
+    # Level names with their color codes, built once
+    COLORED_LEVELS = {
+        level: f"{color}{level}{Style.RESET_ALL}" for level, color in COLORS.items()
+    }
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_second = None
+        self._last_time = None
+    
     def format(self, record):
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{Style.RESET_ALL}"
-        return super().format(record)
+        record.levelname = self.COLORED_LEVELS.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+    
+    def formatTime(self, record, datefmt=None):
+        # The default format includes milliseconds and cannot be reused
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        
+        # An explicit datefmt has one-second resolution, so bursts reuse one strftime
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_time = super().formatTime(record, datefmt)
+            self._last_second = second
+        return self._last_time
 
 
-def setup_logger(name: str = "BinanceBot", log_level: str = "INFO") -> logging.Logger:
+# Numeric levels accepted by setup_logger's log_level
+_LEVEL_MAP = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
+
+# Directory holding the rotating log file, resolved and created once at import
+_LOG_DIR = Path(__file__).resolve().parent.parent.parent / "logs"
+_LOG_DIR.mkdir(exist_ok=True)
+
+# Queue feeding the shared file/console handlers on a background thread
+_log_queue: Optional[queue.Queue] = None
+
+
+def _get_log_queue() -> queue.Queue:
     """
-    Setup and configure logger with file and console handlers
-    
-    Args:
-        name: Logger name
-        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    Create the shared handlers once and serve them from a QueueListener thread
     
     Returns:
-        Configured logger instance
+        Queue that QueueHandlers should enqueue records on
     """
-    # Create logs directory if it doesn't exist
-    log_dir = Path(__file__).parent.parent.parent / "logs"
-    log_dir.mkdir(exist_ok=True)
+    global _log_queue
     
-    # Create logger
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, log_level.upper()))
-    
-    # Prevent duplicate handlers
-    if logger.handlers:
-        return logger
+    if _log_queue is not None:
+        return _log_queue
     
     # File handler with rotation (10MB max, keep 5 backups)
-    log_file = log_dir / "bot.log"
+    log_file = _LOG_DIR / "bot.log"
     file_handler = RotatingFileHandler(
         log_file,
         maxBytes=10*1024*1024,  # 10MB
@@ -69,22 +106,62 @@ def setup_logger(name: str = "BinanceBot", log_level: str = "INFO") -> logging.L
     )
     file_handler.setFormatter(file_formatter)
     
-    # Console handler with colors
+    # Console handler with colors (records are already filtered by logger level)
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level.upper()))
     console_formatter = ColoredFormatter(
         '%(asctime)s - %(levelname)s - %(message)s',
         datefmt='%H:%M:%S'
     )
     console_handler.setFormatter(console_formatter)
     
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    _log_queue = queue.Queue(-1)
+    listener = QueueListener(
+        _log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    
+    # Flush queued records before the interpreter exits
+    atexit.register(listener.stop)
+    
+    return _log_queue
+
+
+@lru_cache(maxsize=None)
+def setup_logger(name: str = "BinanceBot", log_level: str = "INFO") -> logging.Logger:
+    """
+    Setup and configure logger with file and console handlers
+    
+    Records are handed to a QueueHandler, which still merges the message
+    arguments on the calling thread; the handler formatters (timestamps,
+    colors) and file/console I/O run on a background QueueListener thread
+    shared by all loggers.
+    Repeat calls with the same arguments return the configured logger directly.
+    
+    Args:
+        name: Logger name
+        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    
+    Returns:
+        Configured logger instance
+    """
+    # Create logger
+    logger = logging.getLogger(name)
+    logger.setLevel(_LEVEL_MAP[log_level.upper()])
+    
+    # Prevent duplicate handlers
+    if logger.handlers:
+        return logger
+    
+    logger.addHandler(QueueHandler(_get_log_queue()))
     
     return logger
 
 
+# Trade log lines; optional fields are appended pre-joined as the last argument
+_TRADE_FORMAT = "TRADE EXECUTED - TYPE: %s | SYMBOL: %s | SIDE: %s | QUANTITY: %s%s"
+_TRADE_FORMAT_PRICED = "TRADE EXECUTED - TYPE: %s | SYMBOL: %s | SIDE: %s | QUANTITY: %s | PRICE: %s%s"
+
+
 def log_trade(logger: logging.Logger, order_type: str, symbol: str, side: str, 
               quantity: float, price: float = None, **kwargs):
     """
@@ -99,20 +176,15 @@ def log_trade(logger: logging.Logger, order_type: str, symbol: str, side: str,
         price: Order price (optional for market orders)
         **kwargs: Additional order parameters
     """
-    trade_info = {
-        'type': order_type,
-        'symbol': symbol,
-        'side': side,
-        'quantity': quantity,
-    }
-    
-    if price:
-        trade_info['price'] = price
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
-    trade_info.update(kwargs)
+    extra = "".join(f" | {key.upper()}: {value}" for key, value in kwargs.items())
     
-    log_msg = " | ".join([f"{k.upper()}: {v}" for k, v in trade_info.items()])
-    logger.info(f"TRADE EXECUTED - {log_msg}")
+    if price:
+        logger.info(_TRADE_FORMAT_PRICED, order_type, symbol, side, quantity, price, extra)
+    else:
+        logger.info(_TRADE_FORMAT, order_type, symbol, side, quantity, extra)
 
 
 def log_error(logger: logging.Logger, error: Exception, context: str = ""):
@@ -124,11 +196,14 @@ def log_error(logger: logging.Logger, error: Exception, context: str = ""):
         error: Exception object
         context: Additional context about where error occurred
     """
-    import traceback
-    
-    error_msg = f"{context + ' - ' if context else ''}{type(error).__name__}: {str(error)}"
-    logger.error(error_msg)
-    logger.debug(f"Traceback:\n{traceback.format_exc()}")
+    if context:
+        logger.error("%s - %s: %s", context, type(error).__name__, error)
+    else:
+        logger.error("%s: %s", type(error).__name__, error)
+    
+    # Only walk and format the stack when the traceback will actually be logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Traceback:\n%s", traceback.format_exc())
 
 
 # Create default logger instance
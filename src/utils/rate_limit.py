@@ -0,0 +1,70 @@
+"""
+Rate Limit Module
+Client-side token buckets that keep order submissions under Binance limits
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket; consume() blocks until enough tokens refill"""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Tokens refilled per second
+            capacity: Maximum tokens held (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill_ts = time.monotonic()
+        self.lock = threading.Lock()
+
+    def consume(self, tokens: int = 1):
+        """
+        Take tokens from the bucket, sleeping until they are available
+
+        Args:
+            tokens: Number of tokens to take
+
+        Raises:
+            ValueError: If more tokens are requested than the bucket can hold
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot consume {tokens} tokens from a bucket of {self.capacity}")
+
+        with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill_ts) * self.rate)
+                self.last_refill_ts = now
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+
+                # Holding the lock while sleeping keeps waiters in arrival order
+                time.sleep((tokens - self.tokens) / self.rate)
+
+
+# Binance Futures allows 10 orders per second per account
+ORDER_BUCKET = TokenBucket(rate=10, capacity=10)
+
+# Request weight budget: 1200 per minute per IP
+WEIGHT_BUCKET = TokenBucket(rate=20, capacity=1200)
+
+
+def throttle_order(orders: int = 1):
+    """
+    Block until an order request fits the order budget
+
+    Request weight is charged separately by the client for every REST call.
+
+    Args:
+        orders: Number of orders in the request
+    """
+    ORDER_BUCKET.consume(orders)
@@ -0,0 +1,153 @@
+"""
+WebSocket Streams Module
+Push-based order and price updates from Binance Futures websockets
+"""
+
+import queue
+from typing import Dict, List, Optional
+from binance import ThreadedWebsocketManager
+
+from src.utils.logger import setup_logger, log_error
+
+logger = setup_logger("Streams")
+
+
+class _WebsocketStream:
+    """Base class owning a ThreadedWebsocketManager for one subscription"""
+
+    name = "Websocket stream"
+
+    def __init__(self, client):
+        """
+        Initialize websocket stream
+
+        Args:
+            client: BinanceFuturesClient whose credentials open the stream
+        """
+        self.client = client
+        self._manager: Optional[ThreadedWebsocketManager] = None
+
+    def start(self) -> bool:
+        """
+        Start the websocket manager and subscribe
+
+        Returns:
+            True if the stream was started, False otherwise
+        """
+        try:
+            self._manager = ThreadedWebsocketManager(
+                api_key=self.client.client.API_KEY,
+                api_secret=self.client.client.API_SECRET,
+                testnet=self.client.testnet
+            )
+            self._manager.start()
+            self._subscribe(self._manager)
+
+            logger.info(f"✓ {self.name} started")
+            return True
+
+        except Exception as e:
+            log_error(logger, e, f"Failed to start {self.name.lower()}")
+            self.stop()
+            return False
+
+    def _subscribe(self, manager: ThreadedWebsocketManager):
+        """Open the socket(s) for this stream"""
+        raise NotImplementedError
+
+    def stop(self):
+        """Close the websocket manager"""
+        if self._manager:
+            try:
+                self._manager.stop()
+            except Exception as e:
+                log_error(logger, e, f"Failed to stop {self.name.lower()}")
+            self._manager = None
+            logger.info(f"{self.name} stopped")
+
+
+class UserDataStream(_WebsocketStream):
+    """Futures user-data stream that queues ORDER_TRADE_UPDATE events"""
+
+    name = "User-data stream"
+
+    def __init__(self, client):
+        """
+        Initialize user-data stream
+
+        Args:
+            client: BinanceFuturesClient whose credentials open the stream
+        """
+        super().__init__(client)
+        self.order_updates = queue.Queue()
+
+    def _subscribe(self, manager: ThreadedWebsocketManager):
+        """Open the user socket (listen key is created and kept alive by python-binance)"""
+        manager.start_futures_user_socket(callback=self._handle_message)
+
+    def _handle_message(self, msg: Dict):
+        """Queue order updates pushed by Binance"""
+        event_type = msg.get('e')
+
+        if event_type == 'error':
+            logger.error(f"User-data stream error: {msg.get('m')}")
+        elif event_type == 'ORDER_TRADE_UPDATE':
+            self.order_updates.put(msg['o'])
+
+    def get_order_updates(self, timeout: float) -> List[Dict]:
+        """
+        Wait for order updates and drain everything queued
+
+        Args:
+            timeout: Seconds to wait for the first update
+
+        Returns:
+            List of order payloads ('s' symbol, 'i' order ID, 'X' status, ...)
+        """
+        updates = []
+
+        try:
+            updates.append(self.order_updates.get(timeout=timeout))
+        except queue.Empty:
+            return updates
+
+        while True:
+            try:
+                updates.append(self.order_updates.get_nowait())
+            except queue.Empty:
+                return updates
+
+
+class MarkPriceStream(_WebsocketStream):
+    """Keeps the client's shared price cache fresh from 1s mark price pushes"""
+
+    name = "Mark price stream"
+
+    def __init__(self, client, symbols: List[str]):
+        """
+        Initialize mark price stream
+
+        Args:
+            client: BinanceFuturesClient whose price cache is updated
+            symbols: Trading pairs to subscribe to
+        """
+        super().__init__(client)
+        self.symbols = symbols
+
+    def _subscribe(self, manager: ThreadedWebsocketManager):
+        """Open one <symbol>@markPrice@1s socket per symbol"""
+        for symbol in self.symbols:
+            manager.start_symbol_mark_price_socket(
+                callback=self._handle_message,
+                symbol=symbol
+            )
+
+    def _handle_message(self, msg: Dict):
+        """Store the pushed mark price"""
+        if msg.get('e') == 'error':
+            logger.error(f"Mark price stream error: {msg.get('m')}")
+            return
+
+        data = msg.get('data', msg)
+        if 's' in data and 'p' in data:
+            self.client.update_price(data['s'], float(data['p']))
@@ -4,8 +4,28 @@ Validates symbols, quantities, prices, and other trading parameters
 """
 
 import re
-from typing import Tuple, Optional
-from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Tuple
+
+
+VALID_SIDES = frozenset({'BUY', 'SELL'})
+
+VALID_TIME_IN_FORCE = frozenset({'GTC', 'IOC', 'FOK', 'GTX'})
+
+VALID_ORDER_TYPES = frozenset({
+    'MARKET', 'LIMIT', 'STOP', 'STOP_MARKET', 'TAKE_PROFIT',
+    'TAKE_PROFIT_MARKET', 'TRAILING_STOP_MARKET'
+})
+
+# Upper bounds guarding against accidental huge orders
+MAX_QUANTITY = 1000000
+MAX_PRICE = 10000000
+
+# Narrowest grid range accepted, as a fraction of the lower price (0.5%)
+MIN_PRICE_RANGE_FRAC = 0.005
+
+# USDT-M futures pair: alphanumeric base of 2+ characters followed by USDT
+_SYMBOL_RE = re.compile(r'[A-Z0-9]{2,}USDT')
 
 
 class ValidationError(Exception):
@@ -13,10 +33,13 @@ class ValidationError(Exception):
     pass
 
 
+@lru_cache(maxsize=256)
 def validate_symbol(symbol: str) -> str:
     """
     Validate trading symbol format
     
+    Results are memoized per input string (invalid symbols are not cached).
+    
     Args:
         symbol: Trading pair symbol (e.g., BTCUSDT)
     
@@ -31,22 +54,23 @@ def validate_symbol(symbol: str) -> str:
     
     symbol = symbol.upper().strip()
     
+    if _SYMBOL_RE.fullmatch(symbol):
+        return symbol
+    
     # Check if symbol ends with USDT (for USDT-M futures)
     if not symbol.endswith('USDT'):
         raise ValidationError(f"Invalid symbol: {symbol}. Must be a USDT-M futures pair (e.g., BTCUSDT)")
     
-    # Check if base currency is valid (alphanumeric)
-    base = symbol[:-4]  # Remove USDT
-    if not base.isalnum() or len(base) < 2:
-        raise ValidationError(f"Invalid base currency in symbol: {symbol}")
-    
-    return symbol
+    raise ValidationError(f"Invalid base currency in symbol: {symbol}")
 
 
+@lru_cache(maxsize=16)
 def validate_side(side: str) -> str:
     """
     Validate order side (BUY/SELL)
     
+    Results are memoized per input string (invalid sides are not cached).
+    
     Args:
         side: Order side
     
@@ -61,7 +85,7 @@ def validate_side(side: str) -> str:
     
     side = side.upper().strip()
     
-    if side not in ['BUY', 'SELL']:
+    if side not in VALID_SIDES:
         raise ValidationError(f"Invalid side: {side}. Must be BUY or SELL")
     
     return side
@@ -86,14 +110,12 @@ def validate_quantity(quantity: float, symbol: str = None) -> float:
     except (ValueError, TypeError):
         raise ValidationError(f"Invalid quantity: {quantity}. Must be a number")
     
-    if quantity <= 0:
-        raise ValidationError(f"Invalid quantity: {quantity}. Must be greater than 0")
+    if 0 < quantity <= MAX_QUANTITY:
+        return quantity
     
-    # Check for reasonable maximum (prevent accidental huge orders)
-    if quantity > 1000000:
+    if quantity > MAX_QUANTITY:
         raise ValidationError(f"Quantity too large: {quantity}. Maximum is 1,000,000")
-    
-    return quantity
+    raise ValidationError(f"Invalid quantity: {quantity}. Must be greater than 0")
 
 
 def validate_price(price: float, symbol: str = None) -> float:
@@ -115,14 +137,12 @@ def validate_price(price: float, symbol: str = None) -> float:
     except (ValueError, TypeError):
         raise ValidationError(f"Invalid price: {price}. Must be a number")
     
-    if price <= 0:
-        raise ValidationError(f"Invalid price: {price}. Must be greater than 0")
+    if 0 < price <= MAX_PRICE:
+        return price
     
-    # Check for reasonable maximum
-    if price > 10000000:
+    if price > MAX_PRICE:
         raise ValidationError(f"Price too large: {price}. Maximum is 10,000,000")
-    
-    return price
+    raise ValidationError(f"Invalid price: {price}. Must be greater than 0")
 
 
 def validate_percentage(percentage: float, min_val: float = 0, max_val: float = 100) -> float:
@@ -145,12 +165,12 @@ def validate_percentage(percentage: float, min_val: float = 0, max_val: float =
     except (ValueError, TypeError):
         raise ValidationError(f"Invalid percentage: {percentage}. Must be a number")
     
-    if not (min_val <= percentage <= max_val):
-        raise ValidationError(
-            f"Invalid percentage: {percentage}. Must be between {min_val} and {max_val}"
-        )
+    if min_val <= percentage <= max_val:
+        return percentage
     
-    return percentage
+    raise ValidationError(
+        f"Invalid percentage: {percentage}. Must be between {min_val} and {max_val}"
+    )
 
 
 def validate_leverage(leverage: int) -> int:
@@ -171,16 +191,19 @@ def validate_leverage(leverage: int) -> int:
     except (ValueError, TypeError):
         raise ValidationError(f"Invalid leverage: {leverage}. Must be an integer")
     
-    if not (1 <= leverage <= 125):
-        raise ValidationError(f"Invalid leverage: {leverage}. Must be between 1 and 125")
+    if 1 <= leverage <= 125:
+        return leverage
     
-    return leverage
+    raise ValidationError(f"Invalid leverage: {leverage}. Must be between 1 and 125")
 
 
+@lru_cache(maxsize=32)
 def validate_time_in_force(time_in_force: str) -> str:
     """
     Validate time in force parameter
     
+    Results are memoized per input string (invalid values are not cached).
+    
     Args:
         time_in_force: Time in force value
     
@@ -190,22 +213,23 @@ def validate_time_in_force(time_in_force: str) -> str:
     Raises:
         ValidationError: If time in force is invalid
     """
-    valid_values = ['GTC', 'IOC', 'FOK', 'GTX']
-    
     time_in_force = time_in_force.upper().strip()
     
-    if time_in_force not in valid_values:
-        raise ValidationError(
-            f"Invalid timeInForce: {time_in_force}. Must be one of {valid_values}"
-        )
+    if time_in_force in VALID_TIME_IN_FORCE:
+        return time_in_force
     
-    return time_in_force
+    raise ValidationError(
+        f"Invalid timeInForce: {time_in_force}. Must be one of {sorted(VALID_TIME_IN_FORCE)}"
+    )
 
 
+@lru_cache(maxsize=32)
 def validate_order_type(order_type: str) -> str:
     """
     Validate order type
     
+    Results are memoized per input string (invalid types are not cached).
+    
     Args:
         order_type: Order type
     
@@ -215,17 +239,14 @@ def validate_order_type(order_type: str) -> str:
     Raises:
         ValidationError: If order type is invalid
     """
-    valid_types = ['MARKET', 'LIMIT', 'STOP', 'STOP_MARKET', 'TAKE_PROFIT', 
-                   'TAKE_PROFIT_MARKET', 'TRAILING_STOP_MARKET']
-    
     order_type = order_type.upper().strip()
     
-    if order_type not in valid_types:
-        raise ValidationError(
-            f"Invalid order type: {order_type}. Must be one of {valid_types}"
-        )
+    if order_type in VALID_ORDER_TYPES:
+        return order_type
     
-    return order_type
+    raise ValidationError(
+        f"Invalid order type: {order_type}. Must be one of {sorted(VALID_ORDER_TYPES)}"
+    )
 
 
 def validate_positive_integer(value: int, name: str = "value") -> int:
@@ -247,10 +268,10 @@ def validate_positive_integer(value: int, name: str = "value") -> int:
     except (ValueError, TypeError):
         raise ValidationError(f"Invalid {name}: {value}. Must be an integer")
     
-    if value <= 0:
-        raise ValidationError(f"Invalid {name}: {value}. Must be greater than 0")
+    if value > 0:
+        return value
     
-    return value
+    raise ValidationError(f"Invalid {name}: {value}. Must be greater than 0")
 
 
 def validate_price_range(lower_price: float, upper_price: float, current_price: float = None) -> Tuple[float, float]:
@@ -276,9 +297,10 @@ def validate_price_range(lower_price: float, upper_price: float, current_price:
             f"Invalid price range: lower_price ({lower_price}) must be less than upper_price ({upper_price})"
         )
     
-    # Check if range is reasonable (at least 1% difference)
-    price_diff_pct = ((upper_price - lower_price) / lower_price) * 100
-    if price_diff_pct < 0.5:
+    # Check if range is reasonable (at least 0.5% difference); the percentage
+    # is only computed for the error message
+    if upper_price < lower_price * (1 + MIN_PRICE_RANGE_FRAC):
+        price_diff_pct = (upper_price - lower_price) / lower_price * 100
         raise ValidationError(
             f"Price range too narrow: {price_diff_pct:.2f}%. Minimum recommended range is 0.5%"
         )